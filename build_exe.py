@@ -1,387 +1,387 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Script para gerar executável do LinguaMaster Pro
-Usa PyInstaller para criar arquivo .exe standalone
-"""
-
-import os
-import sys
-import shutil
-import subprocess
-from pathlib import Path
-
-def check_dependencies():
-    """Verifica se as dependências estão instaladas"""
-    try:
-        import PyInstaller
-        print("✅ PyInstaller encontrado")
-    except ImportError:
-        print("❌ PyInstaller não encontrado. Instalando...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✅ PyInstaller instalado com sucesso")
-
-def clean_build_dirs():
-    """Limpa diretórios de build anteriores"""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"🧹 Removido diretório: {dir_name}")
-    
-    # Remover arquivos .spec anteriores
-    for spec_file in Path('.').glob('*.spec'):
-        spec_file.unlink()
-        print(f"🧹 Removido arquivo: {spec_file}")
-
-def create_pyinstaller_spec():
-    """Cria arquivo .spec personalizado para PyInstaller"""
-    spec_content = '''
-# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['main.py'],
-    pathex=[],
-    binaries=[],
-    datas=[
-        ('data', 'data'),
-        ('assets', 'assets'),
-        ('src', 'src'),
-        ('config.json', '.'),
-    ],
-    hiddenimports=[
-        'customtkinter',
-        'PIL',
-        'PIL._tkinter_finder',
-        'requests',
-        'sqlite3',
-        'threading',
-        'json',
-        'hashlib',
-        'datetime',
-        'random',
-        'time',
-        're',
-        'urllib.parse',
-        'pathlib'
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='LinguaMaster_Pro',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='assets/icon.ico' if os.path.exists('assets/icon.ico') else None,
-    version='version_info.txt' if os.path.exists('version_info.txt') else None,
-)
-'''
-    
-    with open('linguamaster.spec', 'w', encoding='utf-8') as f:
-        f.write(spec_content.strip())
-    
-    print("✅ Arquivo .spec criado")
-
-def create_version_info():
-    """Cria arquivo de informações de versão"""
-    version_info = '''
-# UTF-8
-#
-# For more details about fixed file info 'ffi' see:
-# http://msdn.microsoft.com/en-us/library/ms646997.aspx
-VSVersionInfo(
-  ffi=FixedFileInfo(
-    filevers=(1,0,0,0),
-    prodvers=(1,0,0,0),
-    mask=0x3f,
-    flags=0x0,
-    OS=0x40004,
-    fileType=0x1,
-    subtype=0x0,
-    date=(0, 0)
-    ),
-  kids=[
-    StringFileInfo(
-      [
-      StringTable(
-        u'040904B0',
-        [StringStruct(u'CompanyName', u'Kilo Code'),
-        StringStruct(u'FileDescription', u'LinguaMaster Pro - Sistema de Aprendizado de Idiomas'),
-        StringStruct(u'FileVersion', u'1.0.0.0'),
-        StringStruct(u'InternalName', u'LinguaMaster Pro'),
-        StringStruct(u'LegalCopyright', u'© 2024 Kilo Code. Todos os direitos reservados.'),
-        StringStruct(u'OriginalFilename', u'LinguaMaster_Pro.exe'),
-        StringStruct(u'ProductName', u'LinguaMaster Pro'),
-        StringStruct(u'ProductVersion', u'1.0.0.0')])
-      ]), 
-    VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
-  ]
-)
-'''
-    
-    with open('version_info.txt', 'w', encoding='utf-8') as f:
-        f.write(version_info.strip())
-    
-    print("✅ Arquivo de versão criado")
-
-def create_assets_dir():
-    """Cria diretório de assets se não existir"""
-    assets_dir = Path('assets')
-    assets_dir.mkdir(exist_ok=True)
-    
-    # Criar arquivo de ícone placeholder se não existir
-    icon_file = assets_dir / 'icon.ico'
-    if not icon_file.exists():
-        print("ℹ️  Ícone não encontrado. Usando ícone padrão do sistema.")
-
-def build_executable():
-    """Constrói o executável usando PyInstaller"""
-    print("🔨 Iniciando build do executável...")
-    
-    try:
-        # Executar PyInstaller
-        cmd = [
-            sys.executable, '-m', 'PyInstaller',
-            '--clean',
-            '--noconfirm',
-            'linguamaster.spec'
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Build concluído com sucesso!")
-            
-            # Verificar se o executável foi criado
-            exe_path = Path('dist/LinguaMaster_Pro.exe')
-            if exe_path.exists():
-                size_mb = exe_path.stat().st_size / (1024 * 1024)
-                print(f"📦 Executável criado: {exe_path}")
-                print(f"📏 Tamanho: {size_mb:.1f} MB")
-                return True
-            else:
-                print("❌ Executável não encontrado após build")
-                return False
-        else:
-            print("❌ Erro durante o build:")
-            print(result.stderr)
-            return False
-            
-    except Exception as e:
-        print(f"❌ Erro ao executar PyInstaller: {e}")
-        return False
-
-def create_installer_script():
-    """Cria script de instalação simples"""
-    installer_content = '''
-@echo off
-echo ========================================
-echo   LinguaMaster Pro - Instalador
-echo ========================================
-echo.
-
-echo Copiando arquivos...
-if not exist "%USERPROFILE%\\LinguaMaster" mkdir "%USERPROFILE%\\LinguaMaster"
-copy "LinguaMaster_Pro.exe" "%USERPROFILE%\\LinguaMaster\\" >nul
-
-echo Criando atalho na área de trabalho...
-powershell "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%USERPROFILE%\\Desktop\\LinguaMaster Pro.lnk'); $Shortcut.TargetPath = '%USERPROFILE%\\LinguaMaster\\LinguaMaster_Pro.exe'; $Shortcut.Save()"
-
-echo.
-echo ✅ Instalação concluída!
-echo.
-echo O LinguaMaster Pro foi instalado em:
-echo %USERPROFILE%\\LinguaMaster\\
-echo.
-echo Um atalho foi criado na sua área de trabalho.
-echo.
-pause
-'''
-    
-    installer_path = Path('dist/instalar.bat')
-    with open(installer_path, 'w', encoding='utf-8') as f:
-        f.write(installer_content.strip())
-    
-    print("✅ Script de instalação criado: dist/instalar.bat")
-
-def create_readme():
-    """Cria arquivo README para distribuição"""
-    readme_content = '''
-# LinguaMaster Pro v1.0.0
-
-## 🎯 Sobre o LinguaMaster Pro
-
-O LinguaMaster Pro é um sistema completo de aprendizado de idiomas gamificado, desenvolvido em Python com interface moderna usando CustomTkinter.
-
-## 🌟 Características Principais
-
-- **4 Idiomas Suportados**: Português, Inglês, Espanhol e Alemão
-- **Sistema Gamificado**: XP, níveis, streaks e conquistas
-- **Tradutor Inteligente**: Com cache offline e múltiplas APIs
-- **Jogos Educativos**: Quiz, flashcards, associação e mais
-- **Lições Estruturadas**: Conteúdo organizado por nível
-- **Interface Moderna**: Design inspirado no Duolingo
-- **Totalmente Offline**: Funciona sem conexão com internet (após instalação)
-
-## 🚀 Como Usar
-
-### Instalação Automática
-1. Execute o arquivo `instalar.bat`
-2. Siga as instruções na tela
-3. Use o atalho criado na área de trabalho
-
-### Instalação Manual
-1. Copie `LinguaMaster_Pro.exe` para uma pasta de sua escolha
-2. Execute o arquivo para iniciar o programa
-
-## 🎮 Funcionalidades
-
-### Dashboard
-- Visão geral do progresso
-- Estatísticas de aprendizado
-- Desafios diários
-- Atividades recentes
-
-### Tradutor
-- Tradução entre 4 idiomas
-- Histórico de traduções
-- Detecção automática de idioma
-- Cache offline para traduções frequentes
-
-### Jogos
-- **Quiz Rápido**: Teste seus conhecimentos
-- **Flashcards**: Memorização de vocabulário
-- **Associação**: Conecte palavras e traduções
-- **Completar Frases**: Preencha lacunas
-
-### Lições
-- Conteúdo estruturado por nível
-- Progresso salvo automaticamente
-- Vocabulário organizado por categoria
-
-### Perfil
-- Estatísticas detalhadas
-- Sistema de conquistas
-- Configurações personalizáveis
-- Exportação de dados
-
-## 🔧 Requisitos do Sistema
-
-- Windows 10 ou superior
-- 100 MB de espaço livre em disco
-- Conexão com internet (apenas para traduções online)
-
-## 📝 Notas da Versão 1.0.0
-
-### Funcionalidades Implementadas
-- ✅ Sistema de autenticação completo
-- ✅ Dashboard interativo
-- ✅ Tradutor com múltiplas APIs
-- ✅ Quiz funcional com pontuação
-- ✅ Sistema de progresso e XP
-- ✅ Interface moderna e responsiva
-
-### Funcionalidades em Desenvolvimento
-- 🚧 Flashcards interativos
-- 🚧 Jogos de associação
-- 🚧 Sistema de áudio/pronúncia
-- 🚧 Lições com conteúdo expandido
-- 🚧 Batalhas multiplayer
-
-## 🐛 Problemas Conhecidos
-
-- Algumas funcionalidades de jogos ainda estão em desenvolvimento
-- O sistema de áudio será implementado em versões futuras
-- Lições avançadas serão adicionadas gradualmente
-
-## 📞 Suporte
-
-Para suporte técnico ou sugestões:
-- Email: suporte@linguamaster.com
-- GitHub: github.com/linguamaster-pro
-
-## 📄 Licença
-
-© 2024 Kilo Code. Todos os direitos reservados.
-
----
-
-**Desenvolvido com ❤️ por Kilo Code**
-'''
-    
-    readme_path = Path('dist/README.txt')
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content.strip())
-    
-    print("✅ README criado: dist/README.txt")
-
-def main():
-    """Função principal do script de build"""
-    print("🚀 LinguaMaster Pro - Build Script")
-    print("=" * 50)
-    
-    # Verificar dependências
-    check_dependencies()
-    
-    # Limpar builds anteriores
-    clean_build_dirs()
-    
-    # Criar arquivos necessários
-    create_assets_dir()
-    create_version_info()
-    create_pyinstaller_spec()
-    
-    # Construir executável
-    if build_executable():
-        # Criar arquivos de distribuição
-        create_installer_script()
-        create_readme()
-        
-        print("\n" + "=" * 50)
-        print("🎉 BUILD CONCLUÍDO COM SUCESSO!")
-        print("=" * 50)
-        print("\n📦 Arquivos gerados:")
-        print("   - dist/LinguaMaster_Pro.exe (Executável principal)")
-        print("   - dist/instalar.bat (Script de instalação)")
-        print("   - dist/README.txt (Documentação)")
-        print("\n🚀 Para distribuir:")
-        print("   1. Comprima a pasta 'dist' em um arquivo ZIP")
-        print("   2. Distribua o arquivo ZIP")
-        print("   3. Usuários devem extrair e executar 'instalar.bat'")
-        print("\n✨ O LinguaMaster Pro está pronto para uso!")
-        
-    else:
-        print("\n❌ BUILD FALHOU!")
-        print("Verifique os erros acima e tente novamente.")
-        sys.exit(1)
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script para gerar executável do LinguaMaster Pro
+Usa PyInstaller para criar arquivo .exe standalone
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+from pathlib import Path
+
+def check_dependencies():
+    """Verifica se as dependências estão instaladas"""
+    try:
+        import PyInstaller
+        print("✅ PyInstaller encontrado")
+    except ImportError:
+        print("❌ PyInstaller não encontrado. Instalando...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        print("✅ PyInstaller instalado com sucesso")
+
+def clean_build_dirs():
+    """Limpa diretórios de build anteriores"""
+    dirs_to_clean = ['build', 'dist', '__pycache__']
+    
+    for dir_name in dirs_to_clean:
+        if os.path.exists(dir_name):
+            shutil.rmtree(dir_name)
+            print(f"🧹 Removido diretório: {dir_name}")
+    
+    # Remover arquivos .spec anteriores
+    for spec_file in Path('.').glob('*.spec'):
+        spec_file.unlink()
+        print(f"🧹 Removido arquivo: {spec_file}")
+
+def create_pyinstaller_spec():
+    """Cria arquivo .spec personalizado para PyInstaller"""
+    spec_content = '''
+# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[
+        ('data', 'data'),
+        ('assets', 'assets'),
+        ('src', 'src'),
+        ('config.json', '.'),
+    ],
+    hiddenimports=[
+        'customtkinter',
+        'PIL',
+        'PIL._tkinter_finder',
+        'requests',
+        'sqlite3',
+        'threading',
+        'json',
+        'hashlib',
+        'datetime',
+        'random',
+        'time',
+        're',
+        'urllib.parse',
+        'pathlib'
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='LinguaMaster_Pro',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon='assets/icon.ico' if os.path.exists('assets/icon.ico') else None,
+    version='version_info.txt' if os.path.exists('version_info.txt') else None,
+)
+'''
+    
+    with open('linguamaster.spec', 'w', encoding='utf-8') as f:
+        f.write(spec_content.strip())
+    
+    print("✅ Arquivo .spec criado")
+
+def create_version_info():
+    """Cria arquivo de informações de versão"""
+    version_info = '''
+# UTF-8
+#
+# For more details about fixed file info 'ffi' see:
+# http://msdn.microsoft.com/en-us/library/ms646997.aspx
+VSVersionInfo(
+  ffi=FixedFileInfo(
+    filevers=(1,0,0,0),
+    prodvers=(1,0,0,0),
+    mask=0x3f,
+    flags=0x0,
+    OS=0x40004,
+    fileType=0x1,
+    subtype=0x0,
+    date=(0, 0)
+    ),
+  kids=[
+    StringFileInfo(
+      [
+      StringTable(
+        u'040904B0',
+        [StringStruct(u'CompanyName', u'Kilo Code'),
+        StringStruct(u'FileDescription', u'LinguaMaster Pro - Sistema de Aprendizado de Idiomas'),
+        StringStruct(u'FileVersion', u'1.0.0.0'),
+        StringStruct(u'InternalName', u'LinguaMaster Pro'),
+        StringStruct(u'LegalCopyright', u'© 2024 Kilo Code. Todos os direitos reservados.'),
+        StringStruct(u'OriginalFilename', u'LinguaMaster_Pro.exe'),
+        StringStruct(u'ProductName', u'LinguaMaster Pro'),
+        StringStruct(u'ProductVersion', u'1.0.0.0')])
+      ]), 
+    VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
+  ]
+)
+'''
+    
+    with open('version_info.txt', 'w', encoding='utf-8') as f:
+        f.write(version_info.strip())
+    
+    print("✅ Arquivo de versão criado")
+
+def create_assets_dir():
+    """Cria diretório de assets se não existir"""
+    assets_dir = Path('assets')
+    assets_dir.mkdir(exist_ok=True)
+    
+    # Criar arquivo de ícone placeholder se não existir
+    icon_file = assets_dir / 'icon.ico'
+    if not icon_file.exists():
+        print("ℹ️  Ícone não encontrado. Usando ícone padrão do sistema.")
+
+def build_executable():
+    """Constrói o executável usando PyInstaller"""
+    print("🔨 Iniciando build do executável...")
+    
+    try:
+        # Executar PyInstaller
+        cmd = [
+            sys.executable, '-m', 'PyInstaller',
+            '--clean',
+            '--noconfirm',
+            'linguamaster.spec'
+        ]
+        
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print("✅ Build concluído com sucesso!")
+            
+            # Verificar se o executável foi criado
+            exe_path = Path('dist/LinguaMaster_Pro.exe')
+            if exe_path.exists():
+                size_mb = exe_path.stat().st_size / (1024 * 1024)
+                print(f"📦 Executável criado: {exe_path}")
+                print(f"📏 Tamanho: {size_mb:.1f} MB")
+                return True
+            else:
+                print("❌ Executável não encontrado após build")
+                return False
+        else:
+            print("❌ Erro durante o build:")
+            print(result.stderr)
+            return False
+            
+    except Exception as e:
+        print(f"❌ Erro ao executar PyInstaller: {e}")
+        return False
+
+def create_installer_script():
+    """Cria script de instalação simples"""
+    installer_content = '''
+@echo off
+echo ========================================
+echo   LinguaMaster Pro - Instalador
+echo ========================================
+echo.
+
+echo Copiando arquivos...
+if not exist "%USERPROFILE%\\LinguaMaster" mkdir "%USERPROFILE%\\LinguaMaster"
+copy "LinguaMaster_Pro.exe" "%USERPROFILE%\\LinguaMaster\\" >nul
+
+echo Criando atalho na área de trabalho...
+powershell "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%USERPROFILE%\\Desktop\\LinguaMaster Pro.lnk'); $Shortcut.TargetPath = '%USERPROFILE%\\LinguaMaster\\LinguaMaster_Pro.exe'; $Shortcut.Save()"
+
+echo.
+echo ✅ Instalação concluída!
+echo.
+echo O LinguaMaster Pro foi instalado em:
+echo %USERPROFILE%\\LinguaMaster\\
+echo.
+echo Um atalho foi criado na sua área de trabalho.
+echo.
+pause
+'''
+    
+    installer_path = Path('dist/instalar.bat')
+    with open(installer_path, 'w', encoding='utf-8') as f:
+        f.write(installer_content.strip())
+    
+    print("✅ Script de instalação criado: dist/instalar.bat")
+
+def create_readme():
+    """Cria arquivo README para distribuição"""
+    readme_content = '''
+# LinguaMaster Pro v1.0.0
+
+## 🎯 Sobre o LinguaMaster Pro
+
+O LinguaMaster Pro é um sistema completo de aprendizado de idiomas gamificado, desenvolvido em Python com interface moderna usando CustomTkinter.
+
+## 🌟 Características Principais
+
+- **4 Idiomas Suportados**: Português, Inglês, Espanhol e Alemão
+- **Sistema Gamificado**: XP, níveis, streaks e conquistas
+- **Tradutor Inteligente**: Com cache offline e múltiplas APIs
+- **Jogos Educativos**: Quiz, flashcards, associação e mais
+- **Lições Estruturadas**: Conteúdo organizado por nível
+- **Interface Moderna**: Design inspirado no Duolingo
+- **Totalmente Offline**: Funciona sem conexão com internet (após instalação)
+
+## 🚀 Como Usar
+
+### Instalação Automática
+1. Execute o arquivo `instalar.bat`
+2. Siga as instruções na tela
+3. Use o atalho criado na área de trabalho
+
+### Instalação Manual
+1. Copie `LinguaMaster_Pro.exe` para uma pasta de sua escolha
+2. Execute o arquivo para iniciar o programa
+
+## 🎮 Funcionalidades
+
+### Dashboard
+- Visão geral do progresso
+- Estatísticas de aprendizado
+- Desafios diários
+- Atividades recentes
+
+### Tradutor
+- Tradução entre 4 idiomas
+- Histórico de traduções
+- Detecção automática de idioma
+- Cache offline para traduções frequentes
+
+### Jogos
+- **Quiz Rápido**: Teste seus conhecimentos
+- **Flashcards**: Memorização de vocabulário
+- **Associação**: Conecte palavras e traduções
+- **Completar Frases**: Preencha lacunas
+
+### Lições
+- Conteúdo estruturado por nível
+- Progresso salvo automaticamente
+- Vocabulário organizado por categoria
+
+### Perfil
+- Estatísticas detalhadas
+- Sistema de conquistas
+- Configurações personalizáveis
+- Exportação de dados
+
+## 🔧 Requisitos do Sistema
+
+- Windows 10 ou superior
+- 100 MB de espaço livre em disco
+- Conexão com internet (apenas para traduções online)
+
+## 📝 Notas da Versão 1.0.0
+
+### Funcionalidades Implementadas
+- ✅ Sistema de autenticação completo
+- ✅ Dashboard interativo
+- ✅ Tradutor com múltiplas APIs
+- ✅ Quiz funcional com pontuação
+- ✅ Sistema de progresso e XP
+- ✅ Interface moderna e responsiva
+
+### Funcionalidades em Desenvolvimento
+- 🚧 Flashcards interativos
+- 🚧 Jogos de associação
+- 🚧 Sistema de áudio/pronúncia
+- 🚧 Lições com conteúdo expandido
+- 🚧 Batalhas multiplayer
+
+## 🐛 Problemas Conhecidos
+
+- Algumas funcionalidades de jogos ainda estão em desenvolvimento
+- O sistema de áudio será implementado em versões futuras
+- Lições avançadas serão adicionadas gradualmente
+
+## 📞 Suporte
+
+Para suporte técnico ou sugestões:
+- Email: suporte@linguamaster.com
+- GitHub: github.com/linguamaster-pro
+
+## 📄 Licença
+
+© 2024 Kilo Code. Todos os direitos reservados.
+
+---
+
+**Desenvolvido com ❤️ por Kilo Code**
+'''
+    
+    readme_path = Path('dist/README.txt')
+    with open(readme_path, 'w', encoding='utf-8') as f:
+        f.write(readme_content.strip())
+    
+    print("✅ README criado: dist/README.txt")
+
+def main():
+    """Função principal do script de build"""
+    print("🚀 LinguaMaster Pro - Build Script")
+    print("=" * 50)
+    
+    # Verificar dependências
+    check_dependencies()
+    
+    # Limpar builds anteriores
+    clean_build_dirs()
+    
+    # Criar arquivos necessários
+    create_assets_dir()
+    create_version_info()
+    create_pyinstaller_spec()
+    
+    # Construir executável
+    if build_executable():
+        # Criar arquivos de distribuição
+        create_installer_script()
+        create_readme()
+        
+        print("\n" + "=" * 50)
+        print("🎉 BUILD CONCLUÍDO COM SUCESSO!")
+        print("=" * 50)
+        print("\n📦 Arquivos gerados:")
+        print("   - dist/LinguaMaster_Pro.exe (Executável principal)")
+        print("   - dist/instalar.bat (Script de instalação)")
+        print("   - dist/README.txt (Documentação)")
+        print("\n🚀 Para distribuir:")
+        print("   1. Comprima a pasta 'dist' em um arquivo ZIP")
+        print("   2. Distribua o arquivo ZIP")
+        print("   3. Usuários devem extrair e executar 'instalar.bat'")
+        print("\n✨ O LinguaMaster Pro está pronto para uso!")
+        
+    else:
+        print("\n❌ BUILD FALHOU!")
+        print("Verifique os erros acima e tente novamente.")
+        sys.exit(1)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
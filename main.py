@@ -1,103 +1,222 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-LinguaMaster Pro - Sistema de Aprendizado de Idiomas Gamificado
-Desenvolvido com Python + Tkinter + CustomTkinter
-
-Autor: Kilo Code
-Versão: 1.0.0
-"""
-
-import sys
-import os
-import tkinter as tk
-from pathlib import Path
-
-# Adicionar o diretório src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-try:
-    import customtkinter as ctk
-    from src.core.database import DatabaseManager
-    from src.ui.main_window import MainWindow
-    from src.utils.logger import Logger
-    from src.utils.config import Config
-except ImportError as e:
-    print(f"Erro ao importar dependências: {e}")
-    print("Execute: pip install -r requirements.txt")
-    sys.exit(1)
-
-class LinguaMasterApp:
-    """Classe principal da aplicação LinguaMaster Pro"""
-    
-    def __init__(self):
-        self.logger = Logger()
-        self.config = Config()
-        self.db_manager = None
-        self.main_window = None
-        
-    def initialize_database(self):
-        """Inicializa o banco de dados"""
-        try:
-            self.db_manager = DatabaseManager()
-            self.db_manager.initialize_database()
-            self.logger.info("Banco de dados inicializado com sucesso")
-            return True
-        except Exception as e:
-            self.logger.error(f"Erro ao inicializar banco de dados: {e}")
-            return False
-    
-    def setup_theme(self):
-        """Configura o tema da aplicação"""
-        ctk.set_appearance_mode("light")  # "light" ou "dark"
-        ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
-        
-    def run(self):
-        """Executa a aplicação principal"""
-        try:
-            self.logger.info("Iniciando LinguaMaster Pro...")
-            
-            # Configurar tema
-            self.setup_theme()
-            
-            # Inicializar banco de dados
-            if not self.initialize_database():
-                return False
-            
-            # Criar janela principal
-            self.main_window = MainWindow(self.db_manager, self.config, self.logger)
-            
-            # Iniciar loop principal
-            self.main_window.run()
-            
-            self.logger.info("LinguaMaster Pro encerrado com sucesso")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Erro crítico na aplicação: {e}")
-            return False
-    
-    def cleanup(self):
-        """Limpa recursos antes de encerrar"""
-        if self.db_manager:
-            self.db_manager.close()
-        self.logger.info("Recursos limpos com sucesso")
-
-def main():
-    """Função principal"""
-    app = LinguaMasterApp()
-    
-    try:
-        success = app.run()
-        if not success:
-            sys.exit(1)
-    except KeyboardInterrupt:
-        print("\nEncerrando aplicação...")
-    except Exception as e:
-        print(f"Erro fatal: {e}")
-        sys.exit(1)
-    finally:
-        app.cleanup()
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinguaMaster Pro - Sistema de Aprendizado de Idiomas Gamificado
+Desenvolvido com Python + Tkinter + CustomTkinter
+
+Autor: Kilo Code
+Versão: 1.0.0
+"""
+
+import sys
+import os
+import threading
+import tkinter as tk
+from pathlib import Path
+
+# Adicionar o diretório src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+try:
+    import customtkinter as ctk
+    from src.core.backup import BackupScheduler, list_backups, restore_backup
+    from src.core.database import DatabaseManager
+    from src.core.maintenance import MaintenanceDaemon
+    from src.core.sql_trace import SqlTrace
+    from src.ui.main_window import MainWindow
+    from src.utils.logger import Logger
+    from src.utils.config import Config
+except ImportError as e:
+    print(f"Erro ao importar dependências: {e}")
+    print("Execute: pip install -r requirements.txt")
+    sys.exit(1)
+
+class LinguaMasterApp:
+    """Classe principal da aplicação LinguaMaster Pro"""
+    
+    def __init__(self):
+        self.logger = Logger()
+        self.config = Config()
+        self.db_manager = None
+        self.main_window = None
+        self.backup_scheduler = None
+        self.maintenance = None
+        self.db_path = Path(self.config.get('database.name', 'linguamaster.db'))
+        self.backup_dir = Path(__file__).parent / self.config.get('database.backup_dir', 'backups')
+        
+    def initialize_database(self):
+        """Inicializa o banco de dados"""
+        try:
+            sql_trace = None
+            if self.config.get('database.trace_sql', False):
+                sql_trace = SqlTrace(self.config.get('database.slow_query_ms', 100), self.logger)
+            
+            self.db_manager = DatabaseManager(
+                str(self.db_path),
+                pool_size=self.config.get('database.pool_size', 4),
+                flush_interval=self.config.get('database.flush_interval_ms', 20) / 1000,
+                sql_trace=sql_trace,
+                cache_size=self.config.get('database.query_cache_size', 256)
+            )
+            self.db_manager.initialize_database()
+            self.logger.info("Banco de dados inicializado com sucesso")
+            
+            # Carregar pacotes de vocabulário novos ou alterados
+            imported = self.db_manager.import_vocabulary_directory(
+                Path(__file__).parent / "data" / "vocabulary"
+            )
+            for pack, word_count in imported.items():
+                if word_count:
+                    self.logger.info(f"Vocabulário importado de {pack}: {word_count} palavras")
+                elif word_count is None:
+                    self.logger.warning(f"Falha ao importar vocabulário de {pack}")
+            
+            # Fecha a semana das ligas caso ela tenha terminado com o app fechado
+            if not self.db_manager.rollover_leagues():
+                self.logger.warning("Falha ao virar a semana das ligas")
+            if not self.db_manager.reset_broken_streaks():
+                self.logger.warning("Falha ao zerar streaks quebrados")
+            
+            # Limpeza do histórico antigo (opcional) sem atrasar a abertura da janela
+            if self.config.get('database.retention_days', 0) > 0:
+                threading.Thread(target=self.apply_retention, daemon=True).start()
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao inicializar banco de dados: {e}")
+            return False
+    
+    def apply_retention(self):
+        """Remove do banco o histórico detalhado mais antigo que o configurado"""
+        archive_dir = self.config.get('database.archive_dir', 'archive')
+        removed = self.db_manager.apply_retention(
+            self.config.get('database.retention_days', 0),
+            self.config.get('database.retention_batch_size', 500),
+            Path(__file__).parent / archive_dir if archive_dir else None
+        )
+        for table, count in removed.items():
+            if count:
+                self.logger.info(f"Retenção: {count} linhas antigas removidas de {table}")
+    
+    def start_backups(self):
+        """Inicia os backups periódicos em segundo plano, se habilitados"""
+        if not self.config.get('database.auto_backup', True):
+            return
+        
+        self.backup_scheduler = BackupScheduler(
+            self.db_path,
+            self.backup_dir,
+            interval=self.config.get('database.backup_interval', 3600),
+            generations=self.config.get('database.backup_generations', 5),
+            logger=self.logger
+        )
+        self.backup_scheduler.start()
+    
+    def start_maintenance(self):
+        """Inicia a manutenção do banco nos momentos ociosos"""
+        self.maintenance = MaintenanceDaemon(
+            self.db_manager,
+            interval=self.config.get('database.maintenance_interval', 1800),
+            analyze_interval_days=self.config.get('database.analyze_interval_days', 7),
+            vacuum_pages=self.config.get('database.vacuum_pages', 1000),
+            is_busy=lambda: self.main_window is not None and self.main_window.is_user_busy(),
+            logger=self.logger
+        )
+        self.maintenance.start()
+    
+    def restore_backup(self, backup_path=None) -> bool:
+        """Restaura o banco a partir de um backup (o mais recente por padrão)"""
+        try:
+            if backup_path is None:
+                backups = list_backups(self.backup_dir, self.db_path.stem)
+                if not backups:
+                    self.logger.error(f"Nenhum backup encontrado em {self.backup_dir}")
+                    return False
+                backup_path = backups[0]
+            
+            # Nenhuma conexão pode ficar aberta durante a restauração
+            if self.maintenance:
+                self.maintenance.stop()
+            if self.backup_scheduler:
+                self.backup_scheduler.stop()
+            if self.db_manager:
+                self.db_manager.flush(timeout=10)
+                self.db_manager.close()
+            
+            restore_backup(Path(backup_path), self.db_path)
+            self.logger.info(f"Banco restaurado a partir de {backup_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao restaurar backup: {e}")
+            return False
+    
+    def setup_theme(self):
+        """Configura o tema da aplicação"""
+        ctk.set_appearance_mode("light")  # "light" ou "dark"
+        ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
+        
+    def run(self):
+        """Executa a aplicação principal"""
+        try:
+            self.logger.info("Iniciando LinguaMaster Pro...")
+            
+            # Configurar tema
+            self.setup_theme()
+            
+            # Inicializar banco de dados
+            if not self.initialize_database():
+                return False
+            
+            # Backups online periódicos e manutenção em segundo plano
+            self.start_backups()
+            self.start_maintenance()
+            
+            # Criar janela principal
+            self.main_window = MainWindow(self.db_manager, self.config, self.logger)
+            
+            # Iniciar loop principal
+            self.main_window.run()
+            
+            self.logger.info("LinguaMaster Pro encerrado com sucesso")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erro crítico na aplicação: {e}")
+            return False
+    
+    def cleanup(self):
+        """Limpa recursos antes de encerrar"""
+        if self.maintenance:
+            self.maintenance.stop(timeout=30)
+        if self.backup_scheduler:
+            self.backup_scheduler.stop(timeout=30)
+        if self.db_manager:
+            # Grava o que ainda estiver na fila de escrita antes de fechar
+            if not self.db_manager.flush(timeout=10):
+                self.logger.warning("Nem todas as escritas pendentes foram gravadas")
+            self.db_manager.close()
+        self.logger.info("Recursos limpos com sucesso")
+
+def main():
+    """Função principal"""
+    app = LinguaMasterApp()
+    
+    # python main.py --restore [arquivo.db]
+    if len(sys.argv) > 1 and sys.argv[1] == "--restore":
+        backup_path = sys.argv[2] if len(sys.argv) > 2 else None
+        sys.exit(0 if app.restore_backup(backup_path) else 1)
+    
+    try:
+        success = app.run()
+        if not success:
+            sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nEncerrando aplicação...")
+    except Exception as e:
+        print(f"Erro fatal: {e}")
+        sys.exit(1)
+    finally:
+        app.cleanup()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
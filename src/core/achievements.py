@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de Conquistas do LinguaMaster Pro
+Avalia as regras da tabela achievements indexadas por tipo de requisito
+"""
+
+import bisect
+import sqlite3
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+class AchievementRule(NamedTuple):
+    """Regra ativa de conquista"""
+    requirement_value: int
+    id: int
+    name: str
+    xp_reward: int
+
+def _stats_value(column: str) -> Callable:
+    """Métrica lida de uma coluna de user_stats"""
+    def metric(cursor: sqlite3.Cursor, user_id: int, context: Dict) -> int:
+        row = cursor.execute(
+            f"SELECT {column} FROM user_stats WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        return row[0] if row else 0
+    return metric
+
+def _user_value(column: str) -> Callable:
+    """Métrica lida de uma coluna de users"""
+    def metric(cursor: sqlite3.Cursor, user_id: int, context: Dict) -> int:
+        row = cursor.execute(
+            f"SELECT {column} FROM users WHERE id = ?", (user_id,)
+        ).fetchone()
+        return row[0] if row else 0
+    return metric
+
+def _languages_learned(cursor: sqlite3.Cursor, user_id: int, context: Dict) -> int:
+    """Número de idiomas com alguma atividade"""
+    return cursor.execute(
+        "SELECT COUNT(*) FROM user_language_stats WHERE user_id = ?", (user_id,)
+    ).fetchone()[0]
+
+def _study_hour_metric(condition: Callable[[int], bool]) -> Callable:
+    """Métrica 0/1 conforme a hora em que a atividade foi feita"""
+    def metric(cursor: sqlite3.Cursor, user_id: int, context: Dict) -> int:
+        hour = context.get('hour')
+        return 1 if hour is not None and condition(hour) else 0
+    return metric
+
+# Valor atual de cada tipo de requisito
+METRICS: Dict[str, Callable] = {
+    'lessons_completed': _stats_value('activities'),
+    'words_learned': _stats_value('correct_answers'),
+    'perfect_lessons': _stats_value('perfect_lessons'),
+    'battles_won': _stats_value('battles_won'),
+    'languages_learned': _languages_learned,
+    'current_streak': _user_value('current_streak'),
+    'total_xp': _user_value('total_xp'),
+    'lesson_time': lambda cursor, user_id, context: context.get('time_spent'),
+    'early_study': _study_hour_metric(lambda hour: hour < 8),
+    'late_study': _study_hour_metric(lambda hour: hour >= 22),
+}
+
+# Requisitos em que o valor precisa ficar abaixo do limite (ex.: tempo da lição)
+LOWER_IS_BETTER = {'lesson_time'}
+
+# Tipos de requisito que cada evento pode alterar
+EVENT_REQUIREMENTS: Dict[str, tuple] = {
+    'activity': (
+        'lessons_completed', 'words_learned', 'perfect_lessons', 'battles_won',
+        'languages_learned', 'lesson_time', 'early_study', 'late_study'
+    ),
+    'streak': ('current_streak',),
+    'xp': ('total_xp',),
+}
+
+class AchievementEngine:
+    """Avalia conquistas apenas para os requisitos afetados por um evento
+    
+    As regras ativas ficam agrupadas por requirement_type e ordenadas por
+    requirement_value, de modo que as regras cumpridas por um valor saem de
+    uma busca binária. Deve ser usado dentro dos jobs da fila de escrita.
+    """
+    
+    def __init__(self):
+        self._rules: Optional[Dict[str, List[AchievementRule]]] = None
+        self._values: Dict[str, List[int]] = {}
+    
+    def invalidate(self):
+        """Descarta as regras carregadas (após alterar a tabela achievements)"""
+        self._rules = None
+        self._values = {}
+    
+    def load(self, connection: sqlite3.Connection):
+        """Carrega as regras ativas agrupadas por tipo de requisito"""
+        rows = connection.execute('''
+            SELECT id, name, requirement_type, requirement_value, xp_reward
+            FROM achievements
+            WHERE is_active = 1
+            ORDER BY requirement_type, requirement_value, id
+        ''').fetchall()
+        
+        rules: Dict[str, List[AchievementRule]] = {}
+        for row in rows:
+            rules.setdefault(row[2], []).append(
+                AchievementRule(row[3], row[0], row[1], row[4] or 0)
+            )
+        
+        self._rules = rules
+        self._values = {
+            requirement: [rule.requirement_value for rule in type_rules]
+            for requirement, type_rules in rules.items()
+        }
+    
+    def _matching_rules(self, requirement: str, value: int) -> List[AchievementRule]:
+        """Regras de um tipo cumpridas pelo valor atual"""
+        rules = self._rules[requirement]
+        values = self._values[requirement]
+        
+        if requirement in LOWER_IS_BETTER:
+            if value <= 0:
+                return []
+            return rules[bisect.bisect_right(values, value):]
+        
+        return rules[:bisect.bisect_right(values, value)]
+    
+    def evaluate(self, cursor: sqlite3.Cursor, user_id: int, events: Iterable[str],
+                 context: Dict = None) -> List[AchievementRule]:
+        """Concede as conquistas cumpridas após os eventos informados
+        
+        Grava em user_achievements na transação corrente; a recompensa de XP
+        fica a cargo do chamador.
+        
+        Returns:
+            Regras das conquistas recém-obtidas
+        """
+        if self._rules is None:
+            self.load(cursor.connection)
+        
+        context = context or {}
+        requirements = {
+            requirement
+            for event in events
+            for requirement in EVENT_REQUIREMENTS.get(event, ())
+            if requirement in self._rules
+        }
+        
+        candidates = []
+        for requirement in requirements:
+            value = METRICS[requirement](cursor, user_id, context)
+            if value is not None:
+                candidates.extend(self._matching_rules(requirement, value))
+        
+        if not candidates:
+            return []
+        
+        earned = {
+            row[0] for row in cursor.execute(
+                "SELECT achievement_id FROM user_achievements WHERE user_id = ?", (user_id,)
+            )
+        }
+        new_rules = [rule for rule in candidates if rule.id not in earned]
+        
+        cursor.executemany('''
+            INSERT OR IGNORE INTO user_achievements (user_id, achievement_id)
+            VALUES (?, ?)
+        ''', [(user_id, rule.id) for rule in new_rules])
+        
+        return new_rules
\ No newline at end of file
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cópias de Segurança do LinguaMaster Pro
+Backups online com a API de backup do SQLite, rotação e verificação
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+def verify_backup(path: Path) -> bool:
+    """Confere a integridade de uma cópia com PRAGMA quick_check"""
+    try:
+        connection = sqlite3.connect(f"file:{Path(path).as_posix()}?mode=ro", uri=True)
+        try:
+            rows = connection.execute("PRAGMA quick_check").fetchall()
+            return len(rows) == 1 and rows[0][0] == 'ok'
+        finally:
+            connection.close()
+            
+    except sqlite3.Error as e:
+        print(f"Erro ao verificar backup {path}: {e}")
+        return False
+
+def list_backups(backup_dir: Path, stem: str) -> List[Path]:
+    """Cópias existentes de um banco, da mais recente para a mais antiga"""
+    backup_dir = Path(backup_dir)
+    if not backup_dir.is_dir():
+        return []
+    # O nome termina em data e hora, então a ordem alfabética é a cronológica
+    return sorted(backup_dir.glob(f"{stem}-*.db"), reverse=True)
+
+def rotate_backups(backup_dir: Path, stem: str, generations: int) -> List[Path]:
+    """Apaga as cópias além das `generations` mais recentes"""
+    removed = []
+    for path in list_backups(backup_dir, stem)[max(generations, 1):]:
+        path.unlink()
+        removed.append(path)
+    return removed
+
+def create_backup(db_path: Path, backup_dir: Path, pages: int = 256,
+                  step_sleep: float = 0.01) -> Path:
+    """Copia o banco em passos de `pages` páginas, pausando entre eles
+    
+    A cópia é feita em um arquivo temporário, verificada com quick_check e só
+    então renomeada, de modo que toda cópia listada é íntegra.
+    """
+    db_path = Path(db_path)
+    backup_dir = Path(backup_dir)
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    
+    target = backup_dir / f"{db_path.stem}-{datetime.now():%Y%m%d-%H%M%S}.db"
+    temp = target.with_name(target.name + ".tmp")
+    
+    source = sqlite3.connect(db_path, timeout=10)
+    try:
+        # Fixa um snapshot de leitura: sem ele, cada commit de outra conexão
+        # faria a cópia recomeçar do início (o WAL deixa os escritores livres)
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        
+        destination = sqlite3.connect(temp)
+        try:
+            source.backup(destination, pages=pages, sleep=step_sleep)
+            # A cópia herda o modo WAL; como arquivo avulso ela não deve
+            # depender de -wal/-shm
+            destination.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            destination.close()
+        source.rollback()
+    finally:
+        source.close()
+    
+    if not verify_backup(temp):
+        temp.unlink(missing_ok=True)
+        raise sqlite3.DatabaseError(f"Cópia {target.name} falhou no quick_check")
+    
+    temp.replace(target)
+    return target
+
+def restore_backup(backup_path: Path, db_path: Path):
+    """Restaura uma cópia sobre o banco (nenhuma outra conexão deve estar aberta)"""
+    if not verify_backup(backup_path):
+        raise sqlite3.DatabaseError(f"Cópia {backup_path} falhou no quick_check")
+    
+    source = sqlite3.connect(f"file:{Path(backup_path).as_posix()}?mode=ro", uri=True)
+    try:
+        # Usar a API de backup (e não copiar o arquivo) mantém WAL e -shm coerentes
+        destination = sqlite3.connect(db_path)
+        try:
+            source.backup(destination)
+        finally:
+            destination.close()
+    finally:
+        source.close()
+
+class BackupScheduler:
+    """Executa backups periódicos em uma thread de fundo"""
+    
+    def __init__(self, db_path: Path, backup_dir: Path, interval: float = 3600,
+                 generations: int = 5, pages: int = 256, step_sleep: float = 0.01,
+                 logger=None):
+        self.db_path = Path(db_path)
+        self.backup_dir = Path(backup_dir)
+        self.interval = interval
+        self.generations = generations
+        self.pages = pages
+        self.step_sleep = step_sleep
+        self.logger = logger
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_backup: Optional[Path] = None
+    
+    def _log(self, level: str, message: str):
+        """Registra no Logger da aplicação, se houver"""
+        if self.logger:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+    
+    def start(self):
+        """Inicia a thread de backups"""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="BackupScheduler", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = None):
+        """Interrompe a thread (um backup em andamento termina antes)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _due(self) -> float:
+        """Segundos até o próximo backup, com base na cópia mais recente"""
+        backups = list_backups(self.backup_dir, self.db_path.stem)
+        if not backups:
+            return 0
+        age = time.time() - backups[0].stat().st_mtime
+        return max(0.0, self.interval - age)
+    
+    def _run(self):
+        """Laço da thread: espera o intervalo e faz o backup"""
+        while not self._stop.wait(self._due()):
+            self.run_once()
+    
+    def run_once(self) -> Optional[Path]:
+        """Faz um backup agora e aplica a rotação"""
+        try:
+            started = time.perf_counter()
+            path = create_backup(self.db_path, self.backup_dir, self.pages, self.step_sleep)
+            removed = rotate_backups(self.backup_dir, self.db_path.stem, self.generations)
+            
+            self.last_backup = path
+            self._log('info', f"Backup criado em {path} ({time.perf_counter() - started:.2f}s, "
+                              f"{len(removed)} cópia(s) antiga(s) removida(s))")
+            return path
+            
+        except Exception as e:
+            self._log('error', f"Erro ao criar backup: {e}")
+            # Evita repetir a falha em laço apertado
+            self._stop.wait(min(self.interval, 60))
+            return None
\ No newline at end of file
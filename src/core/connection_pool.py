@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pool de Conexões de Leitura do LinguaMaster Pro
+Mantém conexões SQLite de leitura reutilizáveis entre threads de trabalho
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+def configure_connection(connection: sqlite3.Connection, busy_timeout_ms: int = 5000):
+    """Aplica os PRAGMAs comuns a todas as conexões do aplicativo"""
+    connection.row_factory = sqlite3.Row  # Permite acesso por nome de coluna
+    connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+
+class ConnectionPool:
+    """Pool limitado de conexões somente leitura
+    
+    Cada thread que entra em `acquire()` recebe uma conexão exclusiva enquanto
+    estiver lendo; chamadas aninhadas na mesma thread reutilizam a mesma
+    conexão. Com o banco em modo WAL, essas leituras rodam em paralelo entre
+    si e com a conexão de escrita.
+    """
+    
+    def __init__(self, db_name: str, size: int = 4, timeout: float = 10.0,
+                 busy_timeout_ms: int = 5000, connect: Callable[..., sqlite3.Connection] = None):
+        self.db_name = db_name
+        self.connect = connect or sqlite3.connect
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.busy_timeout_ms = busy_timeout_ms
+        
+        self._idle = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+    
+    def _create_connection(self) -> sqlite3.Connection:
+        """Abre uma nova conexão de leitura"""
+        # A conexão pode ser emprestada por threads diferentes ao longo do
+        # tempo, mas nunca por duas ao mesmo tempo
+        connection = self.connect(self.db_name, check_same_thread=False)
+        configure_connection(connection, self.busy_timeout_ms)
+        connection.execute("PRAGMA query_only = ON")
+        return connection
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Retira uma conexão ociosa ou cria uma nova se houver vaga"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Pool de conexões fechado")
+            if len(self._all) < self.size:
+                connection = self._create_connection()
+                self._all.append(connection)
+                return connection
+        
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("Nenhuma conexão de leitura disponível no pool")
+    
+    def _checkin(self, connection: sqlite3.Connection):
+        """Devolve uma conexão ao pool"""
+        if self._closed:
+            connection.close()
+            return
+        
+        # Encerra qualquer transação de leitura aberta para não segurar o WAL
+        if connection.in_transaction:
+            connection.rollback()
+        self._idle.put(connection)
+    
+    @contextmanager
+    def acquire(self):
+        """Empresta uma conexão de leitura para a thread atual"""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is not None:
+            # Reentrada na mesma thread: reutiliza a conexão já emprestada
+            self._local.depth += 1
+            try:
+                yield connection
+            finally:
+                self._local.depth -= 1
+            return
+        
+        connection = self._checkout()
+        self._local.connection = connection
+        self._local.depth = 1
+        try:
+            yield connection
+        finally:
+            self._local.connection = None
+            self._local.depth = 0
+            self._checkin(connection)
+    
+    def close_all(self):
+        """Fecha todas as conexões do pool"""
+        with self._lock:
+            self._closed = True
+            connections, self._all = self._all, []
+        
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resumo Diário do LinguaMaster Pro
+Mantém user_daily_rollup (usuário, dia, idioma) para metas, gráficos e calendários
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, List
+
+def apply_activity(cursor: sqlite3.Cursor, user_id: int, day: date, language_code: str,
+                   xp_earned: int, time_spent: int, correct_answers: int,
+                   total_questions: int):
+    """Soma uma atividade ao resumo do dia (na mesma transação do registro)"""
+    cursor.execute('''
+        INSERT INTO user_daily_rollup
+        (user_id, day, language_code, activities, xp, time_spent,
+         correct_answers, total_questions)
+        VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+        ON CONFLICT (user_id, day, language_code) DO UPDATE SET
+            activities = activities + 1,
+            xp = xp + excluded.xp,
+            time_spent = time_spent + excluded.time_spent,
+            correct_answers = correct_answers + excluded.correct_answers,
+            total_questions = total_questions + excluded.total_questions
+    ''', (user_id, day.isoformat(), language_code, xp_earned, time_spent,
+          correct_answers, total_questions))
+
+def apply_translation(cursor: sqlite3.Cursor, user_id: int, day: date, language_code: str):
+    """Conta uma tradução no resumo do dia"""
+    cursor.execute('''
+        INSERT INTO user_daily_rollup (user_id, day, language_code, translations)
+        VALUES (?, ?, ?, 1)
+        ON CONFLICT (user_id, day, language_code) DO UPDATE SET
+            translations = translations + 1
+    ''', (user_id, day.isoformat(), language_code))
+
+def _empty_day(day: str) -> Dict:
+    """Totais de um dia sem atividade"""
+    return {
+        'day': day, 'activities': 0, 'xp': 0, 'time_spent': 0,
+        'correct_answers': 0, 'total_questions': 0, 'translations': 0, 'accuracy': 0.0
+    }
+
+def read_days(connection: sqlite3.Connection, user_id: int,
+              start: date, end: date) -> List[Dict]:
+    """Totais por dia entre start e end (inclusive), com os dias vazios zerados
+    
+    Lê no máximo uma linha por dia e idioma do intervalo pela chave primária.
+    """
+    rows = connection.execute('''
+        SELECT day, SUM(activities) AS activities, SUM(xp) AS xp,
+               SUM(time_spent) AS time_spent, SUM(correct_answers) AS correct_answers,
+               SUM(total_questions) AS total_questions, SUM(translations) AS translations
+        FROM user_daily_rollup
+        WHERE user_id = ? AND day BETWEEN ? AND ?
+        GROUP BY day
+    ''', (user_id, start.isoformat(), end.isoformat())).fetchall()
+    by_day = {row['day']: dict(row) for row in rows}
+    
+    days = []
+    for offset in range((end - start).days + 1):
+        day = (start + timedelta(days=offset)).isoformat()
+        totals = by_day.get(day)
+        if totals is None:
+            days.append(_empty_day(day))
+            continue
+        
+        total_questions = totals['total_questions']
+        totals['accuracy'] = (totals['correct_answers'] / total_questions * 100) if total_questions else 0.0
+        days.append(totals)
+    
+    return days
\ No newline at end of file
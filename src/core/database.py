@@ -1,426 +1,928 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Sistema de Banco de Dados do LinguaMaster Pro
-Gerencia todas as operações de banco de dados SQLite
-"""
-
-import sqlite3
-import hashlib
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-
-class DatabaseManager:
-    """Gerenciador do banco de dados SQLite"""
-    
-    def __init__(self, db_name="linguamaster.db"):
-        self.db_name = db_name
-        self.db_path = Path(db_name)
-        self.connection = None
-        
-    def connect(self):
-        """Conecta ao banco de dados"""
-        try:
-            self.connection = sqlite3.connect(self.db_name)
-            self.connection.row_factory = sqlite3.Row  # Permite acesso por nome de coluna
-            return True
-        except Exception as e:
-            print(f"Erro ao conectar ao banco: {e}")
-            return False
-    
-    def close(self):
-        """Fecha conexão com o banco"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
-    
-    def initialize_database(self):
-        """Inicializa todas as tabelas do banco de dados"""
-        if not self.connect():
-            return False
-        
-        try:
-            cursor = self.connection.cursor()
-            
-            # Tabela de usuários
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    email TEXT UNIQUE,
-                    password_hash TEXT NOT NULL,
-                    full_name TEXT,
-                    native_language TEXT DEFAULT 'pt',
-                    learning_languages TEXT DEFAULT '[]',
-                    level INTEGER DEFAULT 1,
-                    total_xp INTEGER DEFAULT 0,
-                    current_streak INTEGER DEFAULT 0,
-                    longest_streak INTEGER DEFAULT 0,
-                    last_activity DATE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_active BOOLEAN DEFAULT 1,
-                    profile_picture TEXT,
-                    preferences TEXT DEFAULT '{}'
-                )
-            ''')
-            
-            # Tabela de progresso por idioma
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_language_progress (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    language_code TEXT NOT NULL,
-                    level INTEGER DEFAULT 1,
-                    xp INTEGER DEFAULT 0,
-                    lessons_completed INTEGER DEFAULT 0,
-                    words_learned INTEGER DEFAULT 0,
-                    accuracy_rate REAL DEFAULT 0.0,
-                    time_studied INTEGER DEFAULT 0,
-                    last_lesson_date DATE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    UNIQUE(user_id, language_code)
-                )
-            ''')
-            
-            # Tabela de vocabulário
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS vocabulary (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    word TEXT NOT NULL,
-                    translation TEXT NOT NULL,
-                    source_language TEXT NOT NULL,
-                    target_language TEXT NOT NULL,
-                    difficulty_level TEXT DEFAULT 'beginner',
-                    category TEXT,
-                    pronunciation TEXT,
-                    example_sentence TEXT,
-                    example_translation TEXT,
-                    image_url TEXT,
-                    audio_url TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(word, source_language, target_language)
-                )
-            ''')
-            
-            # Tabela de lições
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS lessons (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    language_code TEXT NOT NULL,
-                    difficulty_level TEXT NOT NULL,
-                    lesson_order INTEGER,
-                    vocabulary_ids TEXT,
-                    xp_reward INTEGER DEFAULT 50,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Tabela de atividades/jogos dos usuários
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_activities (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    activity_type TEXT NOT NULL,
-                    language_code TEXT NOT NULL,
-                    score INTEGER DEFAULT 0,
-                    max_score INTEGER DEFAULT 0,
-                    xp_earned INTEGER DEFAULT 0,
-                    time_spent INTEGER DEFAULT 0,
-                    correct_answers INTEGER DEFAULT 0,
-                    total_questions INTEGER DEFAULT 0,
-                    difficulty_level TEXT,
-                    details TEXT DEFAULT '{}',
-                    completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                )
-            ''')
-            
-            # Tabela de conquistas
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS achievements (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    description TEXT NOT NULL,
-                    icon TEXT,
-                    category TEXT,
-                    requirement_type TEXT NOT NULL,
-                    requirement_value INTEGER NOT NULL,
-                    xp_reward INTEGER DEFAULT 0,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Tabela de conquistas dos usuários
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_achievements (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    achievement_id INTEGER NOT NULL,
-                    earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    FOREIGN KEY (achievement_id) REFERENCES achievements (id),
-                    UNIQUE(user_id, achievement_id)
-                )
-            ''')
-            
-            # Tabela de palavras favoritas
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_favorites (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    vocabulary_id INTEGER NOT NULL,
-                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    FOREIGN KEY (vocabulary_id) REFERENCES vocabulary (id),
-                    UNIQUE(user_id, vocabulary_id)
-                )
-            ''')
-            
-            # Tabela de histórico de traduções
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS translation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    source_text TEXT NOT NULL,
-                    translated_text TEXT NOT NULL,
-                    source_language TEXT NOT NULL,
-                    target_language TEXT NOT NULL,
-                    translation_api TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id)
-                )
-            ''')
-            
-            # Tabela de desafios diários
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS daily_challenges (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    challenge_date DATE NOT NULL,
-                    challenge_type TEXT NOT NULL,
-                    language_code TEXT NOT NULL,
-                    difficulty_level TEXT NOT NULL,
-                    target_score INTEGER DEFAULT 100,
-                    xp_reward INTEGER DEFAULT 25,
-                    description TEXT,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(challenge_date, challenge_type, language_code)
-                )
-            ''')
-            
-            # Tabela de participação em desafios
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_daily_challenges (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    challenge_id INTEGER NOT NULL,
-                    score INTEGER DEFAULT 0,
-                    completed BOOLEAN DEFAULT 0,
-                    completed_at TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    FOREIGN KEY (challenge_id) REFERENCES daily_challenges (id),
-                    UNIQUE(user_id, challenge_id)
-                )
-            ''')
-            
-            self.connection.commit()
-            
-            # Inserir dados iniciais
-            self._insert_initial_data()
-            
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao inicializar banco de dados: {e}")
-            return False
-    
-    def _insert_initial_data(self):
-        """Insere dados iniciais no banco"""
-        cursor = self.connection.cursor()
-        
-        # Inserir conquistas padrão
-        achievements = [
-            ("Primeiro Passo", "Complete sua primeira lição", "🎯", "progress", "lessons_completed", 1, 10),
-            ("Estudioso", "Complete 10 lições", "📚", "progress", "lessons_completed", 10, 50),
-            ("Poliglota", "Aprenda 3 idiomas diferentes", "🌍", "languages", "languages_learned", 3, 100),
-            ("Streak de Fogo", "Mantenha um streak de 7 dias", "🔥", "streak", "current_streak", 7, 75),
-            ("Mestre das Palavras", "Aprenda 100 palavras", "📖", "vocabulary", "words_learned", 100, 150),
-            ("Velocista", "Complete uma lição em menos de 2 minutos", "⚡", "speed", "lesson_time", 120, 25),
-            ("Perfeccionista", "Obtenha 100% de acerto em 5 lições", "💯", "accuracy", "perfect_lessons", 5, 100),
-            ("Madrugador", "Estude antes das 8h da manhã", "🌅", "time", "early_study", 1, 30),
-            ("Coruja", "Estude depois das 22h", "🦉", "time", "late_study", 1, 30),
-            ("Guerreiro", "Vença 10 batalhas de vocabulário", "⚔️", "battles", "battles_won", 10, 80)
-        ]
-        
-        for achievement in achievements:
-            cursor.execute('''
-                INSERT OR IGNORE INTO achievements 
-                (name, description, icon, category, requirement_type, requirement_value, xp_reward)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', achievement)
-        
-        self.connection.commit()
-    
-    def hash_password(self, password: str) -> str:
-        """Gera hash da senha"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
-    def create_user(self, username: str, password: str, email: str = None, full_name: str = None) -> Optional[int]:
-        """Cria novo usuário"""
-        try:
-            cursor = self.connection.cursor()
-            password_hash = self.hash_password(password)
-            
-            cursor.execute('''
-                INSERT INTO users (username, password_hash, email, full_name)
-                VALUES (?, ?, ?, ?)
-            ''', (username, password_hash, email, full_name))
-            
-            user_id = cursor.lastrowid
-            self.connection.commit()
-            return user_id
-            
-        except sqlite3.IntegrityError:
-            return None  # Usuário já existe
-        except Exception as e:
-            print(f"Erro ao criar usuário: {e}")
-            return None
-    
-    def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
-        """Autentica usuário"""
-        try:
-            cursor = self.connection.cursor()
-            password_hash = self.hash_password(password)
-            
-            cursor.execute('''
-                SELECT * FROM users 
-                WHERE username = ? AND password_hash = ? AND is_active = 1
-            ''', (username, password_hash))
-            
-            user = cursor.fetchone()
-            return dict(user) if user else None
-            
-        except Exception as e:
-            print(f"Erro na autenticação: {e}")
-            return None
-    
-    def get_user_progress(self, user_id: int, language_code: str = None) -> List[Dict]:
-        """Obtém progresso do usuário"""
-        try:
-            cursor = self.connection.cursor()
-            
-            if language_code:
-                cursor.execute('''
-                    SELECT * FROM user_language_progress 
-                    WHERE user_id = ? AND language_code = ?
-                ''', (user_id, language_code))
-            else:
-                cursor.execute('''
-                    SELECT * FROM user_language_progress 
-                    WHERE user_id = ?
-                ''', (user_id,))
-            
-            return [dict(row) for row in cursor.fetchall()]
-            
-        except Exception as e:
-            print(f"Erro ao obter progresso: {e}")
-            return []
-    
-    def update_user_xp(self, user_id: int, xp_gained: int, language_code: str = None):
-        """Atualiza XP do usuário"""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Atualizar XP total do usuário
-            cursor.execute('''
-                UPDATE users 
-                SET total_xp = total_xp + ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (xp_gained, user_id))
-            
-            # Atualizar XP por idioma se especificado
-            if language_code:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO user_language_progress 
-                    (user_id, language_code, xp) 
-                    VALUES (?, ?, COALESCE((SELECT xp FROM user_language_progress 
-                                          WHERE user_id = ? AND language_code = ?), 0) + ?)
-                ''', (user_id, language_code, user_id, language_code, xp_gained))
-            
-            self.connection.commit()
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao atualizar XP: {e}")
-            return False
-    
-    def add_vocabulary_word(self, word: str, translation: str, source_lang: str, 
-                           target_lang: str, difficulty: str = "beginner", 
-                           category: str = None) -> Optional[int]:
-        """Adiciona palavra ao vocabulário"""
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO vocabulary 
-                (word, translation, source_language, target_language, difficulty_level, category)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (word, translation, source_lang, target_lang, difficulty, category))
-            
-            word_id = cursor.lastrowid
-            self.connection.commit()
-            return word_id
-            
-        except Exception as e:
-            print(f"Erro ao adicionar vocabulário: {e}")
-            return None
-    
-    def get_vocabulary_for_lesson(self, language_code: str, difficulty: str, limit: int = 10) -> List[Dict]:
-        """Obtém vocabulário para lição"""
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM vocabulary 
-                WHERE target_language = ? AND difficulty_level = ?
-                ORDER BY RANDOM() LIMIT ?
-            ''', (language_code, difficulty, limit))
-            
-            return [dict(row) for row in cursor.fetchall()]
-            
-        except Exception as e:
-            print(f"Erro ao obter vocabulário: {e}")
-            return []
-    
-    def record_activity(self, user_id: int, activity_type: str, language_code: str,
-                       score: int, max_score: int, xp_earned: int, **kwargs) -> bool:
-        """Registra atividade do usuário"""
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                INSERT INTO user_activities 
-                (user_id, activity_type, language_code, score, max_score, xp_earned,
-                 time_spent, correct_answers, total_questions, difficulty_level, details)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_id, activity_type, language_code, score, max_score, xp_earned,
-                kwargs.get('time_spent', 0), kwargs.get('correct_answers', 0),
-                kwargs.get('total_questions', 0), kwargs.get('difficulty_level', 'beginner'),
-                json.dumps(kwargs.get('details', {}))
-            ))
-            
-            self.connection.commit()
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao registrar atividade: {e}")
-            return False
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sistema de Banco de Dados do LinguaMaster Pro
+Gerencia todas as operações de banco de dados SQLite
+"""
+
+import sqlite3
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+from src.core.achievements import AchievementEngine
+from src.core.connection_pool import ConnectionPool, configure_connection
+from src.core import daily_rollup
+from src.core.leaderboard import Leaderboard
+from src.core import leagues
+from src.core.maintenance import MAINTENANCE_TASKS
+from src.core.pagination import Page, PageCursor, keyset_page
+from src.core.models import Activity, LanguageProgress, User, VocabularyWord, iter_rows
+from src.core.migrations import LATEST_VERSION, apply_migrations, get_schema_version
+from src.core.query_cache import QueryCache
+from src.core.query_plans import check_query_plans
+from src.core.sql_trace import SqlTrace
+from src.core import retention
+from src.core import streaks
+from src.core import user_stats
+from src.core.vocabulary_importer import file_content_hash, import_pack, is_pack_imported
+from src.core.vocabulary_sampler import VocabularySampler
+from src.core.write_queue import WriteQueue
+
+class DatabaseManager:
+    """Gerenciador do banco de dados SQLite"""
+    
+    def __init__(self, db_name="linguamaster.db", pool_size: int = 4,
+                 flush_interval: float = 0.02, sql_trace: Optional[SqlTrace] = None,
+                 cache_size: int = 256):
+        self.db_name = db_name
+        self.db_path = Path(db_name)
+        self.pool_size = pool_size
+        self.flush_interval = flush_interval
+        # Instrumentação opcional; desligada, as conexões são as do sqlite3
+        self.sql_trace = sql_trace
+        self.connection = None
+        self.pool = None
+        self.writer = None
+        self.query_cache = QueryCache(cache_size)
+        self._probe_connection = None
+        self._probe_lock = threading.Lock()
+        self.vocabulary_sampler = VocabularySampler()
+        self.leaderboard = Leaderboard()
+        self.achievements = AchievementEngine()
+        self._league_week = None
+        self._streak_day = None
+        self._retention_lock = threading.Lock()
+        
+    def connect(self):
+        """Conecta ao banco de dados"""
+        if self.connection:
+            return True
+        
+        try:
+            connect = self.sql_trace.connect if self.sql_trace else sqlite3.connect
+            self.connection = connect(self.db_name, check_same_thread=False)
+            configure_connection(self.connection)
+            
+            # Só vale para bancos novos (antes da primeira tabela); os
+            # existentes são convertidos pela manutenção
+            self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            
+            # WAL permite leituras em paralelo com a escrita
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            
+            self.pool = ConnectionPool(self.db_name, self.pool_size, connect=connect)
+            
+            # Conexão só para PRAGMA data_version: detecta escritas de outro processo
+            self._probe_connection = sqlite3.connect(self.db_name, check_same_thread=False)
+            self.query_cache.attach_probe(self._probe_data_version, self._writer_data_version())
+            
+            # Todas as escritas passam por uma única thread com commit em grupo
+            self.writer = WriteQueue(self.connection, self.flush_interval)
+            self.writer.start()
+            return True
+        except Exception as e:
+            print(f"Erro ao conectar ao banco: {e}")
+            return False
+    
+    def close(self):
+        """Fecha conexão com o banco"""
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
+        if self.pool:
+            self.pool.close_all()
+            self.pool = None
+        if self._probe_connection:
+            self.query_cache.detach_probe()
+            self._probe_connection.close()
+            self._probe_connection = None
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+        if self.sql_trace:
+            self.sql_trace.log_summary()
+    
+    @contextmanager
+    def _reader(self):
+        """Empresta uma conexão de leitura do pool para a thread atual"""
+        if self.pool is None:
+            raise sqlite3.ProgrammingError("Banco de dados não conectado")
+        with self.pool.acquire() as connection:
+            yield connection
+    
+    def _probe_data_version(self) -> int:
+        """PRAGMA data_version da conexão de sondagem"""
+        with self._probe_lock:
+            return self._probe_connection.execute("PRAGMA data_version").fetchone()[0]
+    
+    def _writer_data_version(self) -> int:
+        """PRAGMA data_version da conexão de escrita (só na thread de escrita)"""
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+    
+    def _submit_write(self, func, tables: Tuple[str, ...] = None) -> Future:
+        """Enfileira um job de escrita na thread de escrita
+        
+        `tables` lista as tabelas que o job altera, para invalidar só as
+        consultas em cache que dependem delas; sem a lista, qualquer alteração
+        descarta o cache inteiro.
+        """
+        if self.writer is None:
+            future = Future()
+            future.set_exception(sqlite3.ProgrammingError("Banco de dados não conectado"))
+            return future
+        
+        def job(conn):
+            changes = conn.total_changes
+            result = func(conn)
+            if conn.total_changes != changes:
+                self.writer.on_commit(
+                    lambda: self.query_cache.after_local_commit(tables, self._writer_data_version)
+                )
+            return result
+        
+        return self.writer.submit(job)
+    
+    def _write(self, func, tables: Tuple[str, ...] = None):
+        """Executa um job de escrita e aguarda o commit"""
+        return self._submit_write(func, tables).result()
+    
+    def _cached(self, key: tuple, tables: Tuple[str, ...], load):
+        """Leitura com cache: `load` só roda se as tabelas mudaram"""
+        return self.query_cache.get_or_load(key, tables, load)
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Aguarda a gravação de todas as escritas pendentes"""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+    
+    def run_maintenance_task(self, name: str, **options) -> Dict:
+        """Executa uma etapa de manutenção na thread de escrita, fora de transação
+        
+        VACUUM e o checkpoint do WAL não podem rodar dentro de transação; na
+        fila de escrita eles também não disputam o lock com as gravações.
+        """
+        task = MAINTENANCE_TASKS[name]
+        if self.writer is None:
+            raise sqlite3.ProgrammingError("Banco de dados não conectado")
+        return self.writer.submit(lambda conn: task(conn, **options), transactional=False).result()
+    
+    def initialize_database(self):
+        """Inicializa todas as tabelas do banco de dados"""
+        if not self.connect():
+            return False
+        
+        try:
+            # Caminho rápido: com o esquema em dia nenhuma DDL é executada
+            with self._reader() as conn:
+                if get_schema_version(conn) >= LATEST_VERSION:
+                    return True
+            
+            applied = self._write(apply_migrations)
+            if applied:
+                print(f"Migrações aplicadas: {applied}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao inicializar banco de dados: {e}")
+            return False
+    
+    def check_query_plans(self) -> List[Dict]:
+        """Confere que nenhuma consulta crítica faz varredura completa"""
+        try:
+            with self._reader() as conn:
+                return check_query_plans(conn)
+            
+        except Exception as e:
+            print(f"Erro ao verificar planos de consulta: {e}")
+            return []
+    
+    def hash_password(self, password: str) -> str:
+        """Gera hash da senha"""
+        return hashlib.sha256(password.encode()).hexdigest()
+    
+    def create_user(self, username: str, password: str, email: str = None, full_name: str = None) -> Optional[int]:
+        """Cria novo usuário"""
+        password_hash = self.hash_password(password)
+        
+        def job(conn):
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO users (username, password_hash, email, full_name)
+                VALUES (?, ?, ?, ?)
+            ''', (username, password_hash, email, full_name))
+            user_id = cursor.lastrowid
+            self.writer.on_commit(lambda: self.leaderboard.update(user_id, 0, username))
+            return user_id
+        
+        try:
+            return self._write(job)
+            
+        except sqlite3.IntegrityError:
+            return None  # Usuário já existe
+        except Exception as e:
+            print(f"Erro ao criar usuário: {e}")
+            return None
+    
+    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+        """Autentica usuário"""
+        # Garante que o streak lido já reflete a virada do dia
+        self.reset_broken_streaks()
+        
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = User.row_factory
+                password_hash = self.hash_password(password)
+                
+                cursor.execute(f'''
+                    SELECT {User.select_list()} FROM users 
+                    WHERE username = ? AND password_hash = ? AND is_active = 1
+                ''', (username, password_hash))
+                
+                return cursor.fetchone()
+            
+        except Exception as e:
+            print(f"Erro na autenticação: {e}")
+            return None
+    
+    def get_user(self, user_id: int) -> Optional[User]:
+        """Obtém os dados atuais de um usuário"""
+        def load():
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = User.row_factory
+                cursor.execute(f"SELECT {User.select_list()} FROM users WHERE id = ?", (user_id,))
+                return cursor.fetchone()
+        
+        try:
+            return self._cached(('user', user_id), ('users',), load)
+            
+        except Exception as e:
+            print(f"Erro ao obter usuário: {e}")
+            return None
+    
+    def get_user_progress(self, user_id: int, language_code: str = None) -> List[LanguageProgress]:
+        """Obtém progresso do usuário"""
+        try:
+            return self._cached(
+                ('progress', user_id, language_code), ('user_language_progress',),
+                lambda: self._load_user_progress(user_id, language_code)
+            )
+            
+        except Exception as e:
+            print(f"Erro ao obter progresso: {e}")
+            return []
+    
+    def _load_user_progress(self, user_id: int, language_code: str = None) -> List[LanguageProgress]:
+        """Lê o progresso do usuário no banco"""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = LanguageProgress.row_factory
+            
+            if language_code:
+                cursor.execute(f'''
+                    SELECT {LanguageProgress.select_list()} FROM user_language_progress 
+                    WHERE user_id = ? AND language_code = ?
+                ''', (user_id, language_code))
+            else:
+                cursor.execute(f'''
+                    SELECT {LanguageProgress.select_list()} FROM user_language_progress 
+                    WHERE user_id = ?
+                ''', (user_id,))
+            
+            return cursor.fetchall()
+    
+    def _apply_user_xp(self, conn: sqlite3.Connection, user_id: int, xp_gained: int,
+                       language_code: str = None) -> bool:
+        """Aplica ganho de XP dentro da transação de escrita"""
+        cursor = conn.cursor()
+        
+        # Atualizar XP total do usuário
+        cursor.execute('''
+            UPDATE users 
+            SET total_xp = total_xp + ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (xp_gained, user_id))
+        
+        # O ranking em memória só muda depois que o XP estiver gravado
+        row = cursor.execute("SELECT total_xp FROM users WHERE id = ?", (user_id,)).fetchone()
+        if row:
+            total_xp = row[0]
+            self.writer.on_commit(lambda: self.leaderboard.update(user_id, total_xp))
+        
+        # Contador semanal que classifica o usuário na liga
+        week = self._ensure_league_week(conn)
+        leagues.join_league(cursor, user_id, week)
+        leagues.add_weekly_xp(cursor, user_id, week, xp_gained)
+        
+        # Atualizar XP por idioma se especificado
+        if language_code:
+            cursor.execute('''
+                INSERT OR REPLACE INTO user_language_progress 
+                (user_id, language_code, xp) 
+                VALUES (?, ?, COALESCE((SELECT xp FROM user_language_progress 
+                                      WHERE user_id = ? AND language_code = ?), 0) + ?)
+            ''', (user_id, language_code, user_id, language_code, xp_gained))
+        
+        self._evaluate_achievements(conn, user_id, ('xp',))
+        
+        return True
+    
+    def _evaluate_achievements(self, conn: sqlite3.Connection, user_id: int, events: tuple,
+                               context: Dict = None):
+        """Concede conquistas e suas recompensas de XP na transação corrente"""
+        earned = self.achievements.evaluate(conn.cursor(), user_id, events, context)
+        for rule in earned:
+            # A recompensa pode, por sua vez, liberar conquistas de XP total
+            if rule.xp_reward:
+                self._apply_user_xp(conn, user_id, rule.xp_reward)
+    
+    def _ensure_league_week(self, conn: sqlite3.Connection) -> str:
+        """Vira a semana das ligas dentro da transação de escrita, se preciso"""
+        week = leagues.current_week()
+        if self._league_week != week:
+            result = leagues.rollover(conn.cursor(), week)
+            if result['members']:
+                print(f"Ligas da semana {week}: {result['members']} jogadores, "
+                      f"{result['promoted']} promovidos, {result['demoted']} rebaixados")
+            self.writer.on_commit(lambda: setattr(self, '_league_week', week))
+        return week
+    
+    def update_user_xp_async(self, user_id: int, xp_gained: int, language_code: str = None) -> Future:
+        """Enfileira atualização de XP sem bloquear a thread chamadora"""
+        return self._submit_write(
+            lambda conn: self._apply_user_xp(conn, user_id, xp_gained, language_code)
+        )
+    
+    def update_user_xp(self, user_id: int, xp_gained: int, language_code: str = None):
+        """Atualiza XP do usuário"""
+        try:
+            return self.update_user_xp_async(user_id, xp_gained, language_code).result()
+            
+        except Exception as e:
+            print(f"Erro ao atualizar XP: {e}")
+            return False
+    
+    def add_vocabulary_word(self, word: str, translation: str, source_lang: str, 
+                           target_lang: str, difficulty: str = "beginner", 
+                           category: str = None) -> Optional[int]:
+        """Adiciona palavra ao vocabulário"""
+        def job(conn):
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO vocabulary 
+                (word, translation, source_language, target_language, difficulty_level, category)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (word, translation, source_lang, target_lang, difficulty, category))
+            return cursor.lastrowid
+        
+        try:
+            word_id = self._write(job)
+            # INSERT OR REPLACE pode trocar o id da palavra
+            self.vocabulary_sampler.invalidate(target_lang, difficulty)
+            return word_id
+            
+        except Exception as e:
+            print(f"Erro ao adicionar vocabulário: {e}")
+            return None
+    
+    def import_vocabulary_pack(self, path, source_language: str = 'pt') -> Optional[int]:
+        """Importa um pacote JSON de vocabulário
+        
+        Pacotes já importados com o mesmo conteúdo (hash SHA-256) são pulados.
+        
+        Returns:
+            Número de palavras gravadas (0 se o pacote não mudou) ou None em erro
+        """
+        try:
+            path = Path(path)
+            source = path.name
+            content_hash = file_content_hash(path)
+            
+            with self._reader() as conn:
+                if is_pack_imported(conn, source, content_hash):
+                    return 0
+            
+            # Todas as palavras do pacote entram em uma única transação
+            word_count = self._write(
+                lambda conn: import_pack(conn, path, source, content_hash, source_language)
+            )
+            self.vocabulary_sampler.invalidate()
+            return word_count
+            
+        except Exception as e:
+            print(f"Erro ao importar vocabulário de {path}: {e}")
+            return None
+    
+    def import_vocabulary_directory(self, directory="data/vocabulary",
+                                    source_language: str = 'pt') -> Dict[str, Optional[int]]:
+        """Importa todos os pacotes JSON de um diretório"""
+        results = {}
+        directory = Path(directory)
+        if not directory.is_dir():
+            return results
+        
+        for path in sorted(directory.glob("*.json")):
+            results[path.name] = self.import_vocabulary_pack(path, source_language)
+        
+        return results
+    
+    def get_vocabulary_for_lesson(self, language_code: str, difficulty: str, limit: int = 10,
+                                  exclude_ids: Iterable[int] = None) -> List[VocabularyWord]:
+        """Obtém vocabulário para lição
+        
+        Sorteia `limit` palavras distintas sem ordenar o nível inteiro; ids em
+        `exclude_ids` (palavras vistas recentemente) não são escolhidos.
+        """
+        try:
+            with self._reader() as conn:
+                word_ids = self.vocabulary_sampler.sample_ids(
+                    conn, language_code, difficulty, limit, exclude_ids
+                )
+                if not word_ids:
+                    return []
+                
+                placeholders = ','.join('?' * len(word_ids))
+                cursor = conn.cursor()
+                cursor.row_factory = VocabularyWord.row_factory
+                cursor.execute(f'''
+                    SELECT {VocabularyWord.select_list()} FROM vocabulary WHERE id IN ({placeholders})
+                ''', word_ids)
+                
+                # Mantém a ordem sorteada
+                rows = {word.id: word for word in cursor.fetchall()}
+                return [rows[word_id] for word_id in word_ids if word_id in rows]
+            
+        except Exception as e:
+            print(f"Erro ao obter vocabulário: {e}")
+            return []
+    
+    def _insert_activity(self, conn: sqlite3.Connection, user_id: int, activity_type: str,
+                         language_code: str, score: int, max_score: int, xp_earned: int,
+                         **kwargs) -> bool:
+        """Grava atividade dentro da transação de escrita"""
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO user_activities 
+            (user_id, activity_type, language_code, score, max_score, xp_earned,
+             time_spent, correct_answers, total_questions, difficulty_level, details)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            user_id, activity_type, language_code, score, max_score, xp_earned,
+            kwargs.get('time_spent', 0), kwargs.get('correct_answers', 0),
+            kwargs.get('total_questions', 0), kwargs.get('difficulty_level', 'beginner'),
+            json.dumps(kwargs.get('details', {}))
+        ))
+        
+        correct_answers = kwargs.get('correct_answers', 0)
+        total_questions = kwargs.get('total_questions', 0)
+        time_spent = kwargs.get('time_spent', 0)
+        
+        # Agregados atualizados no mesmo commit da atividade
+        user_stats.apply_activity(
+            cursor, user_id, language_code,
+            correct_answers, total_questions, time_spent, xp_earned,
+            perfect_lesson=user_stats.is_perfect_lesson(correct_answers, total_questions),
+            battle_won=user_stats.is_battle_won(activity_type, score, max_score)
+        )
+        
+        today = self._ensure_streak_day(conn)
+        streaks.apply_activity(cursor, user_id, today)
+        daily_rollup.apply_activity(
+            cursor, user_id, today, language_code, xp_earned,
+            time_spent, correct_answers, total_questions
+        )
+        
+        self._evaluate_achievements(conn, user_id, ('activity', 'streak'), {
+            'time_spent': time_spent,
+            'hour': datetime.now().hour
+        })
+        
+        return True
+    
+    def _ensure_streak_day(self, conn: sqlite3.Connection) -> date:
+        """Zera os streaks quebrados na primeira escrita de cada dia"""
+        today = date.today()
+        if self._streak_day != today:
+            reset = streaks.reset_broken_streaks(conn.cursor(), today)
+            if reset:
+                print(f"Streaks zerados na virada do dia: {reset}")
+            self.writer.on_commit(lambda: setattr(self, '_streak_day', today))
+        return today
+    
+    def record_activity_async(self, user_id: int, activity_type: str, language_code: str,
+                              score: int, max_score: int, xp_earned: int, **kwargs) -> Future:
+        """Enfileira registro de atividade sem bloquear a thread chamadora"""
+        return self._submit_write(
+            lambda conn: self._insert_activity(
+                conn, user_id, activity_type, language_code, score, max_score, xp_earned, **kwargs
+            )
+        )
+    
+    def record_activity(self, user_id: int, activity_type: str, language_code: str,
+                       score: int, max_score: int, xp_earned: int, **kwargs) -> bool:
+        """Registra atividade do usuário"""
+        try:
+            return self.record_activity_async(
+                user_id, activity_type, language_code, score, max_score, xp_earned, **kwargs
+            ).result()
+            
+        except Exception as e:
+            print(f"Erro ao registrar atividade: {e}")
+            return False
+    
+    def iter_activities(self, user_id: int = None, since: str = None,
+                        chunk_size: int = 500) -> Iterator[Activity]:
+        """Percorre as atividades em ordem cronológica sem carregar tudo na memória
+        
+        As linhas vêm do cursor em blocos de `chunk_size`; a conexão de leitura
+        (e seu snapshot do WAL) fica presa até o gerador terminar ou ser fechado.
+        """
+        conditions, params = [], []
+        if user_id is not None:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        if since is not None:
+            conditions.append("completed_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = Activity.row_factory
+                cursor.execute(f'''
+                    SELECT {Activity.select_list()} FROM user_activities
+                    {where}
+                    ORDER BY completed_at, id
+                ''', params)
+                yield from iter_rows(cursor, chunk_size)
+            
+        except sqlite3.Error as e:
+            print(f"Erro ao percorrer atividades: {e}")
+    
+    def get_activities_page(self, user_id: int, cursor: PageCursor = None,
+                            limit: int = 20) -> Page:
+        """Página de atividades do usuário, da mais recente para a mais antiga"""
+        try:
+            with self._reader() as conn:
+                return keyset_page(
+                    conn,
+                    f"SELECT {Activity.select_list()} FROM user_activities WHERE user_id = ?",
+                    'completed_at', (user_id,), cursor, limit, Activity.row_factory
+                )
+            
+        except Exception as e:
+            print(f"Erro ao obter atividades: {e}")
+            return Page([], None)
+    
+    def iter_vocabulary(self, source_language: str = None,
+                        chunk_size: int = 500) -> Iterator[VocabularyWord]:
+        """Percorre o vocabulário em blocos, para exportações"""
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = VocabularyWord.row_factory
+                if source_language:
+                    cursor.execute(f'''
+                        SELECT {VocabularyWord.select_list()} FROM vocabulary
+                        WHERE source_language = ?
+                        ORDER BY id
+                    ''', (source_language,))
+                else:
+                    cursor.execute(f"SELECT {VocabularyWord.select_list()} FROM vocabulary ORDER BY id")
+                yield from iter_rows(cursor, chunk_size)
+            
+        except sqlite3.Error as e:
+            print(f"Erro ao percorrer vocabulário: {e}")
+    
+    def reset_broken_streaks(self) -> bool:
+        """Zera os streaks de quem deixou de estudar, uma vez por dia"""
+        if self._streak_day == date.today():
+            return True
+        
+        try:
+            self._write(self._ensure_streak_day)
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao zerar streaks: {e}")
+            return False
+    
+    def get_daily_goal_progress(self, user_id: int, goal: int) -> Optional[Dict]:
+        """Obtém o XP de hoje em relação à meta diária"""
+        def load():
+            with self._reader() as conn:
+                return daily_rollup.read_days(conn, user_id, today, today)[0]
+        
+        try:
+            today = date.today()
+            # Cópia: o resultado em cache é compartilhado
+            totals = dict(self._cached(('daily_goal', user_id, today), ('user_daily_rollup',), load))
+            
+            totals['goal'] = goal
+            totals['progress'] = min(totals['xp'] / goal, 1.0) if goal > 0 else 1.0
+            totals['completed'] = totals['xp'] >= goal
+            return totals
+            
+        except Exception as e:
+            print(f"Erro ao obter meta diária: {e}")
+            return None
+    
+    def get_daily_series(self, user_id: int, days: int = 30) -> List[Dict]:
+        """Obtém os totais diários dos últimos dias (para gráficos)"""
+        try:
+            today = date.today()
+            with self._reader() as conn:
+                return daily_rollup.read_days(conn, user_id, today - timedelta(days=days - 1), today)
+            
+        except Exception as e:
+            print(f"Erro ao obter série diária: {e}")
+            return []
+    
+    def get_activity_heatmap(self, user_id: int, weeks: int = 12) -> List[List[Dict]]:
+        """Obtém o calendário de atividade em semanas de segunda a domingo"""
+        try:
+            today = date.today()
+            start = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+            end = start + timedelta(weeks=weeks, days=-1)
+            with self._reader() as conn:
+                days = daily_rollup.read_days(conn, user_id, start, end)
+            
+            return [days[index:index + 7] for index in range(0, len(days), 7)]
+            
+        except Exception as e:
+            print(f"Erro ao obter calendário de atividade: {e}")
+            return []
+    
+    def get_user_achievements(self, user_id: int) -> List[Dict]:
+        """Obtém as conquistas do usuário, das mais recentes para as mais antigas"""
+        def load():
+            with self._reader() as conn:
+                rows = conn.execute('''
+                    SELECT a.*, ua.earned_at
+                    FROM user_achievements ua
+                    JOIN achievements a ON a.id = ua.achievement_id
+                    WHERE ua.user_id = ?
+                    ORDER BY ua.earned_at DESC, ua.id DESC
+                ''', (user_id,)).fetchall()
+                return [dict(row) for row in rows]
+        
+        try:
+            return self._cached(('achievements', user_id), ('user_achievements', 'achievements'), load)
+            
+        except Exception as e:
+            print(f"Erro ao obter conquistas: {e}")
+            return []
+    
+    def record_translation_async(self, user_id: Optional[int], source_text: str,
+                                 translated_text: str, source_language: str,
+                                 target_language: str, translation_api: str = None) -> Future:
+        """Enfileira gravação de tradução no histórico"""
+        def job(conn):
+            conn.execute('''
+                INSERT INTO translation_history
+                (user_id, source_text, translated_text, source_language, target_language,
+                 translation_api)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (user_id, source_text, translated_text, source_language,
+                  target_language, translation_api))
+            if user_id:
+                daily_rollup.apply_translation(conn.cursor(), user_id, date.today(), target_language)
+            return True
+        
+        return self._submit_write(job, ('translation_history', 'user_daily_rollup'))
+    
+    def record_translation(self, user_id: Optional[int], source_text: str, translated_text: str,
+                           source_language: str, target_language: str,
+                           translation_api: str = None) -> bool:
+        """Grava tradução no histórico"""
+        try:
+            return self.record_translation_async(
+                user_id, source_text, translated_text, source_language,
+                target_language, translation_api
+            ).result()
+            
+        except Exception as e:
+            print(f"Erro ao registrar tradução: {e}")
+            return False
+    
+    def get_translation_history_page(self, user_id: int, cursor: PageCursor = None,
+                                     limit: int = 20) -> Page:
+        """Página do histórico de traduções, da mais recente para a mais antiga"""
+        try:
+            with self._reader() as conn:
+                return keyset_page(
+                    conn,
+                    '''SELECT id, source_text, translated_text, source_language,
+                              target_language, translation_api, created_at
+                       FROM translation_history WHERE user_id = ?''',
+                    'created_at', (user_id,), cursor, limit
+                )
+            
+        except Exception as e:
+            print(f"Erro ao obter histórico de traduções: {e}")
+            return Page([], None)
+    
+    def clear_translation_history(self, user_id: int) -> bool:
+        """Apaga o histórico de traduções do usuário"""
+        try:
+            return self._write(lambda conn: conn.execute(
+                "DELETE FROM translation_history WHERE user_id = ?", (user_id,)
+            ).rowcount, ('translation_history',))
+            
+        except Exception as e:
+            print(f"Erro ao limpar histórico de traduções: {e}")
+            return False
+    
+    def add_favorite(self, user_id: int, vocabulary_id: int) -> bool:
+        """Marca uma palavra como favorita"""
+        try:
+            self._write(lambda conn: conn.execute('''
+                INSERT OR IGNORE INTO user_favorites (user_id, vocabulary_id)
+                VALUES (?, ?)
+            ''', (user_id, vocabulary_id)), ('user_favorites',))
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao adicionar favorito: {e}")
+            return False
+    
+    def remove_favorite(self, user_id: int, vocabulary_id: int) -> bool:
+        """Remove uma palavra dos favoritos"""
+        try:
+            self._write(lambda conn: conn.execute(
+                "DELETE FROM user_favorites WHERE user_id = ? AND vocabulary_id = ?",
+                (user_id, vocabulary_id)
+            ), ('user_favorites',))
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao remover favorito: {e}")
+            return False
+    
+    def get_favorites_page(self, user_id: int, cursor: PageCursor = None,
+                           limit: int = 20) -> Page:
+        """Página de palavras favoritas, das incluídas por último às primeiras"""
+        try:
+            with self._reader() as conn:
+                return keyset_page(
+                    conn,
+                    '''SELECT f.id, f.added_at, v.id AS vocabulary_id, v.word, v.translation,
+                              v.source_language, v.target_language, v.pronunciation
+                       FROM user_favorites f
+                       JOIN vocabulary v ON v.id = f.vocabulary_id
+                       WHERE f.user_id = ?''',
+                    'f.added_at', (user_id,), cursor, limit, id_column='f.id'
+                )
+            
+        except Exception as e:
+            print(f"Erro ao obter favoritos: {e}")
+            return Page([], None)
+    
+    def apply_retention(self, retention_days: int, batch_size: int = 500,
+                        archive_dir=None) -> Dict[str, int]:
+        """Remove o histórico detalhado mais antigo que retention_days
+        
+        Cada lote é lido por uma conexão de leitura, opcionalmente copiado para
+        archive_dir e apagado em um job curto da fila de escrita, de modo que
+        outras escritas nunca esperam pela limpeza inteira.
+        
+        Returns:
+            Dict tabela → linhas removidas
+        """
+        if retention_days <= 0:
+            # Retenção desativada: nada expira
+            return {table: 0 for table in retention.RETAINED_TABLES}
+        
+        results = {}
+        if not self._retention_lock.acquire(blocking=False):
+            return results  # Outra limpeza já está em andamento
+        
+        try:
+            cutoff = retention.cutoff_timestamp(retention_days)
+            for table in retention.RETAINED_TABLES:
+                removed = 0
+                while True:
+                    with self._reader() as conn:
+                        rows = retention.select_expired(conn, table, cutoff, batch_size)
+                    if not rows:
+                        break
+                    
+                    if archive_dir:
+                        retention.archive_rows(archive_dir, table, rows)
+                    removed += self._write(
+                        lambda conn, rows=rows, table=table: retention.delete_rows(conn.cursor(), table, rows)
+                    )
+                    
+                    if len(rows) < batch_size:
+                        break
+                
+                results[table] = removed
+            
+        except Exception as e:
+            print(f"Erro ao aplicar retenção do histórico: {e}")
+        finally:
+            self._retention_lock.release()
+        
+        return results
+    
+    def get_user_stats(self, user_id: int) -> Dict:
+        """Obtém estatísticas agregadas do usuário sem varrer o histórico"""
+        def load():
+            with self._reader() as conn:
+                return user_stats.read_stats(conn, user_id)
+        
+        try:
+            return self._cached(('stats', user_id), ('user_stats', 'user_language_stats'), load)
+            
+        except Exception as e:
+            print(f"Erro ao obter estatísticas: {e}")
+            return {}
+    
+    def rebuild_user_stats(self, user_id: int = None) -> bool:
+        """Recalcula as estatísticas agregadas a partir do histórico de atividades"""
+        try:
+            self._write(lambda conn: user_stats.rebuild(conn.cursor(), user_id))
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao recalcular estatísticas: {e}")
+            return False
+    
+    def _loaded_leaderboard(self) -> Leaderboard:
+        """Retorna o ranking, carregando-o do banco na primeira consulta"""
+        if not self.leaderboard.loaded:
+            with self._reader() as conn:
+                self.leaderboard.load(conn)
+        return self.leaderboard
+    
+    def get_leaderboard_top(self, limit: int = 10) -> List[Dict]:
+        """Obtém os primeiros colocados do ranking global"""
+        try:
+            return self._loaded_leaderboard().top(limit)
+            
+        except Exception as e:
+            print(f"Erro ao obter ranking: {e}")
+            return []
+    
+    def get_leaderboard_page(self, page: int = 0) -> List[Dict]:
+        """Obtém uma página do ranking global"""
+        try:
+            return self._loaded_leaderboard().page(page)
+            
+        except Exception as e:
+            print(f"Erro ao obter página do ranking: {e}")
+            return []
+    
+    def get_user_rank(self, user_id: int) -> Optional[int]:
+        """Obtém a posição do usuário no ranking global"""
+        try:
+            return self._loaded_leaderboard().rank(user_id)
+            
+        except Exception as e:
+            print(f"Erro ao obter posição no ranking: {e}")
+            return None
+    
+    def get_users_around(self, user_id: int, radius: int = 5) -> List[Dict]:
+        """Obtém os usuários logo acima e abaixo no ranking global"""
+        try:
+            return self._loaded_leaderboard().around(user_id, radius)
+            
+        except Exception as e:
+            print(f"Erro ao obter vizinhos no ranking: {e}")
+            return []
+    
+    def rollover_leagues(self) -> bool:
+        """Fecha a semana das ligas se ela já terminou"""
+        if self._league_week == leagues.current_week():
+            return True
+        
+        try:
+            self._write(self._ensure_league_week)
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao virar a semana das ligas: {e}")
+            return False
+    
+    def get_league_standings(self, user_id: int) -> Optional[Dict]:
+        """Obtém a classificação do grupo de liga do usuário nesta semana"""
+        try:
+            self.rollover_leagues()
+            with self._reader() as conn:
+                return leagues.read_standings(conn, user_id)
+            
+        except Exception as e:
+            print(f"Erro ao obter liga: {e}")
+            return None
\ No newline at end of file
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ranking Global do LinguaMaster Pro
+Índice ordenado de XP em memória com consultas de posição em O(log n)
+"""
+
+import bisect
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+class Leaderboard:
+    """Ranking global de XP mantido em memória
+    
+    Os usuários ficam em uma lista ordenada de chaves (-xp, user_id). A posição
+    de um usuário sai de uma busca binária, e top-K ou "usuários ao redor"
+    são fatias da lista. As páginas do top ficam em cache e só as páginas
+    afetadas por uma mudança de XP são descartadas.
+    
+    O cache guarda só a fatia de chaves; posição (que muda para um grupo de
+    empate inteiro quando alguém entra ou sai dele) e nome são calculados a
+    cada leitura.
+    """
+    
+    def __init__(self, page_size: int = 20):
+        self.page_size = page_size
+        self._keys: List[Tuple[int, int]] = []
+        self._xp: Dict[int, int] = {}
+        self._names: Dict[int, str] = {}
+        self._pages: Dict[int, List[Tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+        self.loaded = False
+    
+    def load(self, connection: sqlite3.Connection):
+        """Carrega o ranking a partir da tabela users"""
+        with self._lock:
+            if self.loaded:
+                return
+            
+            rows = connection.execute('''
+                SELECT id, username, total_xp FROM users
+                WHERE is_active = 1
+                ORDER BY total_xp DESC, id
+            ''').fetchall()
+            
+            # As linhas já chegam na ordem das chaves, sem precisar ordenar
+            self._keys = [(-row[2], row[0]) for row in rows]
+            self._xp = {row[0]: row[2] for row in rows}
+            self._names = {row[0]: row[1] for row in rows}
+            self._pages.clear()
+            self.loaded = True
+    
+    def reset(self):
+        """Descarta o ranking em memória (recarregado na próxima consulta)"""
+        with self._lock:
+            self._keys = []
+            self._xp.clear()
+            self._names.clear()
+            self._pages.clear()
+            self.loaded = False
+    
+    def _invalidate_range(self, first: int, last: int):
+        """Descarta as páginas em cache que cobrem as posições first..last"""
+        first_page = first // self.page_size
+        last_page = last // self.page_size
+        for page in [page for page in self._pages if first_page <= page <= last_page]:
+            del self._pages[page]
+    
+    def update(self, user_id: int, total_xp: int, username: str = None):
+        """Atualiza o XP de um usuário após o commit"""
+        with self._lock:
+            if not self.loaded:
+                # A carga inicial vai ler o valor já gravado
+                return
+            
+            if username is not None:
+                self._names[user_id] = username
+            
+            old_xp = self._xp.get(user_id)
+            if old_xp == total_xp:
+                return
+            
+            if old_xp is not None:
+                old_pos = bisect.bisect_left(self._keys, (-old_xp, user_id))
+                del self._keys[old_pos]
+            else:
+                # Usuário novo desloca todas as posições abaixo dele
+                old_pos = len(self._keys)
+            
+            new_key = (-total_xp, user_id)
+            new_pos = bisect.bisect_left(self._keys, new_key)
+            self._keys.insert(new_pos, new_key)
+            self._xp[user_id] = total_xp
+            
+            # Só as posições entre a antiga e a nova mudam
+            self._invalidate_range(min(old_pos, new_pos), max(old_pos, new_pos))
+    
+    def remove(self, user_id: int):
+        """Remove um usuário do ranking"""
+        with self._lock:
+            if not self.loaded or user_id not in self._xp:
+                return
+            
+            pos = bisect.bisect_left(self._keys, (-self._xp.pop(user_id), user_id))
+            del self._keys[pos]
+            self._names.pop(user_id, None)
+            self._invalidate_range(pos, len(self._keys))
+    
+    def _entries(self, start: int, keys: List[Tuple[int, int]]) -> List[Dict]:
+        """Monta as entradas públicas de chaves consecutivas a partir de `start`"""
+        entries = []
+        rank = None
+        previous_xp = None
+        for offset, (neg_xp, user_id) in enumerate(keys):
+            if rank is None:
+                rank = self._rank_of_xp(-neg_xp)
+            elif neg_xp != previous_xp:
+                # Fim de um grupo de empate: a posição volta a ser a da lista
+                rank = start + offset + 1
+            previous_xp = neg_xp
+            entries.append({
+                'rank': rank,
+                'user_id': user_id,
+                'username': self._names.get(user_id),
+                'total_xp': -neg_xp
+            })
+        return entries
+    
+    def _rank_of_xp(self, total_xp: int) -> int:
+        """Posição de quem tem esse XP (empates dividem a mesma posição)"""
+        return bisect.bisect_left(self._keys, (-total_xp, -1)) + 1
+    
+    def rank(self, user_id: int) -> Optional[int]:
+        """Posição do usuário no ranking (1 = primeiro)"""
+        with self._lock:
+            total_xp = self._xp.get(user_id)
+            if total_xp is None:
+                return None
+            return self._rank_of_xp(total_xp)
+    
+    def page(self, page_number: int) -> List[Dict]:
+        """Página do top (0 = primeiros page_size usuários), com cache"""
+        with self._lock:
+            start = page_number * self.page_size
+            keys = self._pages.get(page_number)
+            if keys is None:
+                keys = self._keys[start:start + self.page_size]
+                self._pages[page_number] = keys
+            return self._entries(start, keys)
+    
+    def top(self, k: int) -> List[Dict]:
+        """Os K primeiros colocados"""
+        entries = []
+        page_number = 0
+        while len(entries) < k:
+            page = self.page(page_number)
+            if not page:
+                break
+            entries.extend(page)
+            page_number += 1
+        return entries[:k]
+    
+    def around(self, user_id: int, radius: int = 5) -> List[Dict]:
+        """Usuários imediatamente acima e abaixo de um usuário"""
+        with self._lock:
+            total_xp = self._xp.get(user_id)
+            if total_xp is None:
+                return []
+            
+            position = bisect.bisect_left(self._keys, (-total_xp, user_id))
+            start = max(0, position - radius)
+            end = min(len(self._keys), position + radius + 1)
+            return self._entries(start, self._keys[start:end])
+    
+    def __len__(self) -> int:
+        return len(self._keys)
\ No newline at end of file
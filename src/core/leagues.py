@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ligas Semanais do LinguaMaster Pro
+Grupos de ~30 usuários por divisão, com promoção e rebaixamento a cada semana
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+# Divisões da mais baixa para a mais alta
+LEAGUE_TIERS = [
+    "Bronze", "Prata", "Ouro", "Safira", "Rubi",
+    "Esmeralda", "Ametista", "Pérola", "Obsidiana", "Diamante"
+]
+
+COHORT_SIZE = 30
+PROMOTION_SLOTS = 7
+DEMOTION_SLOTS = 5
+
+# Semanas de weekly_xp mantidas além da semana corrente
+WEEKS_TO_KEEP = 4
+
+def current_week(today: Optional[date] = None) -> str:
+    """Segunda-feira da semana (ISO) em que `today` cai"""
+    today = today or date.today()
+    return (today - timedelta(days=today.weekday())).isoformat()
+
+def get_active_week(connection: sqlite3.Connection) -> Optional[str]:
+    """Semana em que as ligas estão, conforme a última virada"""
+    row = connection.execute(
+        "SELECT value FROM app_meta WHERE key = 'league_week'"
+    ).fetchone()
+    return row[0] if row else None
+
+def add_weekly_xp(cursor: sqlite3.Cursor, user_id: int, week: str, xp_gained: int):
+    """Soma XP ao contador semanal do usuário"""
+    cursor.execute('''
+        INSERT INTO weekly_xp (week_start, user_id, xp) VALUES (?, ?, ?)
+        ON CONFLICT (week_start, user_id) DO UPDATE SET xp = xp + excluded.xp
+    ''', (week, user_id, xp_gained))
+
+def join_league(cursor: sqlite3.Cursor, user_id: int, week: str):
+    """Coloca na divisão inicial um usuário que ainda não joga a semana corrente"""
+    row = cursor.execute(
+        "SELECT week_start FROM league_members WHERE user_id = ?", (user_id,)
+    ).fetchone()
+    if row and row[0] == week:
+        return
+    
+    # Completa o último grupo da divisão inicial ou abre um novo
+    cohort = cursor.execute('''
+        SELECT MAX(cohort) FROM league_members WHERE week_start = ? AND tier = 0
+    ''', (week,)).fetchone()[0]
+    if cohort is None:
+        cohort = 0
+    else:
+        size = cursor.execute('''
+            SELECT COUNT(*) FROM league_members
+            WHERE week_start = ? AND tier = 0 AND cohort = ?
+        ''', (week, cohort)).fetchone()[0]
+        if size >= COHORT_SIZE:
+            cohort += 1
+    
+    cursor.execute('''
+        INSERT OR REPLACE INTO league_members (user_id, week_start, tier, cohort)
+        VALUES (?, ?, 0, ?)
+    ''', (user_id, week, cohort))
+
+def rollover(cursor: sqlite3.Cursor, new_week: str) -> Dict:
+    """Fecha a semana anterior e monta os grupos da nova semana em lote
+    
+    Tudo roda em poucas instruções SQL sobre o conjunto inteiro: as posições
+    de cada grupo saem de funções de janela e os novos grupos de uma ordenação
+    por divisão e XP, sem consultas por usuário.
+    
+    Returns:
+        Dict com 'week', 'members', 'promoted' e 'demoted'
+    """
+    old_week = get_active_week(cursor.connection)
+    if old_week == new_week:
+        return {'week': new_week, 'members': 0, 'promoted': 0, 'demoted': 0}
+    
+    max_tier = len(LEAGUE_TIERS) - 1
+    
+    # 1. Resultado final de cada grupo da semana que terminou
+    cursor.execute('''
+        WITH standings AS (
+            SELECT m.user_id, m.tier, m.cohort, COALESCE(w.xp, 0) AS xp,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY m.tier, m.cohort
+                       ORDER BY COALESCE(w.xp, 0) DESC, m.user_id
+                   ) AS position,
+                   COUNT(*) OVER (PARTITION BY m.tier, m.cohort) AS cohort_size
+            FROM league_members m
+            LEFT JOIN weekly_xp w
+                   ON w.week_start = m.week_start AND w.user_id = m.user_id
+            WHERE m.week_start = ?
+        )
+        INSERT OR REPLACE INTO league_history
+        (week_start, user_id, tier, cohort, xp, position, new_tier)
+        SELECT ?, user_id, tier, cohort, xp, position,
+               CASE
+                   WHEN position <= ? AND xp > 0 AND tier < ? THEN tier + 1
+                   WHEN (position > cohort_size - ? AND position > ? OR xp = 0)
+                        AND tier > 0 THEN tier - 1
+                   ELSE tier
+               END
+        FROM standings
+    ''', (old_week, old_week, PROMOTION_SLOTS, max_tier, DEMOTION_SLOTS, PROMOTION_SLOTS))
+    
+    promoted, demoted = cursor.execute('''
+        SELECT COALESCE(SUM(new_tier > tier), 0), COALESCE(SUM(new_tier < tier), 0)
+        FROM league_history WHERE week_start = ?
+    ''', (old_week,)).fetchone()
+    
+    # 2. Novos grupos: usuários ativos ordenados por divisão e pelo XP da
+    # semana anterior, divididos em grupos de tamanho equilibrado
+    cursor.execute("DELETE FROM league_members")
+    before = cursor.connection.total_changes
+    cursor.execute('''
+        WITH players AS (
+            SELECT u.id AS user_id,
+                   COALESCE(h.new_tier, 0) AS tier,
+                   COALESCE(h.xp, 0) AS xp
+            FROM users u
+            LEFT JOIN league_history h
+                   ON h.week_start = ? AND h.user_id = u.id
+            WHERE u.is_active = 1
+        ),
+        ranked AS (
+            SELECT user_id, tier,
+                   ROW_NUMBER() OVER (PARTITION BY tier ORDER BY xp DESC, user_id) - 1 AS idx,
+                   COUNT(*) OVER (PARTITION BY tier) AS tier_size
+            FROM players
+        )
+        INSERT INTO league_members (user_id, week_start, tier, cohort)
+        SELECT user_id, ?, tier,
+               idx * ((tier_size + ? - 1) / ?) / tier_size
+        FROM ranked
+    ''', (old_week, new_week, COHORT_SIZE, COHORT_SIZE))
+    members = cursor.connection.total_changes - before
+    
+    # 3. Contadores semanais antigos não são mais necessários
+    oldest = (date.fromisoformat(new_week) - timedelta(weeks=WEEKS_TO_KEEP)).isoformat()
+    cursor.execute("DELETE FROM weekly_xp WHERE week_start < ?", (oldest,))
+    
+    cursor.execute('''
+        INSERT INTO app_meta (key, value) VALUES ('league_week', ?)
+        ON CONFLICT (key) DO UPDATE SET value = excluded.value
+    ''', (new_week,))
+    
+    return {'week': new_week, 'members': members, 'promoted': promoted, 'demoted': demoted}
+
+def read_standings(connection: sqlite3.Connection, user_id: int) -> Optional[Dict]:
+    """Classificação do grupo do usuário na semana corrente"""
+    member = connection.execute(
+        "SELECT week_start, tier, cohort FROM league_members WHERE user_id = ?", (user_id,)
+    ).fetchone()
+    if member is None:
+        return None
+    
+    week, tier, cohort = member[0], member[1], member[2]
+    rows = connection.execute('''
+        SELECT m.user_id, u.username, COALESCE(w.xp, 0) AS xp
+        FROM league_members m
+        JOIN users u ON u.id = m.user_id
+        LEFT JOIN weekly_xp w ON w.week_start = m.week_start AND w.user_id = m.user_id
+        WHERE m.week_start = ? AND m.tier = ? AND m.cohort = ?
+        ORDER BY xp DESC, m.user_id
+    ''', (week, tier, cohort)).fetchall()
+    
+    members = []
+    for position, row in enumerate(rows, start=1):
+        members.append({
+            'position': position,
+            'user_id': row['user_id'],
+            'username': row['username'],
+            'xp': row['xp']
+        })
+    
+    return {
+        'week_start': week,
+        'tier': tier,
+        'tier_name': LEAGUE_TIERS[tier],
+        'cohort': cohort,
+        'promotion_slots': PROMOTION_SLOTS if tier < len(LEAGUE_TIERS) - 1 else 0,
+        'demotion_slots': DEMOTION_SLOTS if tier > 0 else 0,
+        'members': members
+    }
\ No newline at end of file
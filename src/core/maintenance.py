@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manutenção do Banco do LinguaMaster Pro
+PRAGMA optimize, ANALYZE periódico, vacuum incremental e checkpoint do WAL
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# Valor de PRAGMA auto_vacuum para o modo incremental
+AUTO_VACUUM_INCREMENTAL = 2
+
+def database_size(db_path: Path) -> Dict[str, int]:
+    """Tamanho em bytes do arquivo principal e do WAL"""
+    db_path = Path(db_path)
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    return {
+        'db': db_path.stat().st_size if db_path.exists() else 0,
+        'wal': wal_path.stat().st_size if wal_path.exists() else 0,
+    }
+
+def optimize(connection: sqlite3.Connection, analysis_limit: int = 400) -> Dict:
+    """PRAGMA optimize com amostragem limitada (só analisa o que mudou)"""
+    connection.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+    connection.execute("PRAGMA optimize")
+    return {}
+
+def analyze(connection: sqlite3.Connection, interval_days: int = 7) -> Dict:
+    """ANALYZE completo se o último tiver mais de `interval_days` dias"""
+    row = connection.execute(
+        "SELECT value FROM app_meta WHERE key = 'last_analyze'"
+    ).fetchone()
+    now = datetime.now()
+    if row and datetime.fromisoformat(row[0]) > now - timedelta(days=interval_days):
+        return {'skipped': True}
+    
+    # Sem limite de amostragem: o ANALYZE periódico vê as tabelas inteiras
+    connection.execute("PRAGMA analysis_limit = 0")
+    connection.execute("ANALYZE")
+    connection.execute(
+        "INSERT OR REPLACE INTO app_meta (key, value) VALUES ('last_analyze', ?)",
+        (now.isoformat(timespec='seconds'),)
+    )
+    return {'skipped': False}
+
+def incremental_vacuum(connection: sqlite3.Connection, max_pages: int = 1000) -> Dict:
+    """Devolve ao sistema até `max_pages` páginas livres
+    
+    Bancos criados antes do modo incremental são convertidos com um VACUUM
+    completo na primeira execução; depois disso cada rodada é limitada.
+    """
+    converted = False
+    if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.execute("VACUUM")
+        converted = True
+    
+    before = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    # execute() para após liberar a primeira página; executescript() roda o
+    # comando até o fim
+    connection.executescript(f"PRAGMA incremental_vacuum({int(max_pages)})")
+    after = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    return {'converted': converted, 'pages_freed': before - after, 'free_pages': after}
+
+def checkpoint(connection: sqlite3.Connection) -> Dict:
+    """Checkpoint do WAL, truncando o arquivo se nenhum leitor o estiver usando"""
+    busy, log_frames, checkpointed = connection.execute(
+        "PRAGMA wal_checkpoint(TRUNCATE)"
+    ).fetchone()
+    return {'busy': bool(busy), 'log_frames': log_frames, 'checkpointed': checkpointed}
+
+# Etapas de uma rodada, na ordem em que são executadas
+MAINTENANCE_TASKS = {
+    'optimize': optimize,
+    'analyze': analyze,
+    'incremental_vacuum': incremental_vacuum,
+    'checkpoint': checkpoint,
+}
+
+class MaintenanceDaemon:
+    """Roda a manutenção do banco em segundo plano, nos intervalos ociosos"""
+    
+    def __init__(self, db_manager, interval: float = 1800, analyze_interval_days: int = 7,
+                 vacuum_pages: int = 1000, is_busy: Optional[Callable[[], bool]] = None,
+                 logger=None):
+        self.db_manager = db_manager
+        self.interval = interval
+        self.analyze_interval_days = analyze_interval_days
+        self.vacuum_pages = vacuum_pages
+        self.is_busy = is_busy or (lambda: False)
+        self.logger = logger
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_run: Optional[float] = None
+    
+    def _log(self, level: str, message: str):
+        """Registra no Logger da aplicação, se houver"""
+        if self.logger:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+    
+    def start(self):
+        """Inicia a thread de manutenção"""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="DatabaseMaintenance", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = None):
+        """Interrompe a thread (a etapa em andamento termina antes)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _wait_until_idle(self) -> bool:
+        """Espera o usuário sair da lição ou do jogo; False se for parado"""
+        while self.is_busy():
+            if self._stop.wait(5):
+                return False
+        return True
+    
+    def _run(self):
+        """Laço da thread: no máximo uma rodada por intervalo"""
+        while not self._stop.wait(self.interval):
+            if self._wait_until_idle():
+                self.run_once()
+    
+    def _task_options(self, name: str) -> Dict:
+        """Parâmetros configuráveis de cada etapa"""
+        if name == 'analyze':
+            return {'interval_days': self.analyze_interval_days}
+        if name == 'incremental_vacuum':
+            return {'max_pages': self.vacuum_pages}
+        return {}
+    
+    def run_once(self) -> Dict[str, Dict]:
+        """Executa uma rodada completa, pausando entre etapas se o usuário voltar"""
+        results = {}
+        before = database_size(self.db_manager.db_path)
+        started = time.perf_counter()
+        
+        for name in MAINTENANCE_TASKS:
+            if not self._wait_until_idle():
+                break
+            
+            step_started = time.perf_counter()
+            try:
+                result = self.db_manager.run_maintenance_task(name, **self._task_options(name))
+            except Exception as e:
+                self._log('error', f"Erro na manutenção ({name}): {e}")
+                continue
+            result['seconds'] = round(time.perf_counter() - step_started, 3)
+            results[name] = result
+            self._log('debug', f"Manutenção {name}: {result}")
+        
+        after = database_size(self.db_manager.db_path)
+        self.last_run = time.time()
+        self._log('info', (
+            f"Manutenção do banco em {time.perf_counter() - started:.2f}s: "
+            f"arquivo {before['db'] / 1024:.0f} KB -> {after['db'] / 1024:.0f} KB, "
+            f"WAL {before['wal'] / 1024:.0f} KB -> {after['wal'] / 1024:.0f} KB"
+        ))
+        return results
\ No newline at end of file
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Migrações de Esquema do LinguaMaster Pro
+Aplica alterações numeradas no banco controladas por PRAGMA user_version
+"""
+
+import sqlite3
+from typing import Callable, List, NamedTuple
+
+class Migration(NamedTuple):
+    """Migração numerada do esquema"""
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+# Conquistas padrão inseridas na criação do banco
+DEFAULT_ACHIEVEMENTS = [
+    ("Primeiro Passo", "Complete sua primeira lição", "🎯", "progress", "lessons_completed", 1, 10),
+    ("Estudioso", "Complete 10 lições", "📚", "progress", "lessons_completed", 10, 50),
+    ("Poliglota", "Aprenda 3 idiomas diferentes", "🌍", "languages", "languages_learned", 3, 100),
+    ("Streak de Fogo", "Mantenha um streak de 7 dias", "🔥", "streak", "current_streak", 7, 75),
+    ("Mestre das Palavras", "Aprenda 100 palavras", "📖", "vocabulary", "words_learned", 100, 150),
+    ("Velocista", "Complete uma lição em menos de 2 minutos", "⚡", "speed", "lesson_time", 120, 25),
+    ("Perfeccionista", "Obtenha 100% de acerto em 5 lições", "💯", "accuracy", "perfect_lessons", 5, 100),
+    ("Madrugador", "Estude antes das 8h da manhã", "🌅", "time", "early_study", 1, 30),
+    ("Coruja", "Estude depois das 22h", "🦉", "time", "late_study", 1, 30),
+    ("Guerreiro", "Vença 10 batalhas de vocabulário", "⚔️", "battles", "battles_won", 10, 80)
+]
+
+def _migration_001_base_schema(cursor: sqlite3.Cursor):
+    """Esquema inicial: tabelas principais e conquistas padrão"""
+    # Bancos criados antes das migrações já têm estas tabelas (user_version 0),
+    # por isso a DDL continua idempotente
+    
+    # Tabela de usuários
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            email TEXT UNIQUE,
+            password_hash TEXT NOT NULL,
+            full_name TEXT,
+            native_language TEXT DEFAULT 'pt',
+            learning_languages TEXT DEFAULT '[]',
+            level INTEGER DEFAULT 1,
+            total_xp INTEGER DEFAULT 0,
+            current_streak INTEGER DEFAULT 0,
+            longest_streak INTEGER DEFAULT 0,
+            last_activity DATE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1,
+            profile_picture TEXT,
+            preferences TEXT DEFAULT '{}'
+        )
+    ''')
+    
+    # Tabela de progresso por idioma
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_language_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            language_code TEXT NOT NULL,
+            level INTEGER DEFAULT 1,
+            xp INTEGER DEFAULT 0,
+            lessons_completed INTEGER DEFAULT 0,
+            words_learned INTEGER DEFAULT 0,
+            accuracy_rate REAL DEFAULT 0.0,
+            time_studied INTEGER DEFAULT 0,
+            last_lesson_date DATE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            UNIQUE(user_id, language_code)
+        )
+    ''')
+    
+    # Tabela de vocabulário
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS vocabulary (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            word TEXT NOT NULL,
+            translation TEXT NOT NULL,
+            source_language TEXT NOT NULL,
+            target_language TEXT NOT NULL,
+            difficulty_level TEXT DEFAULT 'beginner',
+            category TEXT,
+            pronunciation TEXT,
+            example_sentence TEXT,
+            example_translation TEXT,
+            image_url TEXT,
+            audio_url TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(word, source_language, target_language)
+        )
+    ''')
+    
+    # Tabela de lições
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS lessons (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            language_code TEXT NOT NULL,
+            difficulty_level TEXT NOT NULL,
+            lesson_order INTEGER,
+            vocabulary_ids TEXT,
+            xp_reward INTEGER DEFAULT 50,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Tabela de atividades/jogos dos usuários
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_activities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            activity_type TEXT NOT NULL,
+            language_code TEXT NOT NULL,
+            score INTEGER DEFAULT 0,
+            max_score INTEGER DEFAULT 0,
+            xp_earned INTEGER DEFAULT 0,
+            time_spent INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            total_questions INTEGER DEFAULT 0,
+            difficulty_level TEXT,
+            details TEXT DEFAULT '{}',
+            completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    
+    # Tabela de conquistas
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS achievements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            description TEXT NOT NULL,
+            icon TEXT,
+            category TEXT,
+            requirement_type TEXT NOT NULL,
+            requirement_value INTEGER NOT NULL,
+            xp_reward INTEGER DEFAULT 0,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Tabela de conquistas dos usuários
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_achievements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            achievement_id INTEGER NOT NULL,
+            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (achievement_id) REFERENCES achievements (id),
+            UNIQUE(user_id, achievement_id)
+        )
+    ''')
+    
+    # Tabela de palavras favoritas
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_favorites (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            vocabulary_id INTEGER NOT NULL,
+            added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (vocabulary_id) REFERENCES vocabulary (id),
+            UNIQUE(user_id, vocabulary_id)
+        )
+    ''')
+    
+    # Tabela de histórico de traduções
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS translation_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            source_text TEXT NOT NULL,
+            translated_text TEXT NOT NULL,
+            source_language TEXT NOT NULL,
+            target_language TEXT NOT NULL,
+            translation_api TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    
+    # Tabela de desafios diários
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_challenges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            challenge_date DATE NOT NULL,
+            challenge_type TEXT NOT NULL,
+            language_code TEXT NOT NULL,
+            difficulty_level TEXT NOT NULL,
+            target_score INTEGER DEFAULT 100,
+            xp_reward INTEGER DEFAULT 25,
+            description TEXT,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(challenge_date, challenge_type, language_code)
+        )
+    ''')
+    
+    # Tabela de participação em desafios
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_daily_challenges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            challenge_id INTEGER NOT NULL,
+            score INTEGER DEFAULT 0,
+            completed BOOLEAN DEFAULT 0,
+            completed_at TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (challenge_id) REFERENCES daily_challenges (id),
+            UNIQUE(user_id, challenge_id)
+        )
+    ''')
+    
+    
+    cursor.executemany('''
+        INSERT OR IGNORE INTO achievements 
+        (name, description, icon, category, requirement_type, requirement_value, xp_reward)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', DEFAULT_ACHIEVEMENTS)
+
+def _migration_002_hot_query_indexes(cursor: sqlite3.Cursor):
+    """Índices para as consultas mais frequentes"""
+    # Sorteio de vocabulário por idioma e nível; o rowid (id) já vem no índice,
+    # então a lista de ids sai só do índice
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_vocabulary_language_difficulty
+        ON vocabulary (target_language, difficulty_level)
+    ''')
+    
+    # Atividades recentes e histórico por usuário em ordem de tempo
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_activities_user_time
+        ON user_activities (user_id, completed_at)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_translation_history_user_time
+        ON translation_history (user_id, created_at)
+    ''')
+    
+    # user_language_progress já é atendida pelo índice de UNIQUE(user_id, language_code)
+    cursor.execute("ANALYZE")
+
+def _migration_003_vocabulary_imports(cursor: sqlite3.Cursor):
+    """Registro dos pacotes de vocabulário importados"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS vocabulary_imports (
+            source TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            word_count INTEGER DEFAULT 0,
+            imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+def _migration_004_user_stats(cursor: sqlite3.Cursor):
+    """Agregados por usuário mantidos junto com cada atividade"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_stats (
+            user_id INTEGER PRIMARY KEY,
+            activities INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            total_questions INTEGER DEFAULT 0,
+            time_spent INTEGER DEFAULT 0,
+            xp_earned INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_language_stats (
+            user_id INTEGER NOT NULL,
+            language_code TEXT NOT NULL,
+            activities INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            total_questions INTEGER DEFAULT 0,
+            time_spent INTEGER DEFAULT 0,
+            xp_earned INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, language_code),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        ) WITHOUT ROWID
+    ''')
+    
+    # Preenche os agregados com o histórico já existente
+    cursor.execute('''
+        INSERT OR REPLACE INTO user_stats
+        (user_id, activities, correct_answers, total_questions, time_spent, xp_earned)
+        SELECT user_id, COUNT(*), SUM(correct_answers), SUM(total_questions),
+               SUM(time_spent), SUM(xp_earned)
+        FROM user_activities
+        GROUP BY user_id
+    ''')
+    
+    cursor.execute('''
+        INSERT OR REPLACE INTO user_language_stats
+        (user_id, language_code, activities, correct_answers, total_questions,
+         time_spent, xp_earned)
+        SELECT user_id, language_code, COUNT(*), SUM(correct_answers),
+               SUM(total_questions), SUM(time_spent), SUM(xp_earned)
+        FROM user_activities
+        GROUP BY user_id, language_code
+    ''')
+
+def _migration_005_leaderboard_index(cursor: sqlite3.Cursor):
+    """Índice do ranking global por XP"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_total_xp
+        ON users (total_xp DESC, id)
+    ''')
+
+def _migration_006_weekly_leagues(cursor: sqlite3.Cursor):
+    """Ligas semanais: XP por semana, grupos atuais e resultados anteriores"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS weekly_xp (
+            week_start TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            xp INTEGER DEFAULT 0,
+            PRIMARY KEY (week_start, user_id),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        ) WITHOUT ROWID
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS league_members (
+            user_id INTEGER PRIMARY KEY,
+            week_start TEXT NOT NULL,
+            tier INTEGER DEFAULT 0,
+            cohort INTEGER DEFAULT 0,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_league_members_cohort
+        ON league_members (week_start, tier, cohort)
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS league_history (
+            week_start TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            tier INTEGER NOT NULL,
+            cohort INTEGER NOT NULL,
+            xp INTEGER DEFAULT 0,
+            position INTEGER,
+            new_tier INTEGER NOT NULL,
+            PRIMARY KEY (week_start, user_id),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        ) WITHOUT ROWID
+    ''')
+
+def _migration_007_streak_index(cursor: sqlite3.Cursor):
+    """Índice parcial dos streaks ativos, usado na virada do dia"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_active_streak
+        ON users (last_activity) WHERE current_streak > 0
+    ''')
+
+def _migration_008_achievement_counters(cursor: sqlite3.Cursor):
+    """Contadores usados pelas conquistas de lições perfeitas e batalhas"""
+    cursor.execute("ALTER TABLE user_stats ADD COLUMN perfect_lessons INTEGER DEFAULT 0")
+    cursor.execute("ALTER TABLE user_stats ADD COLUMN battles_won INTEGER DEFAULT 0")
+    
+    cursor.execute('''
+        UPDATE user_stats SET
+            perfect_lessons = (
+                SELECT COUNT(*) FROM user_activities a
+                WHERE a.user_id = user_stats.user_id
+                  AND a.total_questions > 0 AND a.correct_answers = a.total_questions
+            ),
+            battles_won = (
+                SELECT COUNT(*) FROM user_activities a
+                WHERE a.user_id = user_stats.user_id
+                  AND a.activity_type = 'battle' AND a.score * 2 > a.max_score
+            )
+    ''')
+
+def _migration_009_daily_rollup(cursor: sqlite3.Cursor):
+    """Resumo diário por usuário e idioma, preenchido com o histórico existente"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_daily_rollup (
+            user_id INTEGER NOT NULL,
+            day TEXT NOT NULL,
+            language_code TEXT NOT NULL,
+            activities INTEGER DEFAULT 0,
+            xp INTEGER DEFAULT 0,
+            time_spent INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            total_questions INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, day, language_code),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        ) WITHOUT ROWID
+    ''')
+    
+    # completed_at é gravado em UTC; o resumo usa o dia local, como o app
+    cursor.execute('''
+        INSERT OR REPLACE INTO user_daily_rollup
+        (user_id, day, language_code, activities, xp, time_spent,
+         correct_answers, total_questions)
+        SELECT user_id, date(completed_at, 'localtime'), language_code, COUNT(*),
+               SUM(xp_earned), SUM(time_spent), SUM(correct_answers), SUM(total_questions)
+        FROM user_activities
+        GROUP BY user_id, date(completed_at, 'localtime'), language_code
+    ''')
+
+def _migration_010_retention(cursor: sqlite3.Cursor):
+    """Retenção: traduções no resumo diário, totais arquivados e índices por data"""
+    cursor.execute("ALTER TABLE user_daily_rollup ADD COLUMN translations INTEGER DEFAULT 0")
+    
+    cursor.execute('''
+        INSERT INTO user_daily_rollup (user_id, day, language_code, translations)
+        SELECT user_id, date(created_at, 'localtime'), target_language, COUNT(*)
+        FROM translation_history
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id, date(created_at, 'localtime'), target_language
+        ON CONFLICT (user_id, day, language_code) DO UPDATE SET
+            translations = excluded.translations
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_activity_archive (
+            user_id INTEGER NOT NULL,
+            language_code TEXT NOT NULL,
+            activities INTEGER DEFAULT 0,
+            correct_answers INTEGER DEFAULT 0,
+            total_questions INTEGER DEFAULT 0,
+            time_spent INTEGER DEFAULT 0,
+            xp_earned INTEGER DEFAULT 0,
+            perfect_lessons INTEGER DEFAULT 0,
+            battles_won INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, language_code),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        ) WITHOUT ROWID
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_activities_completed_at
+        ON user_activities (completed_at)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_translation_history_created_at
+        ON translation_history (created_at)
+    ''')
+
+def _migration_011_favorites_index(cursor: sqlite3.Cursor):
+    """Índice da lista de favoritos por usuário em ordem de inclusão"""
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_favorites_user_time
+        ON user_favorites (user_id, added_at)
+    ''')
+
+# Migrações em ordem; novas alterações de esquema entram sempre no final
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Esquema inicial", _migration_001_base_schema),
+    Migration(2, "Índices das consultas críticas", _migration_002_hot_query_indexes),
+    Migration(3, "Registro de importação de vocabulário", _migration_003_vocabulary_imports),
+    Migration(4, "Estatísticas agregadas por usuário", _migration_004_user_stats),
+    Migration(5, "Índice do ranking global", _migration_005_leaderboard_index),
+    Migration(6, "Ligas semanais", _migration_006_weekly_leagues),
+    Migration(7, "Índice de streaks ativos", _migration_007_streak_index),
+    Migration(8, "Contadores de conquistas", _migration_008_achievement_counters),
+    Migration(9, "Resumo diário de atividades", _migration_009_daily_rollup),
+    Migration(10, "Retenção do histórico", _migration_010_retention),
+    Migration(11, "Índice de favoritos", _migration_011_favorites_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Lê a versão do esquema gravada no banco"""
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+def apply_migrations(connection: sqlite3.Connection,
+                     migrations: List[Migration] = None) -> List[int]:
+    """Aplica as migrações pendentes na transação corrente
+    
+    Deve rodar dentro de uma transação de escrita (job da WriteQueue), de modo
+    que uma falha desfaça também a atualização do user_version.
+    
+    Returns:
+        Lista com as versões aplicadas
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    cursor = connection.cursor()
+    current = get_schema_version(connection)
+    applied = []
+    
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+        
+        migration.apply(cursor)
+        # PRAGMA não aceita parâmetros; a versão vem da própria lista
+        cursor.execute(f"PRAGMA user_version = {int(migration.version)}")
+        applied.append(migration.version)
+    
+    return applied
\ No newline at end of file
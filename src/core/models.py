@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelos de Linha do LinguaMaster Pro
+Tipos leves (dataclasses com __slots__) para as linhas lidas do banco
+"""
+
+import sqlite3
+from dataclasses import dataclass, fields
+from typing import Any, Iterator, Optional, Tuple
+
+class RowModel:
+    """Base das linhas tipadas
+    
+    Cada subclasse lista as colunas na mesma ordem dos campos, de modo que o
+    cursor monta o objeto direto da tupla (sem sqlite3.Row nem dict). O acesso
+    por chave (`row['id']`, `row.get(...)`, `dict(row)`) continua funcionando
+    para as telas que tratam as linhas como dicionários.
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def columns(cls) -> Tuple[str, ...]:
+        """Nomes das colunas, na ordem dos campos"""
+        return tuple(field.name for field in fields(cls))
+    
+    @classmethod
+    def select_list(cls, alias: str = None) -> str:
+        """Lista de colunas para o SELECT, opcionalmente qualificada"""
+        prefix = f"{alias}." if alias else ""
+        return ", ".join(prefix + name for name in cls.columns())
+    
+    @classmethod
+    def row_factory(cls, cursor: sqlite3.Cursor, row: tuple):
+        """row_factory para cursores cujo SELECT usa `select_list()`"""
+        return cls(*row)
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Colunas da linha, como em dict.keys()"""
+        return self.columns()
+    
+    def __getitem__(self, key: str) -> Any:
+        """Acesso por nome de coluna"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Acesso por nome de coluna com valor padrão"""
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> dict:
+        """Cópia da linha como dicionário"""
+        return {name: getattr(self, name) for name in self.columns()}
+
+@dataclass
+class User(RowModel):
+    """Linha de users (sem o hash da senha)"""
+    
+    __slots__ = ('id', 'username', 'email', 'full_name', 'native_language',
+                 'learning_languages', 'level', 'total_xp', 'current_streak',
+                 'longest_streak', 'last_activity', 'created_at', 'updated_at',
+                 'is_active', 'profile_picture', 'preferences')
+    
+    id: int
+    username: str
+    email: Optional[str]
+    full_name: Optional[str]
+    native_language: str
+    learning_languages: str
+    level: int
+    total_xp: int
+    current_streak: int
+    longest_streak: int
+    last_activity: Optional[str]
+    created_at: str
+    updated_at: str
+    is_active: int
+    profile_picture: Optional[str]
+    preferences: str
+
+@dataclass
+class LanguageProgress(RowModel):
+    """Linha de user_language_progress"""
+    
+    __slots__ = ('id', 'user_id', 'language_code', 'level', 'xp', 'lessons_completed',
+                 'words_learned', 'accuracy_rate', 'time_studied', 'last_lesson_date',
+                 'created_at')
+    
+    id: int
+    user_id: int
+    language_code: str
+    level: int
+    xp: int
+    lessons_completed: int
+    words_learned: int
+    accuracy_rate: float
+    time_studied: int
+    last_lesson_date: Optional[str]
+    created_at: str
+
+@dataclass
+class VocabularyWord(RowModel):
+    """Linha de vocabulary"""
+    
+    __slots__ = ('id', 'word', 'translation', 'source_language', 'target_language',
+                 'difficulty_level', 'category', 'pronunciation', 'example_sentence',
+                 'example_translation', 'image_url', 'audio_url', 'created_at')
+    
+    id: int
+    word: str
+    translation: str
+    source_language: str
+    target_language: str
+    difficulty_level: str
+    category: Optional[str]
+    pronunciation: Optional[str]
+    example_sentence: Optional[str]
+    example_translation: Optional[str]
+    image_url: Optional[str]
+    audio_url: Optional[str]
+    created_at: str
+
+@dataclass
+class Activity(RowModel):
+    """Linha de user_activities"""
+    
+    __slots__ = ('id', 'user_id', 'activity_type', 'language_code', 'score', 'max_score',
+                 'xp_earned', 'time_spent', 'correct_answers', 'total_questions',
+                 'difficulty_level', 'details', 'completed_at')
+    
+    id: int
+    user_id: int
+    activity_type: str
+    language_code: str
+    score: int
+    max_score: int
+    xp_earned: int
+    time_spent: int
+    correct_answers: int
+    total_questions: int
+    difficulty_level: Optional[str]
+    details: str
+    completed_at: str
+
+def iter_rows(cursor: sqlite3.Cursor, chunk_size: int = 500) -> Iterator[Any]:
+    """Percorre o resultado em blocos de `chunk_size` linhas (memória constante)"""
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
\ No newline at end of file
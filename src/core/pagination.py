@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paginação por Chave do LinguaMaster Pro
+Páginas em ordem decrescente de (data, id), sem OFFSET
+"""
+
+import sqlite3
+import threading
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+# Posição depois do último item entregue: (data, id)
+PageCursor = Tuple[str, int]
+
+class Page(NamedTuple):
+    """Uma página de resultados e o cursor para a seguinte (None no fim)"""
+    items: List[Any]
+    next_cursor: Optional[PageCursor]
+
+def keyset_page(connection: sqlite3.Connection, select_sql: str, time_column: str,
+                params: tuple, cursor: Optional[PageCursor], limit: int,
+                row_factory: Callable = None, id_column: str = 'id') -> Page:
+    """Busca a página que começa logo após `cursor`
+    
+    `select_sql` é o SELECT com o filtro do usuário já no WHERE; a comparação
+    por valor de linha ((data, id) < (?, ?)) continua no índice (user_id, data),
+    que já carrega o rowid, então a página 1000 custa o mesmo que a primeira.
+    `time_column` e `id_column` também precisam estar entre as colunas lidas.
+    """
+    sql = select_sql
+    args = list(params)
+    if cursor is not None:
+        sql += f" AND ({time_column}, {id_column}) < (?, ?)"
+        args.extend(cursor)
+    sql += f" ORDER BY {time_column} DESC, {id_column} DESC LIMIT ?"
+    # Uma linha a mais indica se existe próxima página
+    args.append(limit + 1)
+    
+    db_cursor = connection.cursor()
+    if row_factory:
+        db_cursor.row_factory = row_factory
+    rows = db_cursor.execute(sql, args).fetchall()
+    if not row_factory:
+        rows = [dict(row) for row in rows]
+    
+    if len(rows) <= limit:
+        return Page(rows, None)
+    
+    rows = rows[:limit]
+    time_key = time_column.split('.')[-1]
+    id_key = id_column.split('.')[-1]
+    last = rows[-1]
+    return Page(rows, (last[time_key], last[id_key]))
+
+class PagedSource:
+    """Fonte de dados para listas com rolagem infinita
+    
+    Guarda o cursor entre chamadas: cada `load_more()` traz só a página
+    seguinte. Pode ser chamada de uma thread de trabalho; as telas aplicam
+    o resultado na thread da interface.
+    """
+    
+    def __init__(self, fetch_page: Callable[[Optional[PageCursor], int], Page],
+                 page_size: int = 20):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.items: List[Any] = []
+        self._cursor: Optional[PageCursor] = None
+        self._exhausted = False
+        self._lock = threading.Lock()
+    
+    @property
+    def has_more(self) -> bool:
+        """Indica se ainda há itens a carregar"""
+        return not self._exhausted
+    
+    def load_more(self) -> List[Any]:
+        """Carrega a próxima página e devolve apenas os itens novos"""
+        with self._lock:
+            if self._exhausted:
+                return []
+            
+            page = self.fetch_page(self._cursor, self.page_size)
+            self.items.extend(page.items)
+            self._cursor = page.next_cursor
+            self._exhausted = page.next_cursor is None
+            return page.items
+    
+    def reset(self):
+        """Volta ao início (ex.: após uma inclusão ou troca de usuário)"""
+        with self._lock:
+            self.items = []
+            self._cursor = None
+            self._exhausted = False
\ No newline at end of file
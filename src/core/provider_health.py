@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Saúde das APIs de Tradução do LinguaMaster Pro
+Estatísticas móveis por API, circuit breaker com sondagem e ordem adaptativa
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Estados do circuit breaker
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Latência presumida (s) de uma API ainda sem medições
+DEFAULT_LATENCY = 1.0
+
+class ProviderHealth:
+    """Janela das últimas chamadas de uma API e estado do circuito"""
+    
+    __slots__ = ('name', 'samples', 'state', 'consecutive_failures', 'opened_at',
+                 'cooldown', 'probe_in_flight')
+    
+    def __init__(self, name: str, window: int, cooldown: float):
+        self.name = name
+        # (sucesso, latência em segundos) das chamadas mais recentes
+        self.samples = deque(maxlen=window)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self.probe_in_flight = False
+    
+    def success_rate(self) -> float:
+        """Fração de chamadas bem-sucedidas na janela"""
+        if not self.samples:
+            return 1.0
+        return sum(1 for ok, _ in self.samples if ok) / len(self.samples)
+    
+    def latency_percentile(self, fraction: float, min_count: int = 1) -> Optional[float]:
+        """Percentil das latências das chamadas bem-sucedidas (None com poucas medições)"""
+        latencies = sorted(latency for ok, latency in self.samples if ok)
+        if len(latencies) < max(1, min_count):
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+    
+    def score(self) -> float:
+        """Tempo esperado até uma resposta válida (menor é melhor)"""
+        median = self.latency_percentile(0.5)
+        if median is None:
+            median = DEFAULT_LATENCY
+        return median / max(self.success_rate(), 0.05)
+
+class ProviderHealthTracker:
+    """Circuit breaker e ordem adaptativa das APIs
+    
+    Uma API com `failure_threshold` falhas seguidas, ou com taxa de falha
+    acima de `max_failure_rate` na janela, tem o circuito aberto e fica fora
+    por `cooldown` segundos. Depois disso uma única chamada de sondagem é
+    liberada (meio aberto): sucesso fecha o circuito, falha reabre com o
+    dobro da espera (até `max_cooldown`).
+    
+    Os horários são de relógio (time.time()) para que o estado salvo
+    continue válido depois de reiniciar o aplicativo.
+    
+    `on_save` é chamada (fora do lock) quando um circuito muda de estado e
+    também a cada `save_every` chamadas registradas ou `save_interval`
+    segundos, para que as janelas de medição sobrevivam a uma queda do
+    aplicativo.
+    """
+    
+    def __init__(self, providers: List[str], failure_threshold: int = 3,
+                 max_failure_rate: float = 0.5, min_samples: int = 10,
+                 cooldown: float = 60, max_cooldown: float = 900, window: int = 50,
+                 on_save: Callable[[], None] = None, save_every: int = 20,
+                 save_interval: float = 60, logger=None):
+        self.failure_threshold = failure_threshold
+        self.max_failure_rate = max_failure_rate
+        self.min_samples = min_samples
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.window = window
+        self.on_save = on_save
+        self.save_every = save_every
+        self.save_interval = save_interval
+        self.logger = logger
+        self._lock = threading.Lock()
+        # Chamadas registradas desde o último salvamento
+        self._unsaved = 0
+        self._last_saved = time.time()
+        self.providers: Dict[str, ProviderHealth] = {
+            name: ProviderHealth(name, window, cooldown) for name in providers
+        }
+    
+    def _log(self, level: str, message: str):
+        """Registra no Logger da aplicação, se houver"""
+        if self.logger:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+    
+    def _save_due(self, changed: bool) -> bool:
+        """Conta uma chamada e indica se o estado deve ser salvo (chamar com o lock)"""
+        self._unsaved += 1
+        now = time.time()
+        if (changed or self._unsaved >= self.save_every or
+                now - self._last_saved >= self.save_interval):
+            self._unsaved = 0
+            self._last_saved = now
+            return True
+        return False
+    
+    def _save(self, due: bool):
+        """Salva o estado (fora do lock), se for a hora"""
+        if due and self.on_save:
+            try:
+                self.on_save()
+            except Exception as e:
+                self._log('error', f"Erro ao salvar saúde das APIs: {e}")
+    
+    def _available(self, health: ProviderHealth, now: float) -> bool:
+        """Indica se a API pode receber chamadas agora (chamar com o lock)"""
+        if health.state == CLOSED:
+            return True
+        if health.state == OPEN:
+            return now - health.opened_at >= health.cooldown
+        return not health.probe_in_flight
+    
+    def ordered(self, priority: List[str]) -> List[str]:
+        """APIs disponíveis, da mais rápida e confiável para a pior
+        
+        A ordem configurada desempata (e vale enquanto não há medições).
+        """
+        now = time.time()
+        with self._lock:
+            candidates = [name for name in priority
+                          if name in self.providers and self._available(self.providers[name], now)]
+            return sorted(candidates, key=lambda name: (self.providers[name].score(),
+                                                        priority.index(name)))
+    
+    def acquire(self, name: str) -> bool:
+        """Reserva uma chamada; fora do circuito fechado só passa a sondagem"""
+        now = time.time()
+        with self._lock:
+            health = self.providers[name]
+            if not self._available(health, now):
+                return False
+            if health.state != CLOSED:
+                health.state = HALF_OPEN
+                health.probe_in_flight = True
+            return True
+    
+    def release(self, name: str):
+        """Devolve a reserva de uma chamada que não chegou a acontecer"""
+        with self._lock:
+            self.providers[name].probe_in_flight = False
+    
+    def record_success(self, name: str, latency: float):
+        """Registra uma resposta válida"""
+        with self._lock:
+            health = self.providers[name]
+            health.samples.append((True, latency))
+            health.consecutive_failures = 0
+            changed = health.state != CLOSED
+            if changed:
+                health.state = CLOSED
+                health.cooldown = self.base_cooldown
+            health.probe_in_flight = False
+            due = self._save_due(changed)
+        self._save(due)
+    
+    def record_failure(self, name: str, latency: float):
+        """Registra uma falha (erro, tempo esgotado ou resposta vazia)"""
+        with self._lock:
+            health = self.providers[name]
+            health.samples.append((False, latency))
+            health.consecutive_failures += 1
+            changed = False
+            
+            if health.state == HALF_OPEN:
+                # A sondagem falhou: volta a esperar, por mais tempo
+                health.cooldown = min(self.max_cooldown, health.cooldown * 2)
+                changed = True
+            elif health.state == CLOSED:
+                failure_rate = 1 - health.success_rate()
+                changed = (health.consecutive_failures >= self.failure_threshold or
+                           (len(health.samples) >= self.min_samples and
+                            failure_rate > self.max_failure_rate))
+            
+            if changed:
+                health.state = OPEN
+                health.opened_at = time.time()
+            health.probe_in_flight = False
+            due = self._save_due(changed)
+        self._save(due)
+    
+    def latency_percentile(self, name: str, fraction: float, min_count: int = 1) -> Optional[float]:
+        """Percentil das latências recentes de uma API"""
+        with self._lock:
+            return self.providers[name].latency_percentile(fraction, min_count)
+    
+    def stats(self) -> Dict[str, Dict]:
+        """Estado, taxa de sucesso e latências de cada API"""
+        with self._lock:
+            return {
+                name: {
+                    'state': health.state,
+                    'calls': len(health.samples),
+                    'success_rate': round(health.success_rate(), 3),
+                    'p50_s': health.latency_percentile(0.5),
+                    'p90_s': health.latency_percentile(0.9),
+                    'consecutive_failures': health.consecutive_failures,
+                    'cooldown': health.cooldown,
+                } for name, health in self.providers.items()
+            }
+    
+    def snapshot(self) -> List[Tuple]:
+        """Estado em linhas para o banco"""
+        with self._lock:
+            return [
+                (name, health.state, health.consecutive_failures, health.opened_at,
+                 health.cooldown, json.dumps([[int(ok), round(latency, 4)] for ok, latency in health.samples]))
+                for name, health in self.providers.items()
+            ]
+    
+    def restore(self, rows: List[Tuple]):
+        """Carrega o estado salvo (APIs desconhecidas são ignoradas)"""
+        with self._lock:
+            for name, state, failures, opened_at, cooldown, samples in rows:
+                health = self.providers.get(name)
+                if health is None:
+                    continue
+                # Uma sondagem interrompida pelo encerramento volta a ser só "aberto"
+                health.state = OPEN if state == HALF_OPEN else state
+                health.consecutive_failures = failures
+                health.opened_at = opened_at
+                health.cooldown = cooldown
+                health.samples.extend((bool(ok), latency) for ok, latency in json.loads(samples))
\ No newline at end of file
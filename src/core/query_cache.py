@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de Consultas do LinguaMaster Pro
+Resultados de leitura em memória, invalidados por tabela e por PRAGMA data_version
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+class QueryCache:
+    """Cache de leitura com invalidação por contadores de escrita
+    
+    Cada entrada guarda o carimbo (geração, versão de cada tabela lida) do
+    momento em que a consulta começou; uma escrita local incrementa a versão
+    das tabelas que tocou e descarta só as entradas que dependem delas.
+    
+    Escritas de outro processo aparecem como mudança no PRAGMA data_version
+    da conexão de sondagem sem uma escrita local correspondente; nesse caso
+    a geração avança e todo o cache é descartado.
+    
+    Os valores são compartilhados entre chamadas e não devem ser alterados.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._generation = 0
+        self._lock = threading.Lock()
+        
+        # Sondagem do data_version (conexão própria, nunca escreve)
+        self._probe: Optional[Callable[[], int]] = None
+        self._data_version = None
+        self._writer_data_version = None
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def attach_probe(self, probe: Callable[[], int], writer_data_version: int):
+        """Liga a detecção de escritas externas"""
+        with self._lock:
+            self._probe = probe
+            self._data_version = probe()
+            self._writer_data_version = writer_data_version
+    
+    def _stamp(self, tables: Iterable[str]) -> tuple:
+        """Geração atual e versão de cada tabela"""
+        return (self._generation,) + tuple(self._versions[table] for table in tables)
+    
+    def _clear(self):
+        """Descarta tudo (chamar com o lock)"""
+        self._generation += 1
+        self._entries.clear()
+    
+    def _check_external(self):
+        """Descarta o cache se o banco mudou desde a última sondagem"""
+        if self._probe is None:
+            return
+        
+        data_version = self._probe()
+        with self._lock:
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._clear()
+    
+    def get_or_load(self, key: Hashable, tables: tuple, load: Callable[[], Any]) -> Any:
+        """Devolve o resultado em cache ou executa `load` e guarda o resultado"""
+        self._check_external()
+        
+        with self._lock:
+            stamp = self._stamp(tables)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        value = load()
+        
+        with self._lock:
+            # Uma escrita concluída durante a leitura torna o valor suspeito
+            if self._stamp(tables) == stamp:
+                self._entries[key] = (stamp, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+    
+    def invalidate(self, tables: Optional[Iterable[str]] = None):
+        """Invalida as tabelas indicadas (todas, se None)"""
+        with self._lock:
+            if tables is None:
+                self._clear()
+            else:
+                for table in tables:
+                    self._versions[table] += 1
+    
+    def after_local_commit(self, tables: Optional[Iterable[str]],
+                           writer_probe: Callable[[], int]):
+        """Registra um commit da thread de escrita (chamado após o COMMIT)
+        
+        O data_version da conexão de escrita só muda com commits de outras
+        conexões, que nunca são do próprio processo (as de leitura são
+        somente leitura): se ele mudou, houve escrita externa. A sondagem de
+        leitura vem antes, para que uma escrita externa entre as duas seja
+        vista pela segunda.
+        """
+        data_version = self._probe() if self._probe else None
+        writer_data_version = writer_probe()
+        with self._lock:
+            if tables is None or writer_data_version != self._writer_data_version:
+                self._clear()
+            else:
+                for table in tables:
+                    self._versions[table] += 1
+            self._writer_data_version = writer_data_version
+            self._data_version = data_version
+    
+    def detach_probe(self):
+        """Desliga a sondagem e descarta o cache (banco fechado)"""
+        with self._lock:
+            self._probe = None
+            self._clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Acertos, faltas e tamanho atual"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
\ No newline at end of file
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verificação de Planos de Consulta do LinguaMaster Pro
+Confere com EXPLAIN QUERY PLAN que as consultas críticas usam índices
+"""
+
+import sqlite3
+from typing import Dict, List, Tuple
+
+# Consultas mais frequentes do aplicativo, com parâmetros de exemplo
+HOT_QUERIES: Dict[str, Tuple[str, tuple]] = {
+    'authenticate_user': (
+        '''SELECT * FROM users
+           WHERE username = ? AND password_hash = ? AND is_active = 1''',
+        ('demo', 'hash')
+    ),
+    'get_user_progress': (
+        'SELECT * FROM user_language_progress WHERE user_id = ?',
+        (1,)
+    ),
+    'get_user_progress_language': (
+        'SELECT * FROM user_language_progress WHERE user_id = ? AND language_code = ?',
+        (1, 'en')
+    ),
+    'vocabulary_for_lesson': (
+        'SELECT id FROM vocabulary WHERE target_language = ? AND difficulty_level = ?',
+        ('en', 'beginner')
+    ),
+    'recent_activities': (
+        '''SELECT * FROM user_activities
+           WHERE user_id = ? AND completed_at >= ?
+           ORDER BY completed_at DESC LIMIT 20''',
+        (1, '2024-01-01')
+    ),
+    'daily_rollup': (
+        '''SELECT day, SUM(xp) FROM user_daily_rollup
+           WHERE user_id = ? AND day BETWEEN ? AND ?
+           GROUP BY day''',
+        (1, '2024-01-01', '2024-01-30')
+    ),
+    'translation_history': (
+        '''SELECT * FROM translation_history
+           WHERE user_id = ? AND created_at >= ?
+           ORDER BY created_at DESC LIMIT 20''',
+        (1, '2024-01-01')
+    ),
+    'activities_page': (
+        '''SELECT * FROM user_activities
+           WHERE user_id = ? AND (completed_at, id) < (?, ?)
+           ORDER BY completed_at DESC, id DESC LIMIT 21''',
+        (1, '2024-01-01', 100)
+    ),
+    'favorites_page': (
+        '''SELECT * FROM user_favorites
+           WHERE user_id = ? AND (added_at, id) < (?, ?)
+           ORDER BY added_at DESC, id DESC LIMIT 21''',
+        (1, '2024-01-01', 100)
+    ),
+}
+
+def explain(connection: sqlite3.Connection, sql: str, params: tuple = ()) -> List[str]:
+    """Retorna as linhas de detalhe do EXPLAIN QUERY PLAN"""
+    rows = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[3] for row in rows]
+
+def is_full_scan(plan: List[str]) -> bool:
+    """Indica se algum passo do plano percorre uma tabela ou índice inteiro"""
+    return any(detail.startswith('SCAN ') for detail in plan)
+
+def check_query_plans(connection: sqlite3.Connection,
+                      queries: Dict[str, Tuple[str, tuple]] = None) -> List[Dict]:
+    """Verifica o plano de cada consulta crítica
+    
+    Returns:
+        Lista de dicts com 'name', 'plan' e 'full_scan'
+    """
+    queries = HOT_QUERIES if queries is None else queries
+    results = []
+    
+    for name, (sql, params) in queries.items():
+        plan = explain(connection, sql, params)
+        results.append({
+            'name': name,
+            'plan': plan,
+            'full_scan': is_full_scan(plan)
+        })
+    
+    return results
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Retenção de Histórico do LinguaMaster Pro
+Remove em lotes pequenos as linhas antigas de user_activities e translation_history
+"""
+
+import gzip
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.core.user_stats import is_battle_won, is_perfect_lesson
+
+# Tabela → coluna de data usada para decidir o que expira
+RETAINED_TABLES = {
+    'user_activities': 'completed_at',
+    'translation_history': 'created_at',
+}
+
+def cutoff_timestamp(retention_days: int, now: Optional[datetime] = None) -> str:
+    """Limite no formato de CURRENT_TIMESTAMP (UTC) para a idade máxima"""
+    now = now or datetime.utcnow()
+    return (now - timedelta(days=retention_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+def select_expired(connection: sqlite3.Connection, table: str, cutoff: str,
+                   batch_size: int) -> List[Dict]:
+    """Lê o próximo lote de linhas mais antigas que o limite (pelo índice de data)"""
+    column = RETAINED_TABLES[table]
+    rows = connection.execute(f'''
+        SELECT * FROM {table}
+        WHERE {column} < ?
+        ORDER BY {column}
+        LIMIT ?
+    ''', (cutoff, batch_size)).fetchall()
+    return [dict(row) for row in rows]
+
+def archive_rows(archive_dir: Path, table: str, rows: List[Dict]) -> Path:
+    """Acrescenta as linhas a um arquivo JSON Lines compactado, um por mês"""
+    archive_dir = Path(archive_dir)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{table}-{datetime.now():%Y-%m}.jsonl.gz"
+    
+    # Cada chamada vira um membro gzip novo; gzip.open lê todos em sequência
+    with gzip.open(path, 'at', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    
+    return path
+
+def _archive_activity_totals(cursor: sqlite3.Cursor, rows: List[Dict]):
+    """Guarda os totais das atividades removidas para rebuild() continuar exato"""
+    totals = defaultdict(lambda: [0, 0, 0, 0, 0, 0, 0])
+    for row in rows:
+        entry = totals[(row['user_id'], row['language_code'])]
+        entry[0] += 1
+        entry[1] += row['correct_answers'] or 0
+        entry[2] += row['total_questions'] or 0
+        entry[3] += row['time_spent'] or 0
+        entry[4] += row['xp_earned'] or 0
+        entry[5] += int(is_perfect_lesson(row['correct_answers'] or 0, row['total_questions'] or 0))
+        entry[6] += int(is_battle_won(row['activity_type'], row['score'] or 0, row['max_score'] or 0))
+    
+    cursor.executemany('''
+        INSERT INTO user_activity_archive
+        (user_id, language_code, activities, correct_answers, total_questions,
+         time_spent, xp_earned, perfect_lessons, battles_won)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (user_id, language_code) DO UPDATE SET
+            activities = activities + excluded.activities,
+            correct_answers = correct_answers + excluded.correct_answers,
+            total_questions = total_questions + excluded.total_questions,
+            time_spent = time_spent + excluded.time_spent,
+            xp_earned = xp_earned + excluded.xp_earned,
+            perfect_lessons = perfect_lessons + excluded.perfect_lessons,
+            battles_won = battles_won + excluded.battles_won
+    ''', [key + tuple(values) for key, values in totals.items()])
+
+def delete_rows(cursor: sqlite3.Cursor, table: str, rows: List[Dict]) -> int:
+    """Remove um lote já lido (e arquivado) dentro da transação de escrita
+    
+    Os resumos diários e os agregados já contam essas linhas; para atividades,
+    os totais vão também para user_activity_archive.
+    """
+    if table == 'user_activities':
+        _archive_activity_totals(cursor, rows)
+    
+    cursor.executemany(
+        f"DELETE FROM {table} WHERE id = ?", [(row['id'],) for row in rows]
+    )
+    return len(rows)
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rastreamento de SQL do LinguaMaster Pro
+Histogramas de latência por comando e log de consultas lentas (opcional)
+"""
+
+import bisect
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Limites superiores (ms) das faixas do histograma; a última é "acima de 1 s"
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, float('inf'))
+
+# Tamanho máximo do SQL mostrado no log
+MAX_SQL_LENGTH = 300
+
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER_LIST = re.compile(r'\?(?:\s*,\s*\?)+')
+
+# Os mesmos textos de SQL se repetem o tempo todo; a chave é calculada uma vez
+_key_cache: Dict[str, str] = {}
+MAX_CACHED_KEYS = 2048
+
+def normalize_sql(sql: str) -> str:
+    """Chave do comando: espaços colapsados e listas IN (?, ?, ...) unificadas"""
+    key = _key_cache.get(sql)
+    if key is None:
+        key = _PLACEHOLDER_LIST.sub('?, ...', _WHITESPACE.sub(' ', sql).strip())[:MAX_SQL_LENGTH]
+        if len(_key_cache) < MAX_CACHED_KEYS:
+            _key_cache[sql] = key
+    return key
+
+class StatementStats:
+    """Latências acumuladas de um comando"""
+    
+    __slots__ = ('count', 'total_ms', 'max_ms', 'buckets')
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * len(BUCKET_BOUNDS_MS)
+    
+    def percentile(self, fraction: float) -> float:
+        """Limite superior da faixa que contém o percentil pedido"""
+        target = self.count * fraction
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            seen += count
+            if seen >= target and count:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+class SqlTrace:
+    """Coleta as latências dos comandos das conexões criadas por `connect()`
+    
+    O tempo de cada comando soma o execute() e as leituras feitas em seguida
+    no mesmo cursor, por fetch*() ou iterando o cursor (o SQLite só avança o
+    comando quando as linhas são lidas). Um executescript() conta como um
+    único comando.O texto com os valores já aplicados vem do set_trace_callback e
+    aparece no log de consultas lentas.
+    """
+    
+    def __init__(self, slow_query_ms: float = 100, logger=None):
+        self.slow_query_ms = slow_query_ms
+        self.logger = logger
+        self.stats: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def connect(self, database: str, **kwargs) -> sqlite3.Connection:
+        """sqlite3.connect com a instrumentação ligada"""
+        connection = sqlite3.connect(database, factory=TracedConnection, **kwargs)
+        connection.sql_trace = self
+        connection.set_trace_callback(self._on_trace)
+        return connection
+    
+    def _on_trace(self, statement: str):
+        """Guarda o último comando expandido executado nesta thread"""
+        self._local.last_sql = statement
+    
+    def _log(self, level: str, message: str):
+        """Registra no Logger da aplicação, se houver"""
+        if self.logger:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+    
+    def record(self, key: str, elapsed_ms: float, previous_ms: float = None):
+        """Soma uma execução ao histograma
+        
+        Com `previous_ms`, a execução já registrada com esse tempo é
+        atualizada (leituras posteriores do mesmo cursor).
+        """
+        bucket = bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StatementStats()
+            
+            if previous_ms is None:
+                stats.count += 1
+                stats.total_ms += elapsed_ms
+            else:
+                stats.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, previous_ms)] -= 1
+                stats.total_ms += elapsed_ms - previous_ms
+            stats.buckets[bucket] += 1
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+        
+        # Cada execução entra no log uma única vez, ao cruzar o limite
+        if elapsed_ms >= self.slow_query_ms and (previous_ms is None or previous_ms < self.slow_query_ms):
+            sql = getattr(self._local, 'last_sql', None) or key
+            self._log('warning', f"Consulta lenta ({elapsed_ms:.1f} ms): {normalize_sql(sql)}")
+    
+    def reset(self):
+        """Descarta as estatísticas coletadas"""
+        with self._lock:
+            self.stats = {}
+    
+    def summary(self, top: int = 15) -> List[Dict]:
+        """Comandos com maior tempo total, com contagem e percentis"""
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+            return [{
+                'sql': key,
+                'count': stats.count,
+                'total_ms': round(stats.total_ms, 2),
+                'mean_ms': round(stats.total_ms / stats.count, 3) if stats.count else 0.0,
+                'p50_ms': stats.percentile(0.5),
+                'p95_ms': stats.percentile(0.95),
+                'max_ms': round(stats.max_ms, 2),
+            } for key, stats in items[:top]]
+    
+    def log_summary(self, top: int = 15):
+        """Escreve o resumo no log (chamado no encerramento)"""
+        rows = self.summary(top)
+        if not rows:
+            return
+        
+        total = sum(stats.count for stats in self.stats.values())
+        lines = [f"Resumo de SQL: {total} comandos, {len(self.stats)} distintos"]
+        for row in rows:
+            lines.append(
+                f"  {row['count']:>7}x  total {row['total_ms']:>9.1f} ms  "
+                f"média {row['mean_ms']:>7.3f}  p50 ≤{row['p50_ms']:.2f}  "
+                f"p95 ≤{row['p95_ms']:.2f}  máx {row['max_ms']:.1f}  {row['sql'][:120]}"
+            )
+        self._log('info', "\n".join(lines))
+
+class TracedCursor(sqlite3.Cursor):
+    """Cursor que mede execute(), executescript() e as leituras seguintes"""
+    
+    def _start(self, sql: str, run, *args):
+        """Executa e registra um novo comando neste cursor"""
+        started = time.perf_counter()
+        try:
+            return run(*args)
+        finally:
+            self._trace_key = normalize_sql(sql)
+            self._trace_ms = (time.perf_counter() - started) * 1000
+            self.connection.sql_trace.record(self._trace_key, self._trace_ms)
+    
+    def _continue(self, fetch, *args):
+        """Soma o tempo de uma leitura à execução corrente do cursor"""
+        started = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            previous = getattr(self, '_trace_ms', None)
+            if previous is not None:
+                self._trace_ms = previous + (time.perf_counter() - started) * 1000
+                self.connection.sql_trace.record(self._trace_key, self._trace_ms, previous)
+    
+    def execute(self, sql, parameters=()):
+        return self._start(sql, super().execute, sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self._start(sql, super().executemany, sql, seq_of_parameters)
+    
+    def executescript(self, sql_script):
+        return self._start(sql_script, super().executescript, sql_script)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return self._continue(super().__next__)
+    
+    def fetchone(self):
+        return self._continue(super().fetchone)
+    
+    def fetchmany(self, size=None):
+        if size is None:
+            return self._continue(super().fetchmany)
+        return self._continue(super().fetchmany, size)
+    
+    def fetchall(self):
+        return self._continue(super().fetchall)
+
+class TracedConnection(sqlite3.Connection):
+    """Conexão cujos cursores (inclusive os de execute()) são medidos"""
+    
+    sql_trace: Optional[SqlTrace] = None
+    
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+    
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+    
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
\ No newline at end of file
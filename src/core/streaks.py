@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaks do LinguaMaster Pro
+Mantém current_streak, longest_streak e last_activity dos usuários
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from typing import Optional
+
+# Mesma regra de streak para as duas colunas: +1 se a última atividade foi
+# ontem, mantém se foi hoje, recomeça em 1 em qualquer outro caso
+_NEXT_STREAK = '''
+    CASE
+        WHEN last_activity = :today THEN MAX(current_streak, 1)
+        WHEN last_activity = :yesterday THEN current_streak + 1
+        ELSE 1
+    END
+'''
+
+def apply_activity(cursor: sqlite3.Cursor, user_id: int, today: Optional[date] = None):
+    """Atualiza o streak do usuário para uma atividade feita hoje (O(1))"""
+    today = today or date.today()
+    cursor.execute(f'''
+        UPDATE users SET
+            current_streak = {_NEXT_STREAK},
+            longest_streak = MAX(longest_streak, {_NEXT_STREAK}),
+            last_activity = :today
+        WHERE id = :user_id
+    ''', {
+        'today': today.isoformat(),
+        'yesterday': (today - timedelta(days=1)).isoformat(),
+        'user_id': user_id
+    })
+
+def get_streak_day(connection: sqlite3.Connection) -> Optional[str]:
+    """Último dia em que os streaks quebrados foram zerados"""
+    row = connection.execute(
+        "SELECT value FROM app_meta WHERE key = 'streak_day'"
+    ).fetchone()
+    return row[0] if row else None
+
+def reset_broken_streaks(cursor: sqlite3.Cursor, today: Optional[date] = None) -> int:
+    """Zera, em uma única instrução, os streaks de quem não estudou ontem nem hoje
+    
+    Returns:
+        Número de usuários com streak zerado (0 se o dia já foi processado)
+    """
+    today = today or date.today()
+    if get_streak_day(cursor.connection) == today.isoformat():
+        return 0
+    
+    # Só linhas com streak ativo entram no índice parcial idx_users_active_streak
+    cursor.execute('''
+        UPDATE users SET current_streak = 0
+        WHERE current_streak > 0
+          AND (last_activity IS NULL OR last_activity < ?)
+    ''', ((today - timedelta(days=1)).isoformat(),))
+    reset = cursor.rowcount
+    
+    cursor.execute('''
+        INSERT INTO app_meta (key, value) VALUES ('streak_day', ?)
+        ON CONFLICT (key) DO UPDATE SET value = excluded.value
+    ''', (today.isoformat(),))
+    
+    return reset
\ No newline at end of file
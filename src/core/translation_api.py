@@ -1,342 +1,410 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Sistema de Tradução do LinguaMaster Pro
-Gerencia APIs de tradução gratuitas com cache offline
-"""
-
-import requests
-import json
-import time
-from typing import Dict, Optional, List
-from urllib.parse import quote
-import sqlite3
-from pathlib import Path
-
-class TranslationCache:
-    """Cache local para traduções"""
-    
-    def __init__(self, cache_file="translation_cache.db"):
-        self.cache_file = cache_file
-        self.connection = None
-        self._init_cache()
-    
-    def _init_cache(self):
-        """Inicializa cache SQLite"""
-        try:
-            self.connection = sqlite3.connect(self.cache_file)
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS translation_cache (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source_text TEXT NOT NULL,
-                    source_lang TEXT NOT NULL,
-                    target_lang TEXT NOT NULL,
-                    translated_text TEXT NOT NULL,
-                    api_used TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(source_text, source_lang, target_lang)
-                )
-            ''')
-            
-            self.connection.commit()
-        except Exception as e:
-            print(f"Erro ao inicializar cache: {e}")
-    
-    def get_cached_translation(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
-        """Busca tradução no cache"""
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                SELECT translated_text FROM translation_cache 
-                WHERE source_text = ? AND source_lang = ? AND target_lang = ?
-            ''', (text, source_lang, target_lang))
-            
-            result = cursor.fetchone()
-            return result[0] if result else None
-        except Exception:
-            return None
-    
-    def cache_translation(self, text: str, source_lang: str, target_lang: str, 
-                         translation: str, api_used: str):
-        """Armazena tradução no cache"""
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO translation_cache 
-                (source_text, source_lang, target_lang, translated_text, api_used)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (text, source_lang, target_lang, translation, api_used))
-            
-            self.connection.commit()
-        except Exception as e:
-            print(f"Erro ao cachear tradução: {e}")
-    
-    def close(self):
-        """Fecha conexão do cache"""
-        if self.connection:
-            self.connection.close()
-
-class GoogleTranslateFree:
-    """API gratuita do Google Translate (não oficial)"""
-    
-    def __init__(self):
-        self.base_url = "https://translate.googleapis.com/translate_a/single"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-    
-    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
-        """Traduz texto usando Google Translate gratuito"""
-        try:
-            params = {
-                'client': 'gtx',
-                'sl': source_lang,
-                'tl': target_lang,
-                'dt': 't',
-                'q': text
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result and len(result) > 0 and len(result[0]) > 0:
-                    return result[0][0][0]
-            
-            return None
-            
-        except Exception as e:
-            print(f"Erro no Google Translate: {e}")
-            return None
-
-class MyMemoryAPI:
-    """API gratuita do MyMemory"""
-    
-    def __init__(self):
-        self.base_url = "https://api.mymemory.translated.net/get"
-        self.session = requests.Session()
-    
-    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
-        """Traduz texto usando MyMemory API"""
-        try:
-            params = {
-                'q': text,
-                'langpair': f"{source_lang}|{target_lang}"
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('responseStatus') == 200:
-                    return result['responseData']['translatedText']
-            
-            return None
-            
-        except Exception as e:
-            print(f"Erro no MyMemory: {e}")
-            return None
-
-class LibreTranslateAPI:
-    """API do LibreTranslate (instância pública)"""
-    
-    def __init__(self):
-        self.base_url = "https://libretranslate.de/translate"
-        self.session = requests.Session()
-    
-    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
-        """Traduz texto usando LibreTranslate"""
-        try:
-            data = {
-                'q': text,
-                'source': source_lang,
-                'target': target_lang,
-                'format': 'text'
-            }
-            
-            response = self.session.post(self.base_url, data=data, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('translatedText')
-            
-            return None
-            
-        except Exception as e:
-            print(f"Erro no LibreTranslate: {e}")
-            return None
-
-class TranslationManager:
-    """Gerenciador principal de traduções"""
-    
-    def __init__(self):
-        self.cache = TranslationCache()
-        self.apis = {
-            'google': GoogleTranslateFree(),
-            'mymemory': MyMemoryAPI(),
-            'libretranslate': LibreTranslateAPI()
-        }
-        self.api_priority = ['google', 'mymemory', 'libretranslate']
-        self.language_codes = {
-            'pt': 'pt',
-            'en': 'en', 
-            'es': 'es',
-            'de': 'de'
-        }
-    
-    def translate(self, text: str, source_lang: str, target_lang: str, 
-                 use_cache: bool = True) -> Dict[str, any]:
-        """
-        Traduz texto usando APIs disponíveis
-        
-        Returns:
-            Dict com 'translation', 'api_used', 'cached', 'success'
-        """
-        # Normalizar códigos de idioma
-        source_lang = self.language_codes.get(source_lang, source_lang)
-        target_lang = self.language_codes.get(target_lang, target_lang)
-        
-        # Verificar cache primeiro
-        if use_cache:
-            cached_result = self.cache.get_cached_translation(text, source_lang, target_lang)
-            if cached_result:
-                return {
-                    'translation': cached_result,
-                    'api_used': 'cache',
-                    'cached': True,
-                    'success': True
-                }
-        
-        # Tentar APIs em ordem de prioridade
-        for api_name in self.api_priority:
-            try:
-                api = self.apis[api_name]
-                translation = api.translate(text, source_lang, target_lang)
-                
-                if translation and translation.strip():
-                    # Cachear resultado
-                    if use_cache:
-                        self.cache.cache_translation(
-                            text, source_lang, target_lang, translation, api_name
-                        )
-                    
-                    return {
-                        'translation': translation,
-                        'api_used': api_name,
-                        'cached': False,
-                        'success': True
-                    }
-                
-                # Aguardar entre tentativas para evitar rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Erro na API {api_name}: {e}")
-                continue
-        
-        return {
-            'translation': None,
-            'api_used': None,
-            'cached': False,
-            'success': False,
-            'error': 'Todas as APIs falharam'
-        }
-    
-    def translate_batch(self, texts: List[str], source_lang: str, 
-                       target_lang: str) -> List[Dict[str, any]]:
-        """Traduz múltiplos textos"""
-        results = []
-        
-        for text in texts:
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
-            
-            # Pausa entre traduções para evitar rate limiting
-            if not result.get('cached', False):
-                time.sleep(1)
-        
-        return results
-    
-    def get_supported_languages(self) -> Dict[str, str]:
-        """Retorna idiomas suportados"""
-        return {
-            'pt': 'Português',
-            'en': 'English',
-            'es': 'Español', 
-            'de': 'Deutsch'
-        }
-    
-    def detect_language(self, text: str) -> Optional[str]:
-        """Detecta idioma do texto (implementação básica)"""
-        # Implementação simples baseada em palavras comuns
-        portuguese_words = ['o', 'a', 'de', 'que', 'e', 'do', 'da', 'em', 'um', 'para', 'é', 'com', 'não', 'uma', 'os']
-        english_words = ['the', 'of', 'and', 'a', 'to', 'in', 'is', 'you', 'that', 'it', 'he', 'was', 'for', 'on', 'are']
-        spanish_words = ['el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le', 'da']
-        german_words = ['der', 'die', 'und', 'in', 'den', 'von', 'zu', 'das', 'mit', 'sich', 'des', 'auf', 'für', 'ist', 'im']
-        
-        words = text.lower().split()
-        
-        scores = {'pt': 0, 'en': 0, 'es': 0, 'de': 0}
-        
-        for word in words[:20]:  # Analisa apenas as primeiras 20 palavras
-            if word in portuguese_words:
-                scores['pt'] += 1
-            if word in english_words:
-                scores['en'] += 1
-            if word in spanish_words:
-                scores['es'] += 1
-            if word in german_words:
-                scores['de'] += 1
-        
-        if max(scores.values()) > 0:
-            return max(scores, key=scores.get)
-        
-        return None
-    
-    def get_translation_stats(self) -> Dict[str, int]:
-        """Obtém estatísticas de tradução"""
-        try:
-            cursor = self.cache.connection.cursor()
-            
-            # Total de traduções em cache
-            cursor.execute('SELECT COUNT(*) FROM translation_cache')
-            total_cached = cursor.fetchone()[0]
-            
-            # Traduções por API
-            cursor.execute('''
-                SELECT api_used, COUNT(*) 
-                FROM translation_cache 
-                GROUP BY api_used
-            ''')
-            api_stats = dict(cursor.fetchall())
-            
-            return {
-                'total_cached': total_cached,
-                'api_usage': api_stats
-            }
-            
-        except Exception:
-            return {'total_cached': 0, 'api_usage': {}}
-    
-    def clear_cache(self, older_than_days: int = 30):
-        """Limpa cache antigo"""
-        try:
-            cursor = self.cache.connection.cursor()
-            cursor.execute('''
-                DELETE FROM translation_cache 
-                WHERE created_at < datetime('now', '-{} days')
-            '''.format(older_than_days))
-            
-            self.cache.connection.commit()
-            return True
-        except Exception as e:
-            print(f"Erro ao limpar cache: {e}")
-            return False
-    
-    def close(self):
-        """Fecha conexões"""
-        if self.cache:
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sistema de Tradução do LinguaMaster Pro
+Gerencia APIs de tradução gratuitas com cache offline
+"""
+
+import requests
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Optional, List, Tuple
+from urllib.parse import quote
+import sqlite3
+from pathlib import Path
+
+from src.core.provider_health import ProviderHealthTracker
+from src.core.translation_cache import CacheEvictionScheduler, MemoryTranslationCache, TranslationCache
+
+class GoogleTranslateFree:
+    """API gratuita do Google Translate (não oficial)"""
+    
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+        self.base_url = "https://translate.googleapis.com/translate_a/single"
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Traduz texto usando Google Translate gratuito"""
+        try:
+            params = {
+                'client': 'gtx',
+                'sl': source_lang,
+                'tl': target_lang,
+                'dt': 't',
+                'q': text
+            }
+            
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                result = response.json()
+                if result and len(result) > 0 and len(result[0]) > 0:
+                    return result[0][0][0]
+            
+            return None
+            
+        except Exception as e:
+            print(f"Erro no Google Translate: {e}")
+            return None
+
+class MyMemoryAPI:
+    """API gratuita do MyMemory"""
+    
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+        self.base_url = "https://api.mymemory.translated.net/get"
+        self.session = requests.Session()
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Traduz texto usando MyMemory API"""
+        try:
+            params = {
+                'q': text,
+                'langpair': f"{source_lang}|{target_lang}"
+            }
+            
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                result = response.json()
+                if result.get('responseStatus') == 200:
+                    return result['responseData']['translatedText']
+            
+            return None
+            
+        except Exception as e:
+            print(f"Erro no MyMemory: {e}")
+            return None
+
+class LibreTranslateAPI:
+    """API do LibreTranslate (instância pública)"""
+    
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+        self.base_url = "https://libretranslate.de/translate"
+        self.session = requests.Session()
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Traduz texto usando LibreTranslate"""
+        try:
+            data = {
+                'q': text,
+                'source': source_lang,
+                'target': target_lang,
+                'format': 'text'
+            }
+            
+            response = self.session.post(self.base_url, data=data, timeout=self.timeout)
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result.get('translatedText')
+            
+            return None
+            
+        except Exception as e:
+            print(f"Erro no LibreTranslate: {e}")
+            return None
+
+class TranslationManager:
+    """Gerenciador principal de traduções
+    
+    Com `hedging`, a API preferida recebe o pedido e, se não responder
+    dentro do percentil `hedge_percentile` das suas latências recentes, a
+    seguinte também recebe; vale a primeira tradução válida. Uma falha
+    aciona a próxima API na hora, sem esperar o atraso.
+    
+    A ordem das APIs acompanha a saúde medida (ver ProviderHealthTracker):
+    as mais rápidas e confiáveis vêm primeiro e as com circuito aberto
+    ficam de fora; `api_priority` só desempata.
+    """
+    
+    def __init__(self, cache_size: int = 1000, cache_file: str = "translation_cache.db",
+                 max_cached_rows: int = 50000, max_cached_bytes: int = 20 * 1024 * 1024,
+                 eviction_interval: float = 300, casefold: bool = True, timeout: float = 10,
+                 hedging: bool = True, hedge_percentile: float = 0.9,
+                 hedge_default_delay: float = 1.0, failure_threshold: int = 3,
+                 circuit_cooldown: float = 60, logger=None):
+        # Dois níveis: LRU em memória (frases repetidas) e SQLite em disco
+        self.memory_cache = MemoryTranslationCache(cache_size)
+        self.cache = TranslationCache(cache_file, max_cached_rows, max_cached_bytes,
+                                      casefold=casefold)
+        self.eviction = CacheEvictionScheduler(self.cache, eviction_interval, logger)
+        self.apis = {
+            'google': GoogleTranslateFree(timeout),
+            'mymemory': MyMemoryAPI(timeout),
+            'libretranslate': LibreTranslateAPI(timeout)
+        }
+        self.api_priority = ['google', 'mymemory', 'libretranslate']
+        self.hedging = hedging
+        self.hedge_percentile = hedge_percentile
+        self.hedge_default_delay = hedge_default_delay
+        # Estado dos circuitos e medições salvos no arquivo do cache
+        self.health = ProviderHealthTracker(
+            list(self.apis), failure_threshold=failure_threshold, cooldown=circuit_cooldown,
+            on_save=self.save_provider_health, logger=logger
+        )
+        self.health.restore(self.cache.load_provider_health())
+        # Pedidos que perderam a corrida terminam aqui, sem prender o chamador
+        self.executor = ThreadPoolExecutor(max_workers=2 * len(self.apis),
+                                           thread_name_prefix="translation")
+        self.language_codes = {
+            'pt': 'pt',
+            'en': 'en', 
+            'es': 'es',
+            'de': 'de'
+        }
+    
+    def translate(self, text: str, source_lang: str, target_lang: str, 
+                 use_cache: bool = True) -> Dict[str, any]:
+        """
+        Traduz texto usando APIs disponíveis
+        
+        Returns:
+            Dict com 'translation', 'api_used', 'cached', 'success'
+        """
+        # Normalizar códigos de idioma
+        source_lang = self.language_codes.get(source_lang, source_lang)
+        target_lang = self.language_codes.get(target_lang, target_lang)
+        
+        # Verificar cache primeiro (memória, depois disco)
+        cache_key = self.cache.make_key(text, source_lang, target_lang)
+        if use_cache:
+            cached_result = self.memory_cache.get(cache_key)
+            cache_tier = 'memory'
+            if cached_result:
+                self.cache.record_access(cache_key)
+            else:
+                cached_result = self.cache.get_cached_translation(
+                    text, source_lang, target_lang, cache_key
+                )
+                cache_tier = 'disk'
+                if cached_result:
+                    self.memory_cache.put(cache_key, cached_result)
+            
+            if cached_result:
+                return {
+                    'translation': cached_result,
+                    'api_used': 'cache',
+                    'cached': True,
+                    'cache_tier': cache_tier,
+                    'success': True
+                }
+        
+        if self.hedging:
+            api_name, translation = self._translate_hedged(text, source_lang, target_lang)
+        else:
+            api_name, translation = self._translate_sequential(text, source_lang, target_lang)
+        
+        if translation:
+            # Cachear resultado
+            if use_cache:
+                self.memory_cache.put(cache_key, translation)
+                self.cache.cache_translation(
+                    text, source_lang, target_lang, translation, api_name, cache_key
+                )
+            
+            return {
+                'translation': translation,
+                'api_used': api_name,
+                'cached': False,
+                'success': True
+            }
+        
+        return {
+            'translation': None,
+            'api_used': None,
+            'cached': False,
+            'success': False,
+            'error': 'Todas as APIs falharam'
+        }
+    
+    def _call_api(self, api_name: str, text: str, source_lang: str,
+                  target_lang: str) -> Optional[str]:
+        """Chama uma API e registra o resultado na saúde da API"""
+        started = time.perf_counter()
+        try:
+            translation = self.apis[api_name].translate(text, source_lang, target_lang)
+        except Exception as e:
+            print(f"Erro na API {api_name}: {e}")
+            translation = None
+        
+        elapsed = time.perf_counter() - started
+        if translation and translation.strip():
+            self.health.record_success(api_name, elapsed)
+            return translation
+        self.health.record_failure(api_name, elapsed)
+        return None
+    
+    def _translate_sequential(self, text: str, source_lang: str,
+                              target_lang: str) -> Tuple[Optional[str], Optional[str]]:
+        """Tenta as APIs disponíveis em ordem, uma de cada vez"""
+        for api_name in self.health.ordered(self.api_priority):
+            if not self.health.acquire(api_name):
+                continue
+            translation = self._call_api(api_name, text, source_lang, target_lang)
+            if translation:
+                return api_name, translation
+            
+            # Aguardar entre tentativas para evitar rate limiting
+            time.sleep(0.5)
+        
+        return None, None
+    
+    def hedge_delay(self, api_name: str) -> float:
+        """Espera antes de acionar a próxima API: percentil das latências recentes"""
+        delay = self.health.latency_percentile(api_name, self.hedge_percentile, min_count=5)
+        return self.hedge_default_delay if delay is None else delay
+    
+    def _translate_hedged(self, text: str, source_lang: str,
+                          target_lang: str) -> Tuple[Optional[str], Optional[str]]:
+        """Dispara as APIs em sequência escalonada e fica com a primeira resposta"""
+        queue = self.health.ordered(self.api_priority)
+        pending = {}
+        
+        def launch():
+            # Pula as APIs cuja sondagem já foi reservada por outra tradução
+            while queue:
+                api_name = queue.pop(0)
+                if not self.health.acquire(api_name):
+                    continue
+                future = self.executor.submit(self._call_api, api_name, text, source_lang, target_lang)
+                # Cancelada antes de sair, a chamada devolve a reserva
+                future.add_done_callback(
+                    lambda done, name=api_name: done.cancelled() and self.health.release(name)
+                )
+                pending[future] = api_name
+                return api_name
+            return None
+        
+        last_launched = launch()
+        while pending:
+            # Sem próxima API, espera o que já foi disparado
+            delay = self.hedge_delay(last_launched) if queue else None
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                api_name = pending.pop(future)
+                translation = future.result()
+                if translation:
+                    # As demais respostas são descartadas; as que ainda não
+                    # começaram nem chegam a sair
+                    for other in pending:
+                        other.cancel()
+                    return api_name, translation
+            
+            # Atraso esgotado ou falha: aciona a próxima API
+            if queue:
+                last_launched = launch() or last_launched
+        
+        return None, None
+    
+    def translate_batch(self, texts: List[str], source_lang: str, 
+                       target_lang: str) -> List[Dict[str, any]]:
+        """Traduz múltiplos textos"""
+        results = []
+        
+        for text in texts:
+            result = self.translate(text, source_lang, target_lang)
+            results.append(result)
+            
+            # Pausa entre traduções para evitar rate limiting
+            if not result.get('cached', False):
+                time.sleep(1)
+        
+        return results
+    
+    def get_supported_languages(self) -> Dict[str, str]:
+        """Retorna idiomas suportados"""
+        return {
+            'pt': 'Português',
+            'en': 'English',
+            'es': 'Español', 
+            'de': 'Deutsch'
+        }
+    
+    def detect_language(self, text: str) -> Optional[str]:
+        """Detecta idioma do texto (implementação básica)"""
+        # Implementação simples baseada em palavras comuns
+        portuguese_words = ['o', 'a', 'de', 'que', 'e', 'do', 'da', 'em', 'um', 'para', 'é', 'com', 'não', 'uma', 'os']
+        english_words = ['the', 'of', 'and', 'a', 'to', 'in', 'is', 'you', 'that', 'it', 'he', 'was', 'for', 'on', 'are']
+        spanish_words = ['el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le', 'da']
+        german_words = ['der', 'die', 'und', 'in', 'den', 'von', 'zu', 'das', 'mit', 'sich', 'des', 'auf', 'für', 'ist', 'im']
+        
+        words = text.lower().split()
+        
+        scores = {'pt': 0, 'en': 0, 'es': 0, 'de': 0}
+        
+        for word in words[:20]:  # Analisa apenas as primeiras 20 palavras
+            if word in portuguese_words:
+                scores['pt'] += 1
+            if word in english_words:
+                scores['en'] += 1
+            if word in spanish_words:
+                scores['es'] += 1
+            if word in german_words:
+                scores['de'] += 1
+        
+        if max(scores.values()) > 0:
+            return max(scores, key=scores.get)
+        
+        return None
+    
+    def save_provider_health(self):
+        """Grava o estado das APIs no arquivo do cache"""
+        self.cache.save_provider_health(self.health.snapshot())
+    
+    def get_provider_stats(self) -> Dict[str, Dict]:
+        """Estado do circuito, taxa de sucesso e latências de cada API"""
+        return self.health.stats()
+    
+    def get_cache_stats(self) -> Dict[str, Dict]:
+        """Acertos e faltas de cada nível do cache"""
+        return {
+            'memory': self.memory_cache.stats(),
+            'disk': self.cache.stats()
+        }
+    
+    def get_translation_stats(self) -> Dict[str, int]:
+        """Obtém estatísticas de tradução"""
+        try:
+            # Total de traduções em cache e traduções por API
+            total_cached, _ = self.cache.usage()
+            api_stats = self.cache.usage_by_api()
+            
+            return {
+                'total_cached': total_cached,
+                'api_usage': api_stats,
+                'cache_tiers': self.get_cache_stats(),
+                'providers': self.get_provider_stats()
+            }
+            
+        except Exception:
+            return {'total_cached': 0, 'api_usage': {}, 'cache_tiers': self.get_cache_stats(),
+                    'providers': self.get_provider_stats()}
+    
+    def clear_cache(self, older_than_days: int = 30):
+        """Limpa traduções sem uso há mais de `older_than_days` dias"""
+        if self.cache.purge_older_than(older_than_days) is None:
+            return False
+        
+        # A memória não sabe a idade das entradas; recomeça vazia
+        self.memory_cache.clear()
+        return True
+    
+    def start_eviction(self):
+        """Inicia o despejo periódico do cache em disco"""
+        self.eviction.start()
+    
+    def close(self):
+        """Fecha conexões"""
+        self.eviction.stop(timeout=10)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.save_provider_health()
+        if self.cache:
             self.cache.close()
\ No newline at end of file
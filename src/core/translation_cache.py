@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de Traduções do LinguaMaster Pro
+Nível em memória (LRU) e nível SQLite com limite de tamanho e despejo em segundo plano
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.core.migrations import Migration, apply_migrations, get_schema_version
+
+# Chave das traduções: hash de 64 bits do texto normalizado e dos idiomas
+CacheKey = int
+
+# Maiúsculas e minúsculas compartilham a mesma entrada, salvo configuração
+DEFAULT_CASEFOLD = True
+
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_text(text: str, casefold: bool = DEFAULT_CASEFOLD) -> str:
+    """Forma canônica do texto: Unicode NFC, espaços colapsados e, opcionalmente, sem caixa"""
+    text = _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+    return text.casefold() if casefold else text
+
+def make_cache_key(text: str, source_lang: str, target_lang: str,
+                   casefold: bool = DEFAULT_CASEFOLD) -> CacheKey:
+    """Chave de 64 bits (BLAKE2b) com sinal, no intervalo do INTEGER do SQLite"""
+    material = f"{source_lang}\x1f{target_lang}\x1f{normalize_text(text, casefold)}"
+    digest = hashlib.blake2b(material.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+class MemoryTranslationCache:
+    """Cache LRU em memória na frente do cache SQLite
+    
+    Guarda no máximo `max_entries` traduções; a menos usada recentemente sai
+    primeiro. Com `max_entries` 0 o nível fica desligado.
+    """
+    
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Busca tradução, marcando-a como usada recentemente"""
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return translation
+    
+    def put(self, key: CacheKey, translation: str):
+        """Armazena tradução, descartando as mais antigas se passar do limite"""
+        if self.max_entries <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = translation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Descarta todas as traduções em memória"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        """Acertos, faltas, ocupação e taxa de acerto"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'capacity': self.max_entries,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+def _cache_migration_001_base_schema(cursor: sqlite3.Cursor):
+    """Tabela original do cache (já existe nos arquivos antigos)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS translation_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_text TEXT NOT NULL,
+            source_lang TEXT NOT NULL,
+            target_lang TEXT NOT NULL,
+            translated_text TEXT NOT NULL,
+            api_used TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(source_text, source_lang, target_lang)
+        )
+    ''')
+
+def _cache_migration_002_eviction(cursor: sqlite3.Cursor):
+    """Último acesso, contagem de uso, tamanho e prioridade de despejo"""
+    cursor.execute("ALTER TABLE translation_cache ADD COLUMN last_access TIMESTAMP")
+    cursor.execute("ALTER TABLE translation_cache ADD COLUMN hit_count INTEGER DEFAULT 0")
+    cursor.execute("ALTER TABLE translation_cache ADD COLUMN size_bytes INTEGER DEFAULT 1")
+    cursor.execute("ALTER TABLE translation_cache ADD COLUMN priority REAL DEFAULT 0")
+    
+    cursor.execute('''
+        UPDATE translation_cache SET
+            last_access = created_at,
+            size_bytes = MAX(1, length(CAST(source_text AS BLOB)) + length(CAST(translated_text AS BLOB)))
+    ''')
+    cursor.execute("UPDATE translation_cache SET priority = 1.0 / size_bytes")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_translation_cache_priority ON translation_cache(priority)")
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cache_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    ''')
+
+def rebuild_with_keys(cursor: sqlite3.Cursor, casefold: bool):
+    """Recria translation_cache com a chave calculada para a normalização dada
+    
+    Textos que passam a ter a mesma chave viram uma entrada só; fica a mais
+    usada, somando os usos das demais.
+    """
+    cursor.execute('''
+        CREATE TABLE translation_cache_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cache_key INTEGER NOT NULL UNIQUE,
+            source_text TEXT NOT NULL,
+            source_lang TEXT NOT NULL,
+            target_lang TEXT NOT NULL,
+            translated_text TEXT NOT NULL,
+            api_used TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_access TIMESTAMP,
+            hit_count INTEGER DEFAULT 0,
+            size_bytes INTEGER DEFAULT 1,
+            priority REAL DEFAULT 0
+        )
+    ''')
+    
+    columns = ("source_text, source_lang, target_lang, translated_text, api_used, "
+               "created_at, last_access, hit_count, size_bytes, priority")
+    kept = set()
+    merged_hits: Dict[CacheKey, int] = {}
+    rows = cursor.connection.execute(
+        f"SELECT {columns} FROM translation_cache ORDER BY hit_count DESC, id DESC"
+    )
+    for row in rows:
+        key = make_cache_key(row[0], row[1], row[2], casefold)
+        if key in kept:
+            merged_hits[key] = merged_hits.get(key, 0) + (row[7] or 0) + 1
+            continue
+        kept.add(key)
+        cursor.execute(
+            f"INSERT INTO translation_cache_new (cache_key, {columns}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key,) + tuple(row)
+        )
+    
+    cursor.executemany(
+        "UPDATE translation_cache_new SET hit_count = hit_count + ? WHERE cache_key = ?",
+        [(hits, key) for key, hits in merged_hits.items()]
+    )
+    
+    cursor.execute("DROP TABLE translation_cache")
+    cursor.execute("ALTER TABLE translation_cache_new RENAME TO translation_cache")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_translation_cache_priority ON translation_cache(priority)")
+    cursor.execute(
+        "INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('key_casefold', ?)",
+        ('1' if casefold else '0',)
+    )
+
+def _cache_migration_003_hashed_keys(cursor: sqlite3.Cursor):
+    """Troca o UNIQUE dos textos completos por uma chave inteira de 64 bits"""
+    rebuild_with_keys(cursor, DEFAULT_CASEFOLD)
+
+def _cache_migration_004_provider_health(cursor: sqlite3.Cursor):
+    """Estado do circuit breaker e janela de chamadas de cada API"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS provider_health (
+            provider TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            consecutive_failures INTEGER DEFAULT 0,
+            opened_at REAL DEFAULT 0,
+            cooldown REAL NOT NULL,
+            samples TEXT NOT NULL DEFAULT '[]'
+        )
+    ''')
+
+# Migrações do arquivo de cache (independentes das do banco principal)
+CACHE_MIGRATIONS: List[Migration] = [
+    Migration(1, "Esquema inicial do cache", _cache_migration_001_base_schema),
+    Migration(2, "Despejo por tamanho e uso", _cache_migration_002_eviction),
+    Migration(3, "Chaves normalizadas com hash", _cache_migration_003_hashed_keys),
+    Migration(4, "Saúde das APIs de tradução", _cache_migration_004_provider_health),
+]
+
+def _entry_size(text: str, translation: str) -> int:
+    """Bytes ocupados pelo texto e pela tradução (UTF-8)"""
+    return max(1, len(text.encode('utf-8')) + len(translation.encode('utf-8')))
+
+class TranslationCache:
+    """Cache local para traduções
+    
+    O despejo segue o GDSF (Greedy-Dual-Size-Frequency): a prioridade de uma
+    entrada é `piso + usos / bytes`, e as de menor prioridade saem primeiro.
+    Textos longos usados uma vez saem antes; frases curtas e frequentes
+    ficam mesmo antigas. O piso sobe até a prioridade da última entrada
+    removida, o que faz as entradas sem uso recente envelhecerem.
+    
+    Os acessos são acumulados em memória e gravados pelo `maintain()`, de
+    modo que as leituras não escrevem no disco.
+    
+    As entradas são localizadas por `make_cache_key()`; o texto guardado só
+    serve para confirmar a entrada (colisão de hash vira falta).
+    """
+    
+    def __init__(self, cache_file="translation_cache.db", max_rows: int = 50000,
+                 max_bytes: int = 20 * 1024 * 1024, eviction_batch: int = 500,
+                 casefold: bool = DEFAULT_CASEFOLD):
+        self.cache_file = cache_file
+        self.casefold = casefold
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.eviction_batch = eviction_batch
+        self.connection = None
+        # A tradução roda em threads de trabalho; a conexão é compartilhada
+        self._lock = threading.RLock()
+        self._pending_hits: Dict[CacheKey, int] = {}
+        self._floor = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._init_cache()
+    
+    def _init_cache(self):
+        """Inicializa cache SQLite"""
+        try:
+            self.connection = sqlite3.connect(self.cache_file, check_same_thread=False)
+            
+            if get_schema_version(self.connection) < CACHE_MIGRATIONS[-1].version:
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    apply_migrations(self.connection, CACHE_MIGRATIONS)
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+            
+            meta = dict(self.connection.execute("SELECT key, value FROM cache_meta").fetchall())
+            self._floor = float(meta.get('eviction_floor', 0.0))
+            
+            # Normalização trocada na configuração: as chaves são recalculadas
+            if meta.get('key_casefold') != ('1' if self.casefold else '0'):
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    rebuild_with_keys(self.connection.cursor(), self.casefold)
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+        except Exception as e:
+            print(f"Erro ao inicializar cache: {e}")
+    
+    def make_key(self, text: str, source_lang: str, target_lang: str) -> CacheKey:
+        """Chave da tradução com a normalização deste cache"""
+        return make_cache_key(text, source_lang, target_lang, self.casefold)
+    
+    def get_cached_translation(self, text: str, source_lang: str, target_lang: str,
+                               key: CacheKey = None) -> Optional[str]:
+        """Busca tradução no cache"""
+        try:
+            if key is None:
+                key = self.make_key(text, source_lang, target_lang)
+            
+            with self._lock:
+                cursor = self.connection.cursor()
+                cursor.execute('''
+                    SELECT source_text, source_lang, target_lang, translated_text
+                    FROM translation_cache WHERE cache_key = ?
+                ''', (key,))
+                
+                result = cursor.fetchone()
+                if result and (result[1], result[2]) == (source_lang, target_lang) and \
+                        normalize_text(result[0], self.casefold) == normalize_text(text, self.casefold):
+                    self.hits += 1
+                    self._record_hit(key)
+                    return result[3]
+                
+                self.misses += 1
+                return None
+        except Exception:
+            return None
+    
+    def record_access(self, key: CacheKey):
+        """Conta um uso atendido por outro nível (memória) para o despejo"""
+        with self._lock:
+            self._record_hit(key)
+    
+    def _record_hit(self, key: CacheKey):
+        """Acumula um uso para gravar no próximo `maintain()` (chamar com o lock)"""
+        self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+    
+    def cache_translation(self, text: str, source_lang: str, target_lang: str,
+                         translation: str, api_used: str, key: CacheKey = None):
+        """Armazena tradução no cache"""
+        try:
+            if key is None:
+                key = self.make_key(text, source_lang, target_lang)
+            size_bytes = _entry_size(text, translation)
+            with self._lock:
+                cursor = self.connection.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO translation_cache
+                    (cache_key, source_text, source_lang, target_lang, translated_text, api_used,
+                     last_access, hit_count, size_bytes, priority)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, 0, ?, ?)
+                ''', (key, text, source_lang, target_lang, translation, api_used,
+                      size_bytes, self._floor + 1.0 / size_bytes))
+                
+                self.connection.commit()
+        except Exception as e:
+            print(f"Erro ao cachear tradução: {e}")
+    
+    def flush_access(self) -> int:
+        """Grava os usos acumulados (contagem, último acesso e prioridade)"""
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            if not pending or not self.connection:
+                return 0
+            
+            try:
+                self.connection.executemany('''
+                    UPDATE translation_cache SET
+                        hit_count = hit_count + ?,
+                        last_access = CURRENT_TIMESTAMP,
+                        priority = ? + (hit_count + ? + 1.0) / size_bytes
+                    WHERE cache_key = ?
+                ''', [(count, self._floor, count, key) for key, count in pending.items()])
+                self.connection.commit()
+                return len(pending)
+            except Exception as e:
+                self.connection.rollback()
+                print(f"Erro ao gravar acessos do cache: {e}")
+                return 0
+    
+    def usage(self) -> Tuple[int, int]:
+        """Quantidade de linhas e bytes ocupados"""
+        with self._lock:
+            rows, size = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM translation_cache"
+            ).fetchone()
+            return rows, size
+    
+    def usage_by_api(self) -> Dict[str, int]:
+        """Quantidade de linhas por API de origem"""
+        with self._lock:
+            return dict(self.connection.execute('''
+                SELECT api_used, COUNT(*)
+                FROM translation_cache
+                GROUP BY api_used
+            ''').fetchall())
+    
+    def purge_older_than(self, days: int) -> Optional[int]:
+        """Remove as entradas sem uso há mais de `days` dias; devolve quantas saíram"""
+        # Acessos ainda pendentes contam como uso recente
+        self.flush_access()
+        
+        with self._lock:
+            try:
+                cursor = self.connection.execute('''
+                    DELETE FROM translation_cache
+                    WHERE COALESCE(last_access, created_at) < datetime('now', ?)
+                ''', (f"-{int(days)} days",))
+                self.connection.commit()
+                return cursor.rowcount
+            except Exception as e:
+                self.connection.rollback()
+                print(f"Erro ao limpar cache: {e}")
+                return None
+    
+    def evict(self, target_ratio: float = 0.9) -> int:
+        """Remove as entradas mais frias até ficar abaixo do limite
+        
+        Só age quando o limite de linhas ou de bytes foi ultrapassado e então
+        desce até `target_ratio` do limite, para não despejar a cada rodada.
+        Cada lote é uma transação curta; as consultas seguem entre os lotes.
+        """
+        rows, size = self.usage()
+        if rows <= self.max_rows and size <= self.max_bytes:
+            return 0
+        
+        target_rows = int(self.max_rows * target_ratio)
+        target_bytes = int(self.max_bytes * target_ratio)
+        removed = 0
+        
+        while rows > target_rows or size > target_bytes:
+            with self._lock:
+                victims = self.connection.execute('''
+                    SELECT id, priority, size_bytes FROM translation_cache
+                    ORDER BY priority, id LIMIT ?
+                ''', (self.eviction_batch,)).fetchall()
+                if not victims:
+                    break
+                
+                # Para na entrada que traz o cache de volta ao alvo
+                chosen = []
+                for victim in victims:
+                    if rows <= target_rows and size <= target_bytes:
+                        break
+                    chosen.append(victim)
+                    rows -= 1
+                    size -= victim[2]
+                
+                self._floor = max(self._floor, chosen[-1][1])
+                self.connection.executemany(
+                    "DELETE FROM translation_cache WHERE id = ?", [(victim[0],) for victim in chosen]
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('eviction_floor', ?)",
+                    (repr(self._floor),)
+                )
+                self.connection.commit()
+                removed += len(chosen)
+        
+        self.evicted += removed
+        return removed
+    
+    def maintain(self) -> Dict[str, int]:
+        """Grava os acessos pendentes e aplica o limite de tamanho"""
+        flushed = self.flush_access()
+        evicted = self.evict()
+        return {'flushed': flushed, 'evicted': evicted}
+    
+    def load_provider_health(self) -> List[Tuple]:
+        """Estado salvo das APIs (ver ProviderHealthTracker.restore)"""
+        try:
+            with self._lock:
+                return self.connection.execute('''
+                    SELECT provider, state, consecutive_failures, opened_at, cooldown, samples
+                    FROM provider_health
+                ''').fetchall()
+        except Exception as e:
+            print(f"Erro ao carregar saúde das APIs: {e}")
+            return []
+    
+    def save_provider_health(self, rows: List[Tuple]):
+        """Grava o estado das APIs (ver ProviderHealthTracker.snapshot)"""
+        try:
+            with self._lock:
+                if not self.connection:
+                    return
+                self.connection.executemany('''
+                    INSERT OR REPLACE INTO provider_health
+                    (provider, state, consecutive_failures, opened_at, cooldown, samples)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+                self.connection.commit()
+        except Exception as e:
+            print(f"Erro ao salvar saúde das APIs: {e}")
+    
+    def stats(self) -> Dict[str, float]:
+        """Acertos, faltas e taxa de acerto das consultas ao disco"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evicted': self.evicted,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+    
+    def close(self):
+        """Fecha conexão do cache"""
+        self.flush_access()
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+class CacheEvictionScheduler:
+    """Aplica o limite do cache de traduções em uma thread de fundo"""
+    
+    def __init__(self, cache: TranslationCache, interval: float = 300, logger=None):
+        self.cache = cache
+        self.interval = interval
+        self.logger = logger
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _log(self, level: str, message: str):
+        """Registra no Logger da aplicação, se houver"""
+        if self.logger:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+    
+    def start(self):
+        """Inicia a thread de despejo"""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="CacheEviction", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = None):
+        """Interrompe a thread (um lote em andamento termina antes)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self):
+        """Laço da thread: espera o intervalo e faz a manutenção"""
+        # A primeira rodada é logo no início (arquivos antigos podem estar acima do limite)
+        while True:
+            self.run_once()
+            if self._stop.wait(self.interval):
+                break
+    
+    def run_once(self) -> Optional[Dict[str, int]]:
+        """Grava os acessos e despeja o excedente agora"""
+        try:
+            started = time.perf_counter()
+            result = self.cache.maintain()
+            if result['evicted']:
+                elapsed = time.perf_counter() - started
+                self._log('info', f"Cache de traduções: {result['evicted']} entradas removidas "
+                                  f"em {elapsed:.2f}s")
+            return result
+        except Exception as e:
+            self._log('error', f"Erro na manutenção do cache de traduções: {e}")
+            return None
\ No newline at end of file
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estatísticas Agregadas dos Usuários do LinguaMaster Pro
+Mantém user_stats e user_language_stats atualizadas a cada atividade
+"""
+
+import sqlite3
+from typing import Dict, Optional
+
+# Critérios das conquistas, iguais em apply_activity e rebuild
+PERFECT_LESSON_SQL = "(total_questions > 0 AND correct_answers = total_questions)"
+BATTLE_WON_SQL = "(activity_type = 'battle' AND score * 2 > max_score)"
+
+def is_perfect_lesson(correct_answers: int, total_questions: int) -> bool:
+    """Lição com 100% de acerto"""
+    return total_questions > 0 and correct_answers == total_questions
+
+def is_battle_won(activity_type: str, score: int, max_score: int) -> bool:
+    """Batalha vencida: mais da metade da pontuação máxima"""
+    return activity_type == 'battle' and score * 2 > max_score
+
+def apply_activity(cursor: sqlite3.Cursor, user_id: int, language_code: str,
+                   correct_answers: int, total_questions: int, time_spent: int,
+                   xp_earned: int, perfect_lesson: bool = False, battle_won: bool = False):
+    """Soma uma atividade aos agregados (na mesma transação do registro)"""
+    cursor.execute('''
+        INSERT INTO user_stats
+        (user_id, activities, correct_answers, total_questions, time_spent, xp_earned,
+         perfect_lessons, battles_won, updated_at)
+        VALUES (?, 1, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (user_id) DO UPDATE SET
+            activities = activities + 1,
+            correct_answers = correct_answers + excluded.correct_answers,
+            total_questions = total_questions + excluded.total_questions,
+            time_spent = time_spent + excluded.time_spent,
+            xp_earned = xp_earned + excluded.xp_earned,
+            perfect_lessons = perfect_lessons + excluded.perfect_lessons,
+            battles_won = battles_won + excluded.battles_won,
+            updated_at = CURRENT_TIMESTAMP
+    ''', (user_id, correct_answers, total_questions, time_spent, xp_earned,
+          int(perfect_lesson), int(battle_won)))
+    
+    cursor.execute('''
+        INSERT INTO user_language_stats
+        (user_id, language_code, activities, correct_answers, total_questions,
+         time_spent, xp_earned)
+        VALUES (?, ?, 1, ?, ?, ?, ?)
+        ON CONFLICT (user_id, language_code) DO UPDATE SET
+            activities = activities + 1,
+            correct_answers = correct_answers + excluded.correct_answers,
+            total_questions = total_questions + excluded.total_questions,
+            time_spent = time_spent + excluded.time_spent,
+            xp_earned = xp_earned + excluded.xp_earned
+    ''', (user_id, language_code, correct_answers, total_questions, time_spent, xp_earned))
+
+def rebuild(cursor: sqlite3.Cursor, user_id: Optional[int] = None):
+    """Recalcula os agregados em lote a partir de user_activities
+    
+    Inclui os totais de user_activity_archive, onde ficam as atividades já
+    removidas pela retenção de histórico.
+    """
+    user_filter = "WHERE user_id = ?" if user_id is not None else ""
+    params = (user_id,) if user_id is not None else ()
+    
+    cursor.execute(f"DELETE FROM user_stats {user_filter}", params)
+    cursor.execute(f"DELETE FROM user_language_stats {user_filter}", params)
+    
+    # Atividades atuais e arquivadas, já somadas por usuário e idioma
+    combined = f'''
+        SELECT user_id, language_code, COUNT(*) AS activities,
+               SUM(correct_answers) AS correct_answers, SUM(total_questions) AS total_questions,
+               SUM(time_spent) AS time_spent, SUM(xp_earned) AS xp_earned,
+               SUM({PERFECT_LESSON_SQL}) AS perfect_lessons, SUM({BATTLE_WON_SQL}) AS battles_won
+        FROM user_activities
+        {user_filter}
+        GROUP BY user_id, language_code
+        UNION ALL
+        SELECT user_id, language_code, activities, correct_answers, total_questions,
+               time_spent, xp_earned, perfect_lessons, battles_won
+        FROM user_activity_archive
+        {user_filter}
+    '''
+    
+    cursor.execute(f'''
+        INSERT INTO user_stats
+        (user_id, activities, correct_answers, total_questions, time_spent, xp_earned,
+         perfect_lessons, battles_won, updated_at)
+        SELECT user_id, SUM(activities), SUM(correct_answers), SUM(total_questions),
+               SUM(time_spent), SUM(xp_earned), SUM(perfect_lessons), SUM(battles_won),
+               CURRENT_TIMESTAMP
+        FROM ({combined})
+        GROUP BY user_id
+    ''', params * 2)
+    
+    cursor.execute(f'''
+        INSERT INTO user_language_stats
+        (user_id, language_code, activities, correct_answers, total_questions,
+         time_spent, xp_earned)
+        SELECT user_id, language_code, SUM(activities), SUM(correct_answers),
+               SUM(total_questions), SUM(time_spent), SUM(xp_earned)
+        FROM ({combined})
+        GROUP BY user_id, language_code
+    ''', params * 2)
+
+def read_stats(connection: sqlite3.Connection, user_id: int) -> Dict:
+    """Lê os agregados de um usuário (uma linha mais uma por idioma)"""
+    row = connection.execute(
+        "SELECT * FROM user_stats WHERE user_id = ?", (user_id,)
+    ).fetchone()
+    stats = dict(row) if row else {
+        'user_id': user_id, 'activities': 0, 'correct_answers': 0,
+        'total_questions': 0, 'time_spent': 0, 'xp_earned': 0,
+        'perfect_lessons': 0, 'battles_won': 0
+    }
+    
+    total_questions = stats['total_questions']
+    stats['accuracy'] = (stats['correct_answers'] / total_questions * 100) if total_questions else 0.0
+    
+    rows = connection.execute(
+        "SELECT * FROM user_language_stats WHERE user_id = ?", (user_id,)
+    ).fetchall()
+    stats['languages'] = {row['language_code']: dict(row) for row in rows}
+    
+    return stats
\ No newline at end of file
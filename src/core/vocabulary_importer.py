@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Importador de Vocabulário do LinguaMaster Pro
+Carrega pacotes JSON de data/vocabulary para a tabela vocabulary em lote
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterator, Tuple
+
+# Nomes de idioma usados nos pacotes JSON
+LANGUAGE_NAMES = {
+    'english': 'en',
+    'spanish': 'es',
+    'german': 'de',
+    'portuguese': 'pt'
+}
+
+UPSERT_VOCABULARY_SQL = '''
+    INSERT INTO vocabulary
+    (word, translation, source_language, target_language, difficulty_level, category,
+     pronunciation, example_sentence, example_translation)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (word, source_language, target_language) DO UPDATE SET
+        translation = excluded.translation,
+        difficulty_level = excluded.difficulty_level,
+        category = excluded.category,
+        pronunciation = excluded.pronunciation,
+        example_sentence = excluded.example_sentence,
+        example_translation = excluded.example_translation
+'''
+
+class _JsonStream:
+    """Leitor incremental de JSON sobre um arquivo texto
+    
+    Lê o arquivo em blocos e decodifica um valor por vez com raw_decode, de
+    modo que só a entrada atual precisa estar em memória.
+    """
+    
+    def __init__(self, file, chunk_size: int = 65536):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    
+    def _fill(self) -> bool:
+        """Lê mais um bloco do arquivo; retorna False no fim"""
+        if self.eof:
+            return False
+        
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        
+        # Descarta o que já foi consumido para não acumular o arquivo inteiro
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Retorna o próximo caractere não branco sem consumi-lo"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, char: str):
+        """Consome o caractere esperado ou falha"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON inválido: esperado '{char}', encontrado '{found}'")
+        self.pos += 1
+    
+    def value(self):
+        """Decodifica o próximo valor completo (string ou objeto)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+            except json.JSONDecodeError:
+                # Valor cortado no fim do bloco: lê mais e tenta de novo
+                if not self._fill():
+                    raise
+    
+    def items(self) -> Iterator[str]:
+        """Itera pelas chaves de um objeto, deixando o valor para o chamador"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"JSON inválido: separador inesperado '{separator}'")
+    
+    def array(self) -> Iterator:
+        """Itera pelos elementos de um array"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        
+        while True:
+            yield self.value()
+            
+            separator = self.peek()
+            self.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"JSON inválido: separador inesperado '{separator}'")
+
+def file_content_hash(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Calcula o SHA-256 do conteúdo do arquivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def iter_vocabulary_entries(path: Path) -> Iterator[Tuple[str, str, dict]]:
+    """Percorre um pacote idioma → nível → entradas, uma entrada por vez"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        stream = _JsonStream(f)
+        for language in stream.items():
+            for difficulty in stream.items():
+                for entry in stream.array():
+                    yield language, difficulty, entry
+
+def iter_vocabulary_rows(path: Path, source_language: str = 'pt') -> Iterator[tuple]:
+    """Converte as entradas de um pacote em linhas da tabela vocabulary"""
+    for language, difficulty, entry in iter_vocabulary_entries(path):
+        word = entry.get('word')
+        translation = entry.get('translation')
+        if not word or not translation:
+            continue
+        
+        target_language = LANGUAGE_NAMES.get(language.lower(), language.lower())
+        yield (
+            word,
+            translation,
+            source_language,
+            target_language,
+            difficulty,
+            entry.get('category'),
+            entry.get('pronunciation'),
+            entry.get('example'),
+            entry.get('example_translation')
+        )
+
+def is_pack_imported(connection: sqlite3.Connection, source: str, content_hash: str) -> bool:
+    """Verifica se o pacote já foi importado com o mesmo conteúdo"""
+    row = connection.execute('''
+        SELECT 1 FROM vocabulary_imports WHERE source = ? AND content_hash = ?
+    ''', (source, content_hash)).fetchone()
+    return row is not None
+
+def import_pack(connection: sqlite3.Connection, path: Path, source: str,
+                content_hash: str, source_language: str = 'pt') -> int:
+    """Importa um pacote dentro da transação corrente
+    
+    Returns:
+        Número de entradas gravadas
+    """
+    cursor = connection.cursor()
+    before = connection.total_changes
+    cursor.executemany(UPSERT_VOCABULARY_SQL, iter_vocabulary_rows(path, source_language))
+    word_count = connection.total_changes - before
+    
+    cursor.execute('''
+        INSERT INTO vocabulary_imports (source, content_hash, word_count, imported_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (source) DO UPDATE SET
+            content_hash = excluded.content_hash,
+            word_count = excluded.word_count,
+            imported_at = excluded.imported_at
+    ''', (source, content_hash, word_count))
+    
+    return word_count
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sorteio de Vocabulário do LinguaMaster Pro
+Escolhe palavras aleatórias sem ORDER BY RANDOM() usando ids em cache
+"""
+
+import random
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class VocabularySampler:
+    """Sorteia ids de vocabulário em tempo proporcional ao limite pedido
+    
+    Os ids de cada par (idioma, nível) são lidos uma única vez do índice
+    idx_vocabulary_language_difficulty e mantidos em memória. Cada sorteio
+    escolhe posições aleatórias nessa lista, descartando ids excluídos ou
+    repetidos, em vez de ordenar todas as linhas do nível.
+    """
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._ids: Dict[Tuple[str, str], List[int]] = {}
+        self._lock = threading.Lock()
+        self._random = rng or random.Random()
+    
+    def invalidate(self, language_code: str = None, difficulty: str = None):
+        """Descarta ids em cache após alterações no vocabulário"""
+        with self._lock:
+            if language_code is None:
+                self._ids.clear()
+                return
+            
+            for key in list(self._ids):
+                if key[0] == language_code and (difficulty is None or key[1] == difficulty):
+                    del self._ids[key]
+    
+    def _load_ids(self, connection: sqlite3.Connection, key: Tuple[str, str]) -> List[int]:
+        """Obtém (e guarda) a lista de ids de um idioma e nível"""
+        with self._lock:
+            ids = self._ids.get(key)
+        if ids is not None:
+            return ids
+        
+        rows = connection.execute('''
+            SELECT id FROM vocabulary
+            WHERE target_language = ? AND difficulty_level = ?
+        ''', key).fetchall()
+        ids = [row[0] for row in rows]
+        
+        with self._lock:
+            self._ids[key] = ids
+        return ids
+    
+    def sample_ids(self, connection: sqlite3.Connection, language_code: str, difficulty: str,
+                   limit: int, exclude: Iterable[int] = None) -> List[int]:
+        """Sorteia até `limit` ids distintos, ignorando os ids em `exclude`"""
+        ids = self._load_ids(connection, (language_code, difficulty))
+        excluded = set(exclude) if exclude else set()
+        total = len(ids)
+        
+        if limit <= 0 or total == 0:
+            return []
+        
+        # Quando quase tudo seria escolhido, filtrar e embaralhar é mais barato
+        # do que sortear com rejeição
+        if limit * 2 + len(excluded) >= total:
+            candidates = [word_id for word_id in ids if word_id not in excluded]
+            self._random.shuffle(candidates)
+            return candidates[:limit]
+        
+        picked = []
+        seen = set()
+        attempts = 0
+        max_attempts = limit * 8 + len(excluded)
+        
+        while len(picked) < limit and attempts < max_attempts:
+            attempts += 1
+            word_id = ids[self._random.randrange(total)]
+            if word_id in excluded or word_id in seen:
+                continue
+            seen.add(word_id)
+            picked.append(word_id)
+        
+        if len(picked) < limit:
+            # Exclusão cobre quase todo o nível: completa a partir da lista filtrada
+            remaining = [word_id for word_id in ids if word_id not in excluded and word_id not in seen]
+            self._random.shuffle(remaining)
+            picked.extend(remaining[:limit - len(picked)])
+        
+        return picked
\ No newline at end of file
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de Escrita do LinguaMaster Pro
+Thread única de escrita que agrupa vários jobs em um só commit
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+# Marcador interno para encerrar a thread de escrita
+_STOP = object()
+
+class WriteJob:
+    """Job de escrita pendente e o future entregue ao chamador"""
+    
+    __slots__ = ('func', 'future', 'transactional')
+    
+    def __init__(self, func: Callable[[sqlite3.Connection], Any], transactional: bool = True):
+        self.func = func
+        self.future = Future()
+        self.transactional = transactional
+
+class WriteQueue:
+    """Executa jobs de escrita em uma thread dedicada com commit em grupo
+    
+    Cada job é uma função que recebe a conexão de escrita e não deve chamar
+    commit(). Os jobs que já estão na fila rodam em uma única transação, cada
+    um em seu próprio SAVEPOINT: a falha de um job desfaz só as alterações
+    dele e aparece como exceção no seu future.
+    
+    Um job sozinho é gravado na hora. Só quando vários jobs estão chegando
+    juntos o lote fica aberto por até `flush_interval` para juntar mais.
+    
+    Jobs não transacionais (VACUUM, checkpoint do WAL) rodam sozinhos, fora
+    de qualquer transação, entre dois lotes.
+    """
+    
+    def __init__(self, connection: sqlite3.Connection, flush_interval: float = 0.02,
+                 max_batch: int = 256):
+        self.connection = connection
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        
+        # Transações são controladas explicitamente pela fila
+        self.connection.isolation_level = None
+        
+        self._queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        # Torna a checagem de parada e o put atômicos em relação a stop()
+        self._state_lock = threading.Lock()
+        self._commit_hooks: List[Callable[[], None]] = []
+        
+        # Estatísticas simples de agrupamento
+        self.jobs_written = 0
+        self.commits = 0
+    
+    def start(self):
+        """Inicia a thread de escrita"""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="DatabaseWriter",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def submit(self, func: Callable[[sqlite3.Connection], Any],
+               transactional: bool = True) -> Future:
+        """Enfileira um job de escrita e retorna seu future"""
+        job = WriteJob(func, transactional)
+        
+        with self._state_lock:
+            if not self._stopped and self._thread is not None:
+                self._queue.put(job)
+                return job.future
+        
+        job.future.set_exception(sqlite3.ProgrammingError("Fila de escrita encerrada"))
+        return job.future
+    
+    def on_commit(self, hook: Callable[[], None]):
+        """Agenda uma função para depois do commit do job atual
+        
+        Só pode ser chamada de dentro de um job. Os hooks rodam na thread de
+        escrita logo após o COMMIT e antes dos futures serem resolvidos; se o
+        job falhar, os hooks que ele registrou são descartados.
+        """
+        self._commit_hooks.append(hook)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda até que todos os jobs enfileirados tenham sido gravados"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        
+        try:
+            self.submit(lambda conn: None).result(timeout=timeout)
+            return True
+        except Exception:
+            return False
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Grava os jobs pendentes e encerra a thread de escrita"""
+        if self._thread is None:
+            return
+        
+        # Todo job aceito por submit() fica na fila antes do marcador
+        with self._state_lock:
+            if not self._stopped:
+                self._stopped = True
+                self._queue.put(_STOP)
+        
+        self._thread.join(timeout)
+        # Se o join esgotou o tempo, a thread ainda está gravando
+        if not self._thread.is_alive():
+            self._thread = None
+    
+    def _run(self):
+        """Loop principal da thread de escrita"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            
+            batch = [item]
+            stop_requested = self._collect_batch(batch)
+            
+            # Um job não transacional sempre fecha o lote
+            direct = batch.pop() if not batch[-1].transactional else None
+            if batch:
+                self._write_batch(batch)
+            if direct:
+                self._run_direct(direct)
+            
+            if stop_requested:
+                break
+        
+        # Jobs que chegaram depois do pedido de parada
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item.future.set_exception(sqlite3.ProgrammingError("Fila de escrita encerrada"))
+    
+    def _collect_batch(self, batch: List[WriteJob]) -> bool:
+        """Junta ao lote os jobs já enfileirados e, sob carga, os que chegarem na janela"""
+        deadline = time.monotonic() + self.flush_interval
+        
+        while len(batch) < self.max_batch and batch[-1].transactional:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                # Um job sozinho não espera; a janela só segura lotes que estão crescendo
+                remaining = deadline - time.monotonic()
+                if len(batch) < 2 or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if item is _STOP:
+                return True
+            batch.append(item)
+        
+        return False
+    
+    def _run_direct(self, job: WriteJob):
+        """Executa um job fora de transação (cada comando grava sozinho)"""
+        self._commit_hooks = []
+        try:
+            result = job.func(self.connection)
+            hooks = self._commit_hooks
+        except Exception as e:
+            job.future.set_exception(e)
+            return
+        finally:
+            self._commit_hooks = []
+        
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Erro em hook pós-commit: {e}")
+        job.future.set_result(result)
+    
+    def _write_batch(self, batch: List[WriteJob]):
+        """Executa um lote de jobs em uma única transação"""
+        results = []
+        hooks = []
+        cursor = self.connection.cursor()
+        
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            for job in batch:
+                self._commit_hooks = []
+                cursor.execute("SAVEPOINT write_job")
+                try:
+                    result = job.func(self.connection)
+                    cursor.execute("RELEASE write_job")
+                    results.append((job, result, None))
+                    hooks.extend(self._commit_hooks)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO write_job")
+                    cursor.execute("RELEASE write_job")
+                    results.append((job, None, e))
+            
+            cursor.execute("COMMIT")
+            self.commits += 1
+            self.jobs_written += len(batch)
+            
+        except Exception as e:
+            if self.connection.in_transaction:
+                self.connection.rollback()
+            for job in batch:
+                job.future.set_exception(e)
+            return
+        finally:
+            self._commit_hooks = []
+        
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Erro em hook pós-commit: {e}")
+        
+        for job, result, error in results:
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
\ No newline at end of file
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures compartilhadas dos testes do LinguaMaster Pro
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Permite importar o pacote src a partir da raiz do projeto
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.connection_pool import configure_connection
+from src.core.migrations import apply_migrations
+
+@pytest.fixture
+def connection():
+    """Banco em memória com o esquema completo"""
+    connection = sqlite3.connect(":memory:")
+    configure_connection(connection)
+    apply_migrations(connection)
+    connection.commit()
+    yield connection
+    connection.close()
+
+@pytest.fixture
+def make_users(connection):
+    """Cria usuários ativos e devolve seus ids"""
+    def make(count: int):
+        offset = connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        cursor = connection.cursor()
+        ids = []
+        for number in range(offset + 1, offset + count + 1):
+            cursor.execute(
+                "INSERT INTO users (username, password_hash) VALUES (?, 'x')", (f"user{number}",)
+            )
+            ids.append(cursor.lastrowid)
+        connection.commit()
+        return ids
+    return make
\ No newline at end of file
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do ranking global em memória
+"""
+
+import random
+
+from src.core.leaderboard import Leaderboard
+
+def loaded(connection, make_users, xp_values, page_size=3):
+    """Ranking carregado de usuários com os XPs indicados"""
+    users = make_users(len(xp_values))
+    for user_id, xp in zip(users, xp_values):
+        connection.execute("UPDATE users SET total_xp = ? WHERE id = ?", (xp, user_id))
+    leaderboard = Leaderboard(page_size=page_size)
+    leaderboard.load(connection)
+    return leaderboard, users
+
+def expected_ranks(xp_by_user):
+    """Posições calculadas do zero (empates dividem a posição)"""
+    ordered = sorted(xp_by_user.values(), reverse=True)
+    return {user_id: ordered.index(xp) + 1 for user_id, xp in xp_by_user.items()}
+
+def test_ranks_share_ties(connection, make_users):
+    leaderboard, users = loaded(connection, make_users, [100, 50, 50, 10])
+    assert [leaderboard.rank(user_id) for user_id in users] == [1, 2, 2, 4]
+    assert [entry['rank'] for entry in leaderboard.top(4)] == [1, 2, 2, 4]
+
+def test_cached_page_reflects_tie_changes(connection, make_users):
+    leaderboard, users = loaded(connection, make_users, [100, 50, 50, 40, 10])
+    assert leaderboard.page(1)[0]['rank'] == 4
+    
+    # Alguém na página 0 empata com o primeiro da página 1
+    leaderboard.update(users[1], 40)
+    page = leaderboard.page(1)
+    assert [(entry['user_id'], entry['rank']) for entry in page] == [(users[3], 3), (users[4], 5)]
+
+def test_page_returns_copies(connection, make_users):
+    leaderboard, users = loaded(connection, make_users, [30, 20, 10])
+    leaderboard.page(0)[0]['rank'] = 99
+    assert leaderboard.page(0)[0]['rank'] == 1
+
+def test_around_and_remove(connection, make_users):
+    leaderboard, users = loaded(connection, make_users, [50, 40, 30, 20, 10])
+    assert [entry['user_id'] for entry in leaderboard.around(users[2], radius=1)] == users[1:4]
+    
+    leaderboard.remove(users[0])
+    assert leaderboard.rank(users[1]) == 1
+    assert leaderboard.rank(users[0]) is None
+    assert len(leaderboard) == 4
+
+def test_random_updates_match_recomputed_ranks(connection, make_users):
+    rng = random.Random(7)
+    initial = [rng.randint(0, 20) for _ in range(30)]
+    leaderboard, users = loaded(connection, make_users, initial)
+    xp_by_user = dict(zip(users, initial))
+    
+    for _ in range(300):
+        user_id = rng.choice(users)
+        xp_by_user[user_id] = rng.randint(0, 20)
+        leaderboard.update(user_id, xp_by_user[user_id])
+        
+        # Lê páginas aleatórias para manter o cache parcialmente povoado
+        leaderboard.page(rng.randrange(10))
+        expected = expected_ranks(xp_by_user)
+        entries = leaderboard.top(len(users))
+        assert {entry['user_id']: entry['rank'] for entry in entries} == expected
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das ligas semanais
+"""
+
+from collections import Counter
+
+from src.core import leagues
+
+WEEK_1 = "2026-01-05"
+WEEK_2 = "2026-01-12"
+WEEK_3 = "2026-01-19"
+
+def cohort_sizes(connection, week):
+    """Tamanho de cada grupo (divisão, grupo) da semana"""
+    rows = connection.execute('''
+        SELECT tier, cohort, COUNT(*) FROM league_members
+        WHERE week_start = ? GROUP BY tier, cohort
+    ''', (week,)).fetchall()
+    return {(row[0], row[1]): row[2] for row in rows}
+
+def give_xp(connection, week, xp_by_user):
+    """Grava o XP semanal de cada usuário"""
+    cursor = connection.cursor()
+    for user_id, xp in xp_by_user.items():
+        leagues.add_weekly_xp(cursor, user_id, week, xp)
+
+def test_current_week_is_monday():
+    from datetime import date
+    assert leagues.current_week(date(2026, 1, 8)) == WEEK_1
+    assert leagues.current_week(date(2026, 1, 5)) == WEEK_1
+    assert leagues.current_week(date(2026, 1, 11)) == WEEK_1
+
+def test_join_league_fills_cohorts(connection, make_users):
+    users = make_users(leagues.COHORT_SIZE + 1)
+    cursor = connection.cursor()
+    for user_id in users:
+        leagues.join_league(cursor, user_id, WEEK_1)
+    # Entrar de novo na mesma semana não muda nada
+    leagues.join_league(cursor, users[0], WEEK_1)
+    
+    assert cohort_sizes(connection, WEEK_1) == {(0, 0): leagues.COHORT_SIZE, (0, 1): 1}
+
+def test_rollover_balances_cohorts(connection, make_users):
+    make_users(95)
+    result = leagues.rollover(connection.cursor(), WEEK_1)
+    
+    sizes = cohort_sizes(connection, WEEK_1)
+    assert result['members'] == 95
+    assert len(sizes) == 4
+    assert max(sizes.values()) <= leagues.COHORT_SIZE
+    assert max(sizes.values()) - min(sizes.values()) <= 1
+
+def test_rollover_same_week_is_noop(connection, make_users):
+    make_users(10)
+    leagues.rollover(connection.cursor(), WEEK_1)
+    result = leagues.rollover(connection.cursor(), WEEK_1)
+    assert result == {'week': WEEK_1, 'members': 0, 'promoted': 0, 'demoted': 0}
+
+def test_rollover_promotes_top_of_each_cohort(connection, make_users):
+    users = make_users(40)
+    leagues.rollover(connection.cursor(), WEEK_1)
+    # Dois grupos de 20 (por id); só o primeiro grupo ganhou XP
+    give_xp(connection, WEEK_1, {user_id: 10 + i for i, user_id in enumerate(users[:20])})
+    
+    result = leagues.rollover(connection.cursor(), WEEK_2)
+    
+    tiers = Counter(row[0] for row in connection.execute("SELECT tier FROM league_members"))
+    tier_one = [row[0] for row in connection.execute(
+        "SELECT user_id FROM league_members WHERE tier = 1 ORDER BY user_id"
+    )]
+    assert result['members'] == 40
+    assert result['promoted'] == leagues.PROMOTION_SLOTS
+    assert result['demoted'] == 0  # ninguém cai abaixo da primeira divisão
+    assert tier_one == users[20 - leagues.PROMOTION_SLOTS:20]
+    assert tiers[0] == 40 - leagues.PROMOTION_SLOTS
+
+def test_rollover_demotes_bottom_of_cohort(connection, make_users):
+    users = make_users(60)
+    leagues.rollover(connection.cursor(), WEEK_1)
+    give_xp(connection, WEEK_1, {user_id: 100 + user_id for user_id in users})
+    leagues.rollover(connection.cursor(), WEEK_2)
+    tier_one = [row[0] for row in connection.execute(
+        "SELECT user_id FROM league_members WHERE tier = 1 ORDER BY user_id"
+    )]
+    assert len(tier_one) == 2 * leagues.PROMOTION_SLOTS
+    
+    # Na divisão 1 todos pontuam, menos o último, que fica sem XP
+    give_xp(connection, WEEK_2, {user_id: 50 - i for i, user_id in enumerate(tier_one[:-1])})
+    result = leagues.rollover(connection.cursor(), WEEK_3)
+    
+    history = {row[0]: (row[1], row[2]) for row in connection.execute(
+        "SELECT user_id, tier, new_tier FROM league_history WHERE week_start = ?", (WEEK_2,)
+    )}
+    promoted = [user_id for user_id, (tier, new_tier) in history.items() if new_tier > tier]
+    demoted = [user_id for user_id, (tier, new_tier) in history.items() if new_tier < tier]
+    assert sorted(promoted) == tier_one[:leagues.PROMOTION_SLOTS]
+    assert sorted(demoted) == tier_one[-leagues.DEMOTION_SLOTS:]
+    # Na divisão inicial ninguém pontuou: ninguém sobe nem cai
+    assert result['promoted'] == leagues.PROMOTION_SLOTS
+    assert result['demoted'] == leagues.DEMOTION_SLOTS
+
+def test_rollover_demotes_inactive_in_small_cohort(connection, make_users):
+    users = make_users(7)
+    leagues.rollover(connection.cursor(), WEEK_1)
+    give_xp(connection, WEEK_1, {user_id: 10 for user_id in users})
+    leagues.rollover(connection.cursor(), WEEK_2)
+    
+    # Grupo de 7 na divisão 1: as últimas posições também são de promoção,
+    # então só quem ficou sem XP cai
+    give_xp(connection, WEEK_2, {user_id: 10 for user_id in users[:-1]})
+    result = leagues.rollover(connection.cursor(), WEEK_3)
+    
+    assert result == {'week': WEEK_3, 'members': 7, 'promoted': 6, 'demoted': 1}
+    tier = connection.execute(
+        "SELECT tier FROM league_members WHERE user_id = ?", (users[-1],)
+    ).fetchone()[0]
+    assert tier == 0
+
+def test_rollover_prunes_old_weekly_xp(connection, make_users):
+    users = make_users(3)
+    leagues.rollover(connection.cursor(), WEEK_1)
+    give_xp(connection, "2025-11-03", {users[0]: 5})
+    give_xp(connection, WEEK_1, {users[0]: 5})
+    
+    leagues.rollover(connection.cursor(), WEEK_2)
+    
+    weeks = {row[0] for row in connection.execute("SELECT week_start FROM weekly_xp")}
+    assert weeks == {WEEK_1}
+    assert leagues.get_active_week(connection) == WEEK_2
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das migrações de esquema
+"""
+
+import sqlite3
+
+import pytest
+
+from src.core.migrations import (
+    LATEST_VERSION, MIGRATIONS, Migration, apply_migrations, get_schema_version
+)
+
+def tables(connection):
+    """Nomes das tabelas do banco"""
+    return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+def test_versions_are_sequential():
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, LATEST_VERSION + 1))
+
+def test_fresh_database_reaches_latest_version():
+    connection = sqlite3.connect(":memory:")
+    assert apply_migrations(connection) == list(range(1, LATEST_VERSION + 1))
+    assert get_schema_version(connection) == LATEST_VERSION
+    assert {'users', 'vocabulary', 'league_members', 'user_daily_rollup'} <= tables(connection)
+    # Rodar de novo não aplica nada
+    assert apply_migrations(connection) == []
+
+def test_upgrade_applies_only_pending_migrations():
+    connection = sqlite3.connect(":memory:")
+    apply_migrations(connection, MIGRATIONS[:3])
+    assert get_schema_version(connection) == 3
+    assert apply_migrations(connection) == list(range(4, LATEST_VERSION + 1))
+
+def test_failed_migration_rolls_back_version():
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    apply_migrations(connection, MIGRATIONS[:1])
+    
+    def broken(cursor):
+        cursor.execute("CREATE TABLE temporary_table (id INTEGER)")
+        raise RuntimeError("migração com erro")
+    
+    connection.execute("BEGIN")
+    with pytest.raises(RuntimeError):
+        apply_migrations(connection, MIGRATIONS[:2] + [Migration(3, "Quebrada", broken)])
+    connection.execute("ROLLBACK")
+    
+    assert get_schema_version(connection) == 1
+    assert 'temporary_table' not in tables(connection)
\ No newline at end of file
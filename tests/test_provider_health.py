@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do circuit breaker das APIs de tradução
+"""
+
+import pytest
+
+from src.core import provider_health
+from src.core.provider_health import CLOSED, HALF_OPEN, OPEN, ProviderHealthTracker
+
+class Clock:
+    """Relógio controlado pelo teste"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Substitui time.time() do módulo pelo relógio do teste"""
+    clock = Clock()
+    monkeypatch.setattr(provider_health.time, 'time', clock)
+    return clock
+
+def tracker(**options):
+    """Tracker de duas APIs com limites pequenos"""
+    options.setdefault('failure_threshold', 3)
+    options.setdefault('cooldown', 60)
+    return ProviderHealthTracker(['google', 'mymemory'], **options)
+
+def state(health, name):
+    """Estado do circuito de uma API"""
+    return health.stats()[name]['state']
+
+def test_consecutive_failures_open_circuit(clock):
+    health = tracker()
+    for _ in range(2):
+        health.record_failure('google', 0.1)
+    assert state(health, 'google') == CLOSED
+    
+    health.record_failure('google', 0.1)
+    assert state(health, 'google') == OPEN
+    assert health.ordered(['google', 'mymemory']) == ['mymemory']
+    assert not health.acquire('google')
+
+def test_half_open_allows_single_probe(clock):
+    health = tracker()
+    for _ in range(3):
+        health.record_failure('google', 0.1)
+    
+    clock.now += 61
+    assert health.acquire('google')
+    assert state(health, 'google') == HALF_OPEN
+    assert not health.acquire('google')
+    
+    health.record_success('google', 0.2)
+    assert state(health, 'google') == CLOSED
+    assert health.acquire('google')
+
+def test_failed_probe_doubles_cooldown(clock):
+    health = tracker(max_cooldown=100)
+    for _ in range(3):
+        health.record_failure('google', 0.1)
+    
+    clock.now += 61
+    assert health.acquire('google')
+    health.record_failure('google', 0.1)
+    assert state(health, 'google') == OPEN
+    assert health.stats()['google']['cooldown'] == 100
+    
+    clock.now += 61
+    assert not health.acquire('google')
+    clock.now += 40
+    assert health.acquire('google')
+
+def test_released_probe_can_be_retried(clock):
+    health = tracker()
+    for _ in range(3):
+        health.record_failure('google', 0.1)
+    clock.now += 61
+    assert health.acquire('google')
+    health.release('google')
+    assert health.acquire('google')
+
+def test_failure_rate_opens_circuit(clock):
+    health = tracker(failure_threshold=100, min_samples=10, max_failure_rate=0.5)
+    for _ in range(4):
+        health.record_success('google', 0.1)
+    for _ in range(5):
+        health.record_failure('google', 0.1)
+        health.record_success('google', 0.1)
+        health.record_failure('google', 0.1)
+    assert state(health, 'google') == OPEN
+
+def test_faster_provider_goes_first(clock):
+    health = tracker()
+    for _ in range(5):
+        health.record_success('google', 0.9)
+        health.record_success('mymemory', 0.1)
+    assert health.ordered(['google', 'mymemory']) == ['mymemory', 'google']
+    # Sem medições, vale a ordem configurada
+    assert tracker().ordered(['google', 'mymemory']) == ['google', 'mymemory']
+
+def test_snapshot_restore_round_trip(clock):
+    health = tracker()
+    health.record_success('mymemory', 0.3)
+    for _ in range(3):
+        health.record_failure('google', 0.1)
+    
+    restored = tracker()
+    restored.restore(health.snapshot() + [('desconhecida', OPEN, 1, 0.0, 60, '[]')])
+    assert restored.stats() == health.stats()
+
+def test_state_change_is_saved_at_once(clock):
+    saves = []
+    health = tracker(on_save=lambda: saves.append(True))
+    health.record_failure('google', 0.1)
+    health.record_success('google', 0.1)
+    assert saves == []
+    
+    for _ in range(3):
+        health.record_failure('google', 0.1)
+    assert saves == [True]
+
+def test_samples_are_saved_every_n_calls(clock):
+    saves = []
+    health = tracker(on_save=lambda: saves.append(True), save_every=5)
+    for _ in range(12):
+        health.record_success('mymemory', 0.1)
+    assert len(saves) == 2
+
+def test_samples_are_saved_after_interval(clock):
+    saves = []
+    health = tracker(on_save=lambda: saves.append(True), save_interval=30)
+    health.record_success('google', 0.1)
+    assert saves == []
+    
+    clock.now += 31
+    health.record_success('google', 0.1)
+    assert saves == [True]
+
+def test_save_errors_go_to_logger(clock):
+    class Logger:
+        """Logger que guarda as mensagens de erro"""
+        
+        def __init__(self):
+            self.errors = []
+        
+        def error(self, message):
+            self.errors.append(message)
+    
+    def fail():
+        raise OSError("disco cheio")
+    
+    logger = Logger()
+    health = tracker(on_save=fail, save_every=1, logger=logger)
+    health.record_success('google', 0.1)
+    assert logger.errors == ["Erro ao salvar saúde das APIs: disco cheio"]
\ No newline at end of file
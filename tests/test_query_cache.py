@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do cache de consultas
+"""
+
+from src.core.query_cache import QueryCache
+
+class Loader:
+    """Função de carga que conta quantas vezes foi chamada"""
+    
+    def __init__(self, value="valor"):
+        self.value = value
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+def test_hit_until_table_is_invalidated():
+    cache = QueryCache()
+    load = Loader()
+    cache.get_or_load('progresso', ('users',), load)
+    cache.get_or_load('progresso', ('users',), load)
+    assert load.calls == 1
+    
+    # Escrita em outra tabela não afeta a entrada
+    cache.invalidate(['vocabulary'])
+    cache.get_or_load('progresso', ('users',), load)
+    assert load.calls == 1
+    
+    cache.invalidate(['users'])
+    cache.get_or_load('progresso', ('users',), load)
+    assert load.calls == 2
+    assert cache.stats() == {'hits': 2, 'misses': 2, 'entries': 1}
+
+def test_invalidate_all():
+    cache = QueryCache()
+    load = Loader()
+    cache.get_or_load('a', ('users',), load)
+    cache.invalidate()
+    cache.get_or_load('a', ('users',), load)
+    assert load.calls == 2
+
+def test_write_during_load_is_not_cached():
+    cache = QueryCache()
+    
+    def load():
+        # Uma escrita termina enquanto a leitura ainda está em andamento
+        cache.invalidate(['users'])
+        return "antigo"
+    
+    cache.get_or_load('a', ('users',), load)
+    fresh = Loader("novo")
+    assert cache.get_or_load('a', ('users',), fresh) == "novo"
+    assert fresh.calls == 1
+
+def test_least_recently_used_entry_is_dropped():
+    cache = QueryCache(max_entries=2)
+    loads = {key: Loader(key) for key in "abc"}
+    cache.get_or_load('a', (), loads['a'])
+    cache.get_or_load('b', (), loads['b'])
+    cache.get_or_load('a', (), loads['a'])
+    cache.get_or_load('c', (), loads['c'])
+    
+    cache.get_or_load('a', (), loads['a'])
+    cache.get_or_load('b', (), loads['b'])
+    assert loads['a'].calls == 1
+    assert loads['b'].calls == 2
+
+def test_external_write_clears_cache():
+    data_version = [1]
+    cache = QueryCache()
+    cache.attach_probe(lambda: data_version[0], writer_data_version=1)
+    load = Loader()
+    cache.get_or_load('a', ('users',), load)
+    
+    data_version[0] = 2
+    cache.get_or_load('a', ('users',), load)
+    assert load.calls == 2
+
+def test_local_commit_only_bumps_written_tables():
+    data_version = [1]
+    cache = QueryCache()
+    cache.attach_probe(lambda: data_version[0], writer_data_version=1)
+    users, vocabulary = Loader(), Loader()
+    cache.get_or_load('users', ('users',), users)
+    cache.get_or_load('vocabulary', ('vocabulary',), vocabulary)
+    
+    # Commit local: a sondagem de leitura vê a mudança, a de escrita não
+    data_version[0] = 2
+    cache.after_local_commit(['users'], lambda: 1)
+    cache.get_or_load('users', ('users',), users)
+    cache.get_or_load('vocabulary', ('vocabulary',), vocabulary)
+    assert (users.calls, vocabulary.calls) == (2, 1)
+    
+    # Mudança no data_version da conexão de escrita: outro processo gravou
+    cache.after_local_commit(['users'], lambda: 5)
+    cache.get_or_load('vocabulary', ('vocabulary',), vocabulary)
+    assert vocabulary.calls == 2
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do rastreamento de SQL
+"""
+
+from src.core.sql_trace import SqlTrace, normalize_sql
+
+def traced():
+    """Conexão em memória rastreada, com uma tabela de 100 linhas"""
+    trace = SqlTrace(slow_query_ms=1e9)
+    connection = trace.connect(":memory:")
+    connection.executescript('''
+        CREATE TABLE items (value INTEGER);
+        WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100)
+        INSERT INTO items SELECT i FROM n;
+    ''')
+    return trace, connection
+
+def stats_for(trace, sql):
+    """Estatísticas acumuladas de um comando"""
+    return trace.stats[normalize_sql(sql)]
+
+def test_normalize_collapses_whitespace_and_in_lists():
+    assert normalize_sql("SELECT *\n  FROM t WHERE id IN (?, ?,?)") == "SELECT * FROM t WHERE id IN (?, ...)"
+
+def test_executescript_is_recorded_once():
+    trace, connection = traced()
+    scripts = [key for key in trace.stats if key.startswith("CREATE TABLE items")]
+    assert len(scripts) == 1
+    assert trace.stats[scripts[0]].count == 1
+
+def test_iteration_adds_to_the_same_execution():
+    trace, connection = traced()
+    sql = "SELECT value FROM items"
+    
+    rows = [row[0] for row in connection.execute(sql)]
+    
+    assert rows == list(range(1, 101))
+    stats = stats_for(trace, sql)
+    assert stats.count == 1
+    assert sum(stats.buckets) == 1
+
+def test_iteration_time_is_counted(monkeypatch):
+    trace, connection = traced()
+    sql = "SELECT value FROM items"
+    
+    # Relógio que avança 1 ms a cada leitura
+    ticks = iter(range(0, 10 ** 6))
+    monkeypatch.setattr("src.core.sql_trace.time.perf_counter", lambda: next(ticks) / 1000)
+    for _ in connection.execute(sql):
+        pass
+    
+    # execute() + 100 linhas + o StopIteration final, 1 ms cada
+    assert round(stats_for(trace, sql).total_ms, 6) == 102
+
+def test_fetch_after_execute_updates_histogram():
+    trace, connection = traced()
+    sql = "SELECT COUNT(*) FROM items"
+    assert connection.execute(sql).fetchone()[0] == 100
+    assert connection.execute(sql).fetchall() == [(100,)]
+    stats = stats_for(trace, sql)
+    assert stats.count == 2
+    assert sum(stats.buckets) == 2
\ No newline at end of file
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das estatísticas agregadas por usuário
+"""
+
+from src.core import user_stats
+
+def record(connection, user_id, language_code, correct, total, activity_type='lesson'):
+    """Grava uma atividade e a soma aos agregados, como o DatabaseManager faz"""
+    cursor = connection.cursor()
+    cursor.execute('''
+        INSERT INTO user_activities (user_id, activity_type, language_code, score, max_score,
+                                     xp_earned, time_spent, correct_answers, total_questions)
+        VALUES (?, ?, ?, ?, ?, ?, 60, ?, ?)
+    ''', (user_id, activity_type, language_code, correct, total, correct * 5, correct, total))
+    user_stats.apply_activity(cursor, user_id, language_code, correct, total, 60, correct * 5,
+                              user_stats.is_perfect_lesson(correct, total),
+                              user_stats.is_battle_won(activity_type, correct, total))
+
+def test_incremental_matches_rebuild(connection, make_users):
+    user_id, other = make_users(2)
+    record(connection, user_id, 'en', 10, 10)
+    record(connection, user_id, 'en', 3, 10)
+    record(connection, user_id, 'es', 4, 5, 'battle')
+    record(connection, other, 'en', 1, 5)
+    incremental = user_stats.read_stats(connection, user_id)
+    
+    user_stats.rebuild(connection.cursor())
+    rebuilt = user_stats.read_stats(connection, user_id)
+    
+    for stats in (incremental, rebuilt):
+        assert stats['activities'] == 3
+        assert stats['correct_answers'] == 17
+        assert stats['perfect_lessons'] == 1
+        assert stats['battles_won'] == 1
+        assert round(stats['accuracy'], 1) == 68.0
+        assert set(stats['languages']) == {'en', 'es'}
+
+def test_counts_answers_not_distinct_words(connection, make_users):
+    user_id, = make_users(1)
+    record(connection, user_id, 'en', 5, 5)
+    stats = user_stats.read_stats(connection, user_id)
+    assert 'words_learned' not in stats
+    assert stats['correct_answers'] == 5
+
+def test_user_without_activity(connection, make_users):
+    user_id, = make_users(1)
+    stats = user_stats.read_stats(connection, user_id)
+    assert stats['activities'] == 0
+    assert stats['accuracy'] == 0.0
+    assert stats['languages'] == {}
\ No newline at end of file
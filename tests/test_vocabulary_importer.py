@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do importador de pacotes de vocabulário
+"""
+
+import json
+
+import pytest
+
+from src.core.database import DatabaseManager
+from src.core.vocabulary_importer import iter_vocabulary_rows
+
+PACK = {
+    "english": {
+        "beginner": [
+            {"word": "hello", "translation": "olá", "category": "greetings"},
+            {"word": "cat", "translation": "gato"},
+            {"word": "", "translation": "ignorada"}
+        ]
+    },
+    "spanish": {
+        "intermediate": [
+            {"word": "gato", "translation": "gato", "example": "El gato duerme."}
+        ]
+    }
+}
+
+@pytest.fixture
+def pack(tmp_path):
+    """Pacote JSON pequeno em disco"""
+    path = tmp_path / "pack.json"
+    path.write_text(json.dumps(PACK, ensure_ascii=False), encoding='utf-8')
+    return path
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """DatabaseManager com o esquema completo"""
+    db_manager = DatabaseManager(str(tmp_path / "app.db"))
+    assert db_manager.initialize_database()
+    yield db_manager
+    db_manager.close()
+
+def test_rows_skip_incomplete_entries(pack):
+    rows = list(iter_vocabulary_rows(pack))
+    assert [(row[0], row[3], row[4]) for row in rows] == [
+        ('hello', 'en', 'beginner'), ('cat', 'en', 'beginner'), ('gato', 'es', 'intermediate')
+    ]
+    assert rows[2][7] == "El gato duerme."
+
+def test_unchanged_pack_is_skipped(db_manager, pack):
+    assert db_manager.import_vocabulary_pack(pack) == 3
+    assert db_manager.import_vocabulary_pack(pack) == 0
+
+def test_changed_pack_updates_words_in_place(db_manager, pack):
+    db_manager.import_vocabulary_pack(pack)
+    with db_manager._reader() as conn:
+        word_id = conn.execute("SELECT id FROM vocabulary WHERE word = 'cat'").fetchone()[0]
+    
+    changed = json.loads(json.dumps(PACK))
+    changed["english"]["beginner"][1]["translation"] = "gatinho"
+    pack.write_text(json.dumps(changed, ensure_ascii=False), encoding='utf-8')
+    assert db_manager.import_vocabulary_pack(pack) == 3
+    
+    with db_manager._reader() as conn:
+        row = conn.execute("SELECT id, translation FROM vocabulary WHERE word = 'cat'").fetchone()
+        total = conn.execute("SELECT COUNT(*) FROM vocabulary").fetchone()[0]
+    # O upsert mantém o id, de modo que favoritos continuam válidos
+    assert (row[0], row[1]) == (word_id, "gatinho")
+    assert total == 3
\ No newline at end of file
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do sorteio de vocabulário
+"""
+
+import random
+
+import pytest
+
+from src.core.vocabulary_sampler import VocabularySampler
+
+@pytest.fixture
+def words(connection):
+    """100 palavras de inglês iniciante e 5 de espanhol"""
+    rows = [(f"word{i}", f"palavra{i}", 'pt', 'en', 'beginner') for i in range(100)]
+    rows += [(f"palabra{i}", f"palavra{i}", 'pt', 'es', 'beginner') for i in range(5)]
+    connection.executemany('''
+        INSERT INTO vocabulary (word, translation, source_language, target_language, difficulty_level)
+        VALUES (?, ?, ?, ?, ?)
+    ''', rows)
+    connection.commit()
+    return [row[0] for row in connection.execute(
+        "SELECT id FROM vocabulary WHERE target_language = 'en'"
+    )]
+
+def test_sample_is_distinct_and_respects_exclude(connection, words):
+    sampler = VocabularySampler(random.Random(1))
+    excluded = set(words[:50])
+    picked = sampler.sample_ids(connection, 'en', 'beginner', 10, exclude=excluded)
+    assert len(picked) == 10
+    assert len(set(picked)) == 10
+    assert not excluded & set(picked)
+    assert set(picked) <= set(words)
+
+def test_sample_larger_than_level(connection, words):
+    sampler = VocabularySampler(random.Random(1))
+    assert sorted(sampler.sample_ids(connection, 'es', 'beginner', 10)) == list(range(101, 106))
+    assert sampler.sample_ids(connection, 'de', 'beginner', 10) == []
+
+def test_exclusion_covering_almost_everything(connection, words):
+    sampler = VocabularySampler(random.Random(1))
+    picked = sampler.sample_ids(connection, 'en', 'beginner', 5, exclude=words[:98])
+    assert sorted(picked) == sorted(words[98:])
+
+def test_ids_are_cached_until_invalidated(connection, words):
+    sampler = VocabularySampler(random.Random(1))
+    sampler.sample_ids(connection, 'en', 'beginner', 1)
+    connection.execute('''
+        INSERT INTO vocabulary (word, translation, source_language, target_language, difficulty_level)
+        VALUES ('new', 'novo', 'pt', 'en', 'beginner')
+    ''')
+    assert len(sampler.sample_ids(connection, 'en', 'beginner', 200)) == 100
+    
+    sampler.invalidate('en')
+    assert len(sampler.sample_ids(connection, 'en', 'beginner', 200)) == 101
\ No newline at end of file
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da fila de escrita com commit em grupo
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.core.write_queue import WriteQueue
+
+@pytest.fixture
+def writer(tmp_path):
+    """Fila de escrita sobre um banco em arquivo com uma tabela simples"""
+    connection = sqlite3.connect(str(tmp_path / "writes.db"), check_same_thread=False)
+    connection.execute("CREATE TABLE items (value INTEGER UNIQUE)")
+    connection.commit()
+    queue = WriteQueue(connection, flush_interval=0.01)
+    queue.start()
+    yield queue
+    queue.stop(timeout=5)
+    connection.close()
+
+def insert(value):
+    """Job que insere um valor"""
+    return lambda conn: conn.execute("INSERT INTO items VALUES (?)", (value,)).lastrowid
+
+def values(queue):
+    """Valores gravados, lidos depois de esvaziar a fila"""
+    assert queue.flush(timeout=5)
+    return [row[0] for row in queue.connection.execute("SELECT value FROM items ORDER BY value")]
+
+def hold(queue):
+    """Prende a thread de escrita até o evento devolvido ser liberado
+    
+    Os jobs enviados enquanto ela está presa caem todos no lote seguinte.
+    """
+    started = threading.Event()
+    gate = threading.Event()
+    
+    def job(conn):
+        started.set()
+        gate.wait(5)
+    
+    queue.submit(job)
+    assert started.wait(5)
+    return gate
+
+def test_job_result_is_delivered(writer):
+    assert writer.submit(insert(1)).result(timeout=5) == 1
+    assert values(writer) == [1]
+
+def test_failed_job_only_rolls_back_itself(writer):
+    commits = writer.commits
+    gate = hold(writer)
+    
+    def fails(conn):
+        conn.execute("INSERT INTO items VALUES (2)")
+        conn.execute("INSERT INTO items VALUES (1)")  # viola o UNIQUE
+    
+    futures = [writer.submit(insert(1)), writer.submit(fails), writer.submit(insert(3))]
+    gate.set()
+    
+    assert futures[0].result(timeout=5) is not None
+    with pytest.raises(sqlite3.IntegrityError):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5) is not None
+    # O insert do 2 feito pelo job que falhou foi desfeito junto com ele
+    # Lote do job que segurou a fila + um único lote para os três jobs
+    assert writer.commits == commits + 2
+    assert values(writer) == [1, 3]
+
+def test_commit_hooks_run_only_for_successful_jobs(writer):
+    ran = []
+    
+    def succeeds(conn):
+        writer.on_commit(lambda: ran.append("ok"))
+    
+    def fails(conn):
+        writer.on_commit(lambda: ran.append("falhou"))
+        raise ValueError("erro no job")
+    
+    writer.submit(succeeds).result(timeout=5)
+    with pytest.raises(ValueError):
+        writer.submit(fails).result(timeout=5)
+    assert ran == ["ok"]
+
+def test_hooks_run_before_future_resolves(writer):
+    ran = []
+    
+    def job(conn):
+        writer.on_commit(lambda: ran.append(True))
+        return "feito"
+    
+    assert writer.submit(job).result(timeout=5) == "feito"
+    assert ran == [True]
+
+def test_non_transactional_job_runs_outside_transaction(writer):
+    in_transaction = writer.submit(lambda conn: conn.in_transaction, transactional=False)
+    assert in_transaction.result(timeout=5) is False
+
+def test_queued_jobs_share_one_commit(writer):
+    commits = writer.commits
+    gate = hold(writer)
+    futures = [writer.submit(insert(value)) for value in range(50)]
+    gate.set()
+    
+    for future in futures:
+        future.result(timeout=5)
+    assert writer.commits == commits + 2
+
+def test_lone_job_does_not_wait_for_flush_window(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / "lone.db"), check_same_thread=False)
+    connection.execute("CREATE TABLE items (value INTEGER)")
+    queue = WriteQueue(connection, flush_interval=5)
+    queue.start()
+    try:
+        started = time.monotonic()
+        queue.submit(insert(1)).result(timeout=5)
+        assert time.monotonic() - started < 1
+    finally:
+        queue.stop(timeout=5)
+        connection.close()
+
+def test_stop_writes_pending_jobs(writer):
+    futures = [writer.submit(insert(value)) for value in range(20)]
+    writer.stop(timeout=5)
+    
+    assert all(future.done() and future.exception() is None for future in futures)
+    count = writer.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    assert count == 20
+
+def test_submit_after_stop_fails_immediately(writer):
+    writer.stop(timeout=5)
+    future = writer.submit(insert(1))
+    assert future.done()
+    with pytest.raises(sqlite3.ProgrammingError):
+        future.result()
+
+def test_submit_racing_stop_never_leaves_future_pending(tmp_path):
+    for attempt in range(20):
+        connection = sqlite3.connect(str(tmp_path / f"race{attempt}.db"), check_same_thread=False)
+        connection.execute("CREATE TABLE items (value INTEGER)")
+        connection.commit()
+        queue = WriteQueue(connection, flush_interval=0.001)
+        queue.start()
+        
+        futures = []
+        start = threading.Event()
+        
+        def producer():
+            start.wait()
+            for value in range(50):
+                futures.append(queue.submit(insert(value)))
+        
+        threads = [threading.Thread(target=producer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        queue.stop(timeout=5)
+        for thread in threads:
+            thread.join()
+        
+        # Cada job ou foi gravado ou foi recusado; nenhum fica sem resposta
+        for future in futures:
+            error = future.exception(timeout=5)
+            assert error is None or isinstance(error, sqlite3.ProgrammingError)
+        connection.close()
\ No newline at end of file
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark dos Índices do LinguaMaster Pro
+Mede as consultas críticas antes e depois da migração de índices
+
+Uso:
+    python tools/bench_indexes.py [--activities 1000000] [--db bench_indexes.db]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+# Permite importar o pacote src a partir da raiz do projeto
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.migrations import MIGRATIONS, apply_migrations
+from src.core.query_plans import HOT_QUERIES, explain, is_full_scan
+
+LANGUAGES = ['en', 'es', 'de', 'pt']
+DIFFICULTIES = ['beginner', 'intermediate', 'advanced']
+
+def populate(connection: sqlite3.Connection, users: int, vocabulary: int,
+             activities: int, translations: int):
+    """Preenche o banco com dados sintéticos simples"""
+    rng = random.Random(42)
+    cursor = connection.cursor()
+    cursor.execute("BEGIN")
+    
+    cursor.executemany(
+        "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+        ((f"user{i}", "hash") for i in range(users))
+    )
+    cursor.executemany(
+        "INSERT INTO user_language_progress (user_id, language_code, xp) VALUES (?, ?, ?)",
+        ((user_id, lang, rng.randint(0, 5000))
+         for user_id in range(1, users + 1) for lang in LANGUAGES[:2])
+    )
+    cursor.executemany(
+        '''INSERT INTO vocabulary (word, translation, source_language, target_language, difficulty_level)
+           VALUES (?, ?, 'pt', ?, ?)''',
+        ((f"word{i}", f"palavra{i}", LANGUAGES[i % 3], DIFFICULTIES[i % 3]) for i in range(vocabulary))
+    )
+    cursor.executemany(
+        '''INSERT INTO user_activities (user_id, activity_type, language_code, score, xp_earned, completed_at)
+           VALUES (?, 'quiz', ?, ?, ?, datetime('2023-01-01', ? || ' minutes'))''',
+        ((rng.randint(1, users), rng.choice(LANGUAGES), rng.randint(0, 100), rng.randint(0, 50), i)
+         for i in range(activities))
+    )
+    cursor.executemany(
+        '''INSERT INTO translation_history (user_id, source_text, translated_text, source_language,
+           target_language, created_at)
+           VALUES (?, ?, ?, 'pt', 'en', datetime('2023-01-01', ? || ' minutes'))''',
+        ((rng.randint(1, users), f"texto {i}", f"text {i}", i) for i in range(translations))
+    )
+    cursor.execute("COMMIT")
+
+def time_queries(connection: sqlite3.Connection, repeat: int):
+    """Mede o tempo médio de cada consulta crítica em milissegundos
+    
+    Consultas sobre tabelas ou colunas criadas por migrações posteriores
+    ficam como None (não existem no esquema sem índices).
+    """
+    results = {}
+    for name, (sql, params) in HOT_QUERIES.items():
+        try:
+            plan = explain(connection, sql, params)
+        except sqlite3.OperationalError:
+            results[name] = None
+            continue
+        start = time.perf_counter()
+        for _ in range(repeat):
+            connection.execute(sql, params).fetchall()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        results[name] = (elapsed_ms, is_full_scan(plan))
+    return results
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark dos índices das consultas críticas")
+    parser.add_argument('--db', default="bench_indexes.db", help="Arquivo temporário do banco")
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--vocabulary', type=int, default=30000)
+    parser.add_argument('--activities', type=int, default=1000000)
+    parser.add_argument('--translations', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    
+    if os.path.exists(args.db):
+        os.remove(args.db)
+    
+    connection = sqlite3.connect(args.db, isolation_level=None)
+    
+    # Esquema sem índices (somente a migração 1)
+    connection.execute("BEGIN")
+    apply_migrations(connection, MIGRATIONS[:1])
+    connection.execute("COMMIT")
+    
+    print(f"📦 Gerando {args.activities} atividades...")
+    start = time.perf_counter()
+    populate(connection, args.users, args.vocabulary, args.activities, args.translations)
+    print(f"   pronto em {time.perf_counter() - start:.1f}s")
+    
+    before = time_queries(connection, args.repeat)
+    
+    connection.execute("BEGIN")
+    apply_migrations(connection)
+    connection.execute("COMMIT")
+    
+    after = time_queries(connection, args.repeat)
+    connection.close()
+    
+    print(f"\n{'consulta':<28}{'antes (ms)':>12}{'depois (ms)':>13}{'ganho':>9}")
+    skipped = []
+    for name in HOT_QUERIES:
+        if after[name] is None:
+            skipped.append(name)
+            continue
+        after_ms, after_scan = after[name]
+        flags = " SCAN" if after_scan else ""
+        if before[name] is None:
+            # Tabela criada por uma migração posterior: só há a medição "depois"
+            print(f"{name:<28}{'—':>12}{after_ms:>13.3f}{'—':>9}{flags}")
+            continue
+        before_ms, _ = before[name]
+        speedup = before_ms / after_ms if after_ms else float('inf')
+        print(f"{name:<28}{before_ms:>12.3f}{after_ms:>13.3f}{speedup:>8.0f}x{flags}")
+    
+    missing = [name for name in HOT_QUERIES if before[name] is None and name not in skipped]
+    if missing:
+        print(f"\n⚠️  Sem medição \"antes\" (esquema da migração 1): {', '.join(missing)}")
+    if skipped:
+        print(f"⚠️  Não executadas: {', '.join(skipped)}")
+    
+    os.remove(args.db)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
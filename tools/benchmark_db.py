@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do DatabaseManager do LinguaMaster Pro
+Mede as operações principais em bancos sintéticos de 10 mil, 100 mil e 1 milhão de atividades
+
+Uso:
+    python tools/benchmark_db.py [--scales 10000,100000,1000000] [--output resultado.json]
+    python tools/benchmark_db.py --compare resultado_anterior.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from concurrent.futures import wait
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Permite importar o pacote src a partir da raiz do projeto
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.database import DatabaseManager
+from tools.synthetic_data import DIFFICULTY_WEIGHTS, LANGUAGE_WEIGHTS, PASSWORD_TEMPLATE, generate
+
+LANGUAGES = list(LANGUAGE_WEIGHTS)
+DIFFICULTIES = list(DIFFICULTY_WEIGHTS)
+
+def dataset_sizes(activities: int) -> Dict[str, int]:
+    """Tamanho das demais tabelas para uma escala (proporções de uso real)"""
+    return {
+        'users': max(100, activities // 100),
+        'vocabulary': max(1000, activities // 20),
+        'activities': activities,
+        'translations': activities // 5,
+    }
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Estatísticas das latências (em ms)"""
+    ordered = sorted(samples)
+    percentiles = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        'mean_ms': round(total / len(ordered), 4),
+        'p50_ms': round(percentiles[49], 4),
+        'p95_ms': round(percentiles[94], 4),
+        'p99_ms': round(percentiles[98], 4),
+        'max_ms': round(ordered[-1], 4),
+        'ops_per_s': round(len(ordered) / (total / 1000), 1) if total else 0.0,
+    }
+
+def measure(operation: Callable[[], object], iterations: int, warmup: int = 10) -> Dict[str, float]:
+    """Latência de chamadas sequenciais"""
+    for _ in range(warmup):
+        operation()
+    
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+def measure_throughput(submit: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Vazão de escritas enfileiradas de uma vez (aproveita o group commit)"""
+    started = time.perf_counter()
+    futures = [submit() for _ in range(iterations)]
+    wait(futures)
+    elapsed = time.perf_counter() - started
+    failures = sum(1 for future in futures if future.exception() or future.result() is False)
+    return {
+        'count': iterations,
+        'failures': failures,
+        'total_s': round(elapsed, 3),
+        'ops_per_s': round(iterations / elapsed, 1),
+    }
+
+def run_scale(db_path: str, activities: int, args) -> Dict:
+    """Gera (ou reaproveita) o banco de uma escala e mede as operações"""
+    sizes = dataset_sizes(activities)
+    result = {'rows': sizes}
+    
+    if not os.path.exists(db_path):
+        print(f"📦 Gerando {db_path}...")
+        result['generate'] = generate(db_path, sizes['users'], sizes['vocabulary'],
+                                      sizes['activities'], sizes['translations'], seed=args.seed)
+    result['file_mb'] = round(os.path.getsize(db_path) / 1024 / 1024, 1)
+    
+    db_manager = DatabaseManager(db_path, flush_interval=args.flush_interval,
+                                 cache_size=args.cache_size)
+    if not db_manager.initialize_database():
+        raise RuntimeError(f"Falha ao abrir {db_path}")
+    
+    rng = random.Random(args.seed)
+    users = sizes['users']
+    
+    def random_user() -> int:
+        return rng.randint(1, users)
+    
+    def authenticate():
+        user_id = random_user()
+        return db_manager.authenticate_user(f"user{user_id}", PASSWORD_TEMPLATE.format(user_id))
+    
+    def activity_args():
+        total = rng.choice((5, 10, 20))
+        correct = rng.randint(0, total)
+        return (random_user(), 'lesson', rng.choice(LANGUAGES), correct, total, correct * 5)
+    
+    reads = {
+        'authenticate_user': authenticate,
+        'get_user_progress': lambda: db_manager.get_user_progress(random_user()),
+        'get_vocabulary_for_lesson': lambda: db_manager.get_vocabulary_for_lesson(
+            rng.choice(LANGUAGES), rng.choice(DIFFICULTIES)
+        ),
+    }
+    writes = {
+        'record_activity': lambda: db_manager.record_activity(*activity_args(), time_spent=120),
+        'update_user_xp': lambda: db_manager.update_user_xp(
+            random_user(), rng.randint(5, 50), rng.choice(LANGUAGES)
+        ),
+    }
+    queued = {
+        'record_activity_async': lambda: db_manager.record_activity_async(*activity_args(), time_spent=120),
+        'update_user_xp_async': lambda: db_manager.update_user_xp_async(
+            random_user(), rng.randint(5, 50), rng.choice(LANGUAGES)
+        ),
+    }
+    
+    operations = {}
+    try:
+        for name, operation in reads.items():
+            operations[name] = measure(operation, args.iterations)
+            print(f"   {name:<28} p50 {operations[name]['p50_ms']:>8.3f} ms  "
+                  f"p95 {operations[name]['p95_ms']:>8.3f} ms")
+        for name, operation in writes.items():
+            operations[name] = measure(operation, args.write_iterations, warmup=2)
+            print(f"   {name:<28} p50 {operations[name]['p50_ms']:>8.3f} ms  "
+                  f"p95 {operations[name]['p95_ms']:>8.3f} ms")
+        for name, submit in queued.items():
+            operations[name] = measure_throughput(submit, args.queued_iterations)
+            print(f"   {name:<28} {operations[name]['ops_per_s']:>10.1f} ops/s")
+    finally:
+        db_manager.close()
+    
+    result['operations'] = operations
+    return result
+
+def compare(baseline: Dict, current: Dict):
+    """Mostra a variação da mediana (ou da vazão) em relação a uma execução anterior"""
+    print(f"\n{'escala':>10}  {'operação':<28}{'antes':>12}{'agora':>12}{'variação':>10}")
+    for scale, result in current['results'].items():
+        previous = baseline.get('results', {}).get(scale)
+        if not previous:
+            continue
+        for name, stats in result['operations'].items():
+            old = previous['operations'].get(name)
+            if not old:
+                continue
+            # Para latência, menor é melhor; para vazão, maior é melhor
+            key = 'p50_ms' if 'p50_ms' in stats else 'ops_per_s'
+            change = (stats[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            print(f"{scale:>10}  {name:<28}{old[key]:>12.3f}{stats[key]:>12.3f}{change:>+9.1f}%")
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark das operações do DatabaseManager")
+    parser.add_argument('--scales', default="10000,100000,1000000",
+                        help="Quantidades de atividades, separadas por vírgula")
+    parser.add_argument('--workdir', default="bench_data",
+                        help="Pasta dos bancos gerados (reaproveitados entre execuções)")
+    parser.add_argument('--output', default=None, help="Arquivo JSON de resultado")
+    parser.add_argument('--compare', default=None, help="JSON de uma execução anterior")
+    parser.add_argument('--iterations', type=int, default=500, help="Repetições de cada leitura")
+    parser.add_argument('--write-iterations', type=int, default=100,
+                        help="Repetições de cada escrita síncrona")
+    parser.add_argument('--queued-iterations', type=int, default=2000,
+                        help="Escritas enfileiradas no teste de vazão")
+    parser.add_argument('--flush-interval', type=float, default=0.02)
+    parser.add_argument('--cache-size', type=int, default=0,
+                        help="Cache de consultas (0 mede sempre o banco)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--fresh', action='store_true', help="Gera os bancos novamente")
+    args = parser.parse_args()
+    
+    scales = [int(value) for value in args.scales.split(',') if value.strip()]
+    os.makedirs(args.workdir, exist_ok=True)
+    
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'settings': {
+            'iterations': args.iterations,
+            'write_iterations': args.write_iterations,
+            'queued_iterations': args.queued_iterations,
+            'flush_interval': args.flush_interval,
+            'cache_size': args.cache_size,
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+    
+    for activities in scales:
+        db_path = os.path.join(args.workdir, f"bench_{activities}.db")
+        if args.fresh:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+        
+        print(f"\n⏱️  Escala: {activities} atividades")
+        report['results'][str(activities)] = run_scale(db_path, activities, args)
+    
+    output = args.output or f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"\n💾 Resultado salvo em {output}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            compare(json.load(file), report)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
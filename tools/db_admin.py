@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ferramentas de Administração do Banco do LinguaMaster Pro
+Comandos de linha para manutenção e diagnóstico do banco SQLite
+
+Uso:
+    python tools/db_admin.py plans [--db linguamaster.db]
+    python tools/db_admin.py rebuild-stats [--user ID]
+    python tools/db_admin.py rollover-leagues
+    python tools/db_admin.py purge-history [--days 365] [--archive DIR]
+"""
+
+import argparse
+import os
+import sys
+
+# Permite importar o pacote src a partir da raiz do projeto
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.database import DatabaseManager
+
+def cmd_plans(db_manager: DatabaseManager, args) -> int:
+    """Mostra o plano das consultas críticas e falha se houver varredura completa"""
+    results = db_manager.check_query_plans()
+    if not results:
+        print("❌ Não foi possível verificar os planos de consulta")
+        return 1
+    
+    failures = 0
+    for result in results:
+        status = "❌ SCAN" if result['full_scan'] else "✅"
+        print(f"{status} {result['name']}")
+        for detail in result['plan']:
+            print(f"      {detail}")
+        if result['full_scan']:
+            failures += 1
+    
+    if failures:
+        print(f"\n{failures} consulta(s) com varredura completa")
+        return 1
+    
+    print("\nTodas as consultas críticas usam índices")
+    return 0
+
+def cmd_rebuild_stats(db_manager: DatabaseManager, args) -> int:
+    """Recalcula as estatísticas agregadas a partir do histórico"""
+    if not db_manager.rebuild_user_stats(args.user):
+        print("❌ Falha ao recalcular estatísticas")
+        return 1
+    
+    target = f"usuário {args.user}" if args.user is not None else "todos os usuários"
+    print(f"✅ Estatísticas recalculadas para {target}")
+    return 0
+
+def cmd_rollover_leagues(db_manager: DatabaseManager, args) -> int:
+    """Fecha a semana das ligas, se já terminou, e monta os novos grupos"""
+    if not db_manager.rollover_leagues():
+        print("❌ Falha ao virar a semana das ligas")
+        return 1
+    
+    print("✅ Ligas em dia")
+    return 0
+
+def cmd_purge_history(db_manager: DatabaseManager, args) -> int:
+    """Remove em lotes o histórico detalhado mais antigo que --days"""
+    removed = db_manager.apply_retention(args.days, archive_dir=args.archive)
+    if not removed:
+        print("❌ Falha ao aplicar a retenção do histórico")
+        return 1
+    
+    for table, count in removed.items():
+        print(f"✅ {table}: {count} linhas removidas")
+    return 0
+
+COMMANDS = {
+    'plans': cmd_plans,
+    'rebuild-stats': cmd_rebuild_stats,
+    'rollover-leagues': cmd_rollover_leagues,
+    'purge-history': cmd_purge_history,
+}
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Administração do banco do LinguaMaster Pro")
+    parser.add_argument('command', choices=sorted(COMMANDS), help="Comando a executar")
+    parser.add_argument('--db', default="linguamaster.db", help="Arquivo do banco de dados")
+    parser.add_argument('--user', type=int, default=None, help="Restringe o comando a um usuário")
+    parser.add_argument('--days', type=int, default=365, help="Idade máxima do histórico mantido")
+    parser.add_argument('--archive', default=None, help="Pasta para a cópia compactada do histórico")
+    args = parser.parse_args()
+    
+    db_manager = DatabaseManager(args.db)
+    if not db_manager.initialize_database():
+        sys.exit(1)
+    
+    try:
+        exit_code = COMMANDS[args.command](db_manager, args)
+    finally:
+        db_manager.close()
+    
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de Dados Sintéticos do LinguaMaster Pro
+Preenche um banco com usuários, vocabulário, atividades e traduções realistas
+
+Uso:
+    python tools/synthetic_data.py [--db synthetic.db] [--users 10000] [--activities 1000000]
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+# Permite importar o pacote src a partir da raiz do projeto
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.database import DatabaseManager
+from src.core import user_stats
+
+# Pesos aproximados do uso real: inglês domina, alemão é minoria
+LANGUAGE_WEIGHTS = {'en': 0.50, 'es': 0.30, 'de': 0.15, 'pt': 0.05}
+DIFFICULTY_WEIGHTS = {'beginner': 0.5, 'intermediate': 0.35, 'advanced': 0.15}
+ACTIVITY_WEIGHTS = {'lesson': 0.40, 'quiz': 0.25, 'flashcards': 0.20, 'association': 0.10, 'battle': 0.05}
+CATEGORIES = ['saudações', 'comida', 'viagem', 'trabalho', 'família', 'números', 'cores', 'verbos']
+
+# Peso de cada hora do dia (pico à noite, quase nada de madrugada)
+HOUR_WEIGHTS = [1, 0.5, 0.3, 0.2, 0.2, 0.5, 2, 4, 5, 4, 3, 3,
+                4, 4, 3, 3, 4, 5, 7, 9, 10, 9, 6, 3]
+
+# Cada usuário sintético tem a senha "senha{n}" (n = id)
+PASSWORD_TEMPLATE = "senha{}"
+
+BATCH_SIZE = 50000
+
+def _weighted(rng: random.Random, weights: Dict[str, float], count: int):
+    """Sorteia `count` chaves de acordo com os pesos"""
+    return rng.choices(list(weights), weights=list(weights.values()), k=count)
+
+def _user_weights(rng: random.Random, users: int):
+    """Atividade por usuário com cauda longa (poucos usuários muito ativos)"""
+    return [rng.paretovariate(1.2) for _ in range(users)]
+
+def _timestamps(rng: random.Random, count: int, now: datetime, days: int):
+    """Datas no formato de CURRENT_TIMESTAMP, mais densas nos dias recentes"""
+    day_names = [(now - timedelta(days=age)).strftime('%Y-%m-%d') for age in range(days)]
+    hours = rng.choices(range(24), weights=HOUR_WEIGHTS, k=count)
+    for hour in hours:
+        age_days = min(days - 1, int(rng.expovariate(3 / days)))
+        minute, second = divmod(rng.randrange(3600), 60)
+        yield f"{day_names[age_days]} {hour:02d}:{minute:02d}:{second:02d}"
+
+def _insert_batches(cursor: sqlite3.Cursor, sql: str, rows, total: int, label: str):
+    """executemany em lotes, mostrando o andamento"""
+    batch = []
+    done = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            cursor.executemany(sql, batch)
+            done += len(batch)
+            batch = []
+            print(f"\r   {label}: {done}/{total}", end="", flush=True)
+    if batch:
+        cursor.executemany(sql, batch)
+        done += len(batch)
+    print(f"\r   {label}: {done}/{total}")
+
+def _users(rng: random.Random, count: int, now: datetime):
+    """Linhas de users"""
+    for user_id in range(1, count + 1):
+        password_hash = hashlib.sha256(PASSWORD_TEMPLATE.format(user_id).encode()).hexdigest()
+        created = now - timedelta(days=rng.randint(0, 730))
+        yield (f"user{user_id}", f"user{user_id}@example.com", password_hash, f"Usuário {user_id}",
+               created.strftime('%Y-%m-%d %H:%M:%S'))
+
+def _vocabulary(rng: random.Random, count: int):
+    """Linhas de vocabulary"""
+    languages = _weighted(rng, LANGUAGE_WEIGHTS, count)
+    difficulties = _weighted(rng, DIFFICULTY_WEIGHTS, count)
+    for i in range(count):
+        yield (f"word{i}", f"palavra{i}", 'pt', languages[i], difficulties[i],
+               rng.choice(CATEGORIES), f"Exemplo com word{i}.", f"Exemplo com palavra{i}.")
+
+def _activities(rng: random.Random, count: int, users: int, now: datetime, days: int):
+    """Linhas de user_activities"""
+    user_ids = rng.choices(range(1, users + 1), weights=_user_weights(rng, users), k=count)
+    languages = _weighted(rng, LANGUAGE_WEIGHTS, count)
+    types = _weighted(rng, ACTIVITY_WEIGHTS, count)
+    difficulties = _weighted(rng, DIFFICULTY_WEIGHTS, count)
+    timestamps = _timestamps(rng, count, now, days)
+    for i in range(count):
+        total = rng.choice((5, 10, 10, 15, 20))
+        # Acerto concentrado entre 60% e 100%
+        correct = min(total, round(total * rng.betavariate(5, 1.5)))
+        time_spent = int(min(1800, rng.lognormvariate(math.log(180), 0.6)))
+        yield (user_ids[i], types[i], languages[i], correct, total, correct * 5, time_spent,
+               correct, total, difficulties[i], next(timestamps))
+
+def _translations(rng: random.Random, count: int, users: int, now: datetime, days: int):
+    """Linhas de translation_history"""
+    user_ids = rng.choices(range(1, users + 1), weights=_user_weights(rng, users), k=count)
+    languages = _weighted(rng, LANGUAGE_WEIGHTS, count)
+    timestamps = _timestamps(rng, count, now, days)
+    for i in range(count):
+        words = rng.randint(1, 12)
+        yield (user_ids[i], " ".join(f"texto{i}" for _ in range(words)),
+               " ".join(f"text{i}" for _ in range(words)), 'pt', languages[i],
+               rng.choice(('googletrans', 'mymemory')), next(timestamps))
+
+def _derive_totals(cursor: sqlite3.Cursor):
+    """Recalcula XP, progresso por idioma e agregados a partir das atividades"""
+    cursor.execute('''
+        UPDATE users SET total_xp = COALESCE(
+            (SELECT SUM(xp_earned) FROM user_activities a WHERE a.user_id = users.id), 0
+        )
+    ''')
+    cursor.execute("UPDATE users SET level = 1 + total_xp / 100")
+    cursor.execute('''
+        INSERT OR REPLACE INTO user_language_progress
+        (user_id, language_code, level, xp, lessons_completed, accuracy_rate, time_studied)
+        SELECT user_id, language_code, 1 + SUM(xp_earned) / 100, SUM(xp_earned),
+               SUM(activity_type = 'lesson'),
+               ROUND(100.0 * SUM(correct_answers) / MAX(SUM(total_questions), 1), 1),
+               SUM(time_spent)
+        FROM user_activities
+        GROUP BY user_id, language_code
+    ''')
+    cursor.execute('''
+        INSERT OR REPLACE INTO user_daily_rollup
+        (user_id, day, language_code, activities, xp, time_spent, correct_answers, total_questions)
+        SELECT user_id, date(completed_at, 'localtime'), language_code, COUNT(*), SUM(xp_earned),
+               SUM(time_spent), SUM(correct_answers), SUM(total_questions)
+        FROM user_activities
+        GROUP BY user_id, date(completed_at, 'localtime'), language_code
+    ''')
+    cursor.execute('''
+        INSERT INTO user_daily_rollup (user_id, day, language_code, translations)
+        SELECT user_id, date(created_at, 'localtime'), target_language, COUNT(*)
+        FROM translation_history
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id, date(created_at, 'localtime'), target_language
+        ON CONFLICT (user_id, day, language_code) DO UPDATE SET translations = excluded.translations
+    ''')
+    user_stats.rebuild(cursor)
+
+def generate(db_path: str, users: int, vocabulary: int, activities: int, translations: int,
+             days: int = 365, seed: int = 42) -> Dict[str, float]:
+    """Cria o banco com o esquema atual e o preenche; devolve os tempos de cada etapa"""
+    if os.path.exists(db_path):
+        raise FileExistsError(f"{db_path} já existe")
+    
+    # Esquema completo (todas as migrações) pelo próprio DatabaseManager
+    db_manager = DatabaseManager(db_path)
+    if not db_manager.initialize_database():
+        raise RuntimeError("Falha ao criar o esquema")
+    db_manager.close()
+    
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    timings = {}
+    
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    connection.execute("PRAGMA synchronous = OFF")
+    cursor = connection.cursor()
+    try:
+        cursor.execute("BEGIN")
+        
+        started = time.perf_counter()
+        _insert_batches(cursor, '''
+            INSERT INTO users (username, email, password_hash, full_name, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', _users(rng, users, now), users, "usuários")
+        _insert_batches(cursor, '''
+            INSERT INTO vocabulary (word, translation, source_language, target_language,
+                                    difficulty_level, category, example_sentence, example_translation)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', _vocabulary(rng, vocabulary), vocabulary, "vocabulário")
+        _insert_batches(cursor, '''
+            INSERT INTO user_activities (user_id, activity_type, language_code, score, max_score,
+                                         xp_earned, time_spent, correct_answers, total_questions,
+                                         difficulty_level, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', _activities(rng, activities, users, now, days), activities, "atividades")
+        _insert_batches(cursor, '''
+            INSERT INTO translation_history (user_id, source_text, translated_text, source_language,
+                                             target_language, translation_api, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', _translations(rng, translations, users, now, days), translations, "traduções")
+        timings['insert_s'] = round(time.perf_counter() - started, 2)
+        
+        started = time.perf_counter()
+        _derive_totals(cursor)
+        cursor.execute("COMMIT")
+        timings['derive_s'] = round(time.perf_counter() - started, 2)
+        
+        started = time.perf_counter()
+        cursor.execute("ANALYZE")
+        timings['analyze_s'] = round(time.perf_counter() - started, 2)
+    finally:
+        connection.close()
+    
+    return timings
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Gera um banco com dados sintéticos")
+    parser.add_argument('--db', default="synthetic.db", help="Arquivo do banco a criar")
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--vocabulary', type=int, default=20000)
+    parser.add_argument('--activities', type=int, default=1000000)
+    parser.add_argument('--translations', type=int, default=200000)
+    parser.add_argument('--days', type=int, default=365, help="Janela de tempo do histórico")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--force', action='store_true', help="Sobrescreve o banco existente")
+    args = parser.parse_args()
+    
+    if args.force:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+    
+    print(f"📦 Gerando {args.db}...")
+    timings = generate(args.db, args.users, args.vocabulary, args.activities,
+                       args.translations, args.days, args.seed)
+    size_mb = os.path.getsize(args.db) / 1024 / 1024
+    print(f"✅ Pronto ({size_mb:.1f} MB): {timings}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file